@@ -0,0 +1,39 @@
+"""
+Benchmark of building attachments, now that their url is only built when used.
+
+    PYTHONPATH=. python benchmarks/bench_attachments.py
+"""
+
+import timeit
+from typing import Any, Callable, List
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import Attachment
+from pronotepy.pronoteAPI import _Encryption
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    ratio = f"  ({baseline / best:5.1f}x)" if baseline else ""
+    print(f"{name:>30}: {best * 1000:8.2f} ms{ratio}")
+    return best
+
+
+def main() -> None:
+    client = MagicMock()
+    client.communication.root_site = "https://demo.index-education.net/pronote"
+    client.communication.encryption = _Encryption()
+    client.attributes = {"h": "123"}
+    jsons = [{"N": f"{i}#file", "L": f"document {i}.pdf", "G": 1} for i in range(5000)]
+
+    def build() -> List[Attachment]:
+        return [Attachment(client, j) for j in jsons]
+
+    print(f"{len(jsons)} file attachments, best of 5")
+    base = bench("build + every url", lambda: [a.url for a in build()])
+    bench("build only", build, base)
+    bench("build + generate_urls", lambda: Attachment.generate_urls(build()), base)
+
+
+if __name__ == "__main__":
+    main()
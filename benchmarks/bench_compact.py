@@ -0,0 +1,61 @@
+"""
+Memory benchmark of the compact mode of the clients.
+
+Builds clients from the FonctionParametres and ParametresUtilisateur responses
+(decoded for every client, as when they come from PRONOTE) with and without
+``compact``, and reports the memory held per client with tracemalloc.
+
+    PYTHONPATH=. python benchmarks/bench_compact.py
+"""
+
+import gc
+import json
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, List
+
+from pronotepy.clients import Client
+
+from fixtures import fonction_parametres, parametres_utilisateur
+
+CLIENTS = 200
+
+
+def build(compact: bool, func_options: str, parametres: str) -> Any:
+    """The state a client keeps of the two responses after logging in"""
+    client: Any = Client.__new__(Client)
+    client.compact = compact
+    client.client_identifier = None
+    client.communication = SimpleNamespace(authorized_onglets=[])
+    client.func_options = json.loads(func_options)
+    client._read_func_options()
+    client._read_parametres(json.loads(parametres))
+    return client
+
+
+def held_per_client(compact: bool) -> int:
+    func_options = json.dumps(fonction_parametres())
+    parametres = json.dumps(parametres_utilisateur())
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    clients: List[Any] = [
+        build(compact, func_options, parametres) for _ in range(CLIENTS)
+    ]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del clients
+    return (after - before) // CLIENTS
+
+
+def main() -> None:
+    print(f"memory held per client ({CLIENTS} clients)")
+    full = held_per_client(compact=False)
+    print(f"{'full':>10}: {full / 1024:8.1f} KiB")
+    compact = held_per_client(compact=True)
+    print(f"{'compact':>10}: {compact / 1024:8.1f} KiB  ({full / compact:.1f}x less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Microbenchmark of PRONOTE date decoding.
+
+Compares the previous regex + strptime implementation of ``Util.datetime_parse``
+with the current one, on a column of dates shaped like a year of lessons.
+
+    PYTHONPATH=. python benchmarks/bench_date_parse.py
+"""
+
+import datetime
+import random
+import re
+import timeit
+from typing import Callable
+
+from pronotepy import Util
+from pronotepy.dataClasses import _decode_fixed_datetime
+
+
+def legacy_datetime_parse(formatted_date: str) -> datetime.datetime:
+    if re.match(r"\d{2}/\d{2}/\d{4}$", formatted_date):
+        return datetime.datetime.strptime(formatted_date, "%d/%m/%Y")
+    elif re.match(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$", formatted_date):
+        return datetime.datetime.strptime(formatted_date, "%d/%m/%Y %H:%M:%S")
+    elif re.match(r"\d{2}/\d{2}/\d{2} \d{2}h\d{2}$", formatted_date):
+        return datetime.datetime.strptime(formatted_date, "%d/%m/%y %Hh%M")
+    raise ValueError(formatted_date)
+
+
+def lesson_dates() -> list:
+    random.seed(0)
+    start = datetime.datetime(2024, 9, 2)
+    dates = []
+    for day in range(180):
+        for hour in (8, 9, 10, 11, 13, 14, 15, 16):
+            d = start + datetime.timedelta(days=day, hours=hour)
+            dates.append(d.strftime("%d/%m/%Y %H:%M:%S"))
+    random.shuffle(dates)
+    return dates
+
+
+def main() -> None:
+    dates = lesson_dates()
+    assert [legacy_datetime_parse(d) for d in dates] == Util.datetime_parse_many(dates)
+
+    def cold(func: Callable[[], list]) -> Callable[[], list]:
+        def run() -> list:
+            _decode_fixed_datetime.cache_clear()
+            return func()
+
+        return run
+
+    runs = 5
+    results = {
+        "legacy": lambda: [legacy_datetime_parse(d) for d in dates],
+        "datetime_parse (cold)": cold(lambda: [Util.datetime_parse(d) for d in dates]),
+        "datetime_parse (warm)": lambda: [Util.datetime_parse(d) for d in dates],
+        "datetime_parse_many (cold)": cold(lambda: Util.datetime_parse_many(dates)),
+        "datetime_parse_many (warm)": lambda: Util.datetime_parse_many(dates),
+    }
+    print(f"{len(dates)} dates, best of {runs} runs")
+    baseline = None
+    for name, func in results.items():
+        best = min(timeit.repeat(func, number=1, repeat=runs))
+        baseline = baseline or best
+        print(f"{name:>28}: {best * 1000:8.2f} ms  ({baseline / best:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark of the compiled field decoders against Object._Resolver.
+
+Both sides decode the very same ``_fields`` declarations of Lesson, Grade and
+Message, so the difference is only the per-field generic dispatch of the resolver.
+
+    PYTHONPATH=. python benchmarks/bench_decoders.py
+"""
+
+import timeit
+import weakref
+from functools import partial
+from typing import Any, Callable, List, Type
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import (
+    Grade,
+    Lesson,
+    Message,
+    Object,
+    Period,
+    _Interner,
+    _TimeGrid,
+    _missing,
+)
+
+from fixtures import grade_json, lesson_json, liste_heures, message_json
+
+
+def resolver_decode(cls: Type[Object], client: Any, json_dict: dict) -> None:
+    """What every __init__ used to do: one resolver call per field"""
+    obj: Any = cls.__new__(cls)
+    obj._client = client
+    obj._resolver = Object._Resolver(json_dict)
+    for f in cls._fields:
+        kwargs: dict = {"strict": f.strict}
+        if f.default is not _missing:
+            kwargs["default"] = f.default
+        converter = partial(f.converter, obj) if f.bound else f.converter
+        setattr(obj, f.name, obj._resolver(converter, *f.path, **kwargs))
+    del obj._resolver
+
+
+def compiled_decode(cls: Type[Object], client: Any, json_dict: dict) -> None:
+    obj: Any = cls.__new__(cls)
+    obj._client = client
+    obj._decode(json_dict)
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    ratio = f"  ({baseline / best:4.1f}x)" if baseline else ""
+    print(f"{name:>30}: {best * 1000:8.2f} ms{ratio}")
+    return best
+
+
+def main() -> None:
+    client = MagicMock()
+    client._period_registry = weakref.WeakValueDictionary()
+    client._end_times = _TimeGrid(liste_heures())
+    client._interner = _Interner()
+    period = Period(
+        client,
+        {
+            "N": "1",
+            "L": "Trimestre 1",
+            "dateDebut": {"V": "02/09/2024"},
+            "dateFin": {"V": "30/11/2024"},
+        },
+    )
+
+    samples: List[tuple] = [
+        (Lesson, [lesson_json(i) for i in range(5000)]),
+        (Grade, [grade_json(i, period.id) for i in range(5000)]),
+        (Message, [message_json(i) for i in range(5000)]),
+    ]
+    for cls, jsons in samples:
+        print(f"{cls.__name__}: {len(jsons)} objects, best of 5")
+        base = bench(
+            "resolver", lambda: [resolver_decode(cls, client, j) for j in jsons]
+        )
+        bench(
+            "compiled", lambda: [compiled_decode(cls, client, j) for j in jsons], base
+        )
+        bench("full constructor", lambda: [cls(client, j) for j in jsons])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of the ENT form extraction against the BeautifulSoup trees it replaced.
+
+The pages are synthetic, shaped like the CAS login page and the SAML post page that
+every ENT login goes through.
+
+    PYTHONPATH=. python benchmarks/bench_ent_forms.py
+"""
+
+import timeit
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup
+
+from pronotepy.ent.forms import find_form, parse_forms
+
+from fixtures import cas_login_page, saml_post_page
+
+NUMBER = 50
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+    ratio = f"  ({baseline / best:4.1f}x)" if baseline else ""
+    print(f"{name:>20}: {best * 1000:8.3f} ms{ratio}")
+    return best
+
+
+def soup_cas(page: str) -> dict:
+    soup = BeautifulSoup(page, "html.parser")
+    form = soup.find("form", {"class": "cas__login-form"})
+    return {
+        i["name"]: i.get("value")
+        for i in form.find_all("input")  # type: ignore
+        if i.get("name") is not None
+    }
+
+
+def soup_saml(page: str) -> tuple:
+    soup = BeautifulSoup(page, "html.parser")
+    saml = soup.find("input", {"name": "SAMLResponse"})
+    relay_state = soup.find("input", {"name": "RelayState"})
+    return saml["value"], relay_state["value"], soup.find("form")["action"]  # type: ignore
+
+
+def scan_saml(page: str) -> tuple:
+    form, inputs = parse_forms(page, ("SAMLResponse", "RelayState"), {})
+    assert form is not None
+    return inputs["SAMLResponse"], inputs["RelayState"], form.action
+
+
+def main() -> None:
+    cas, saml = cas_login_page(), saml_post_page()
+    form = find_form(cas, {"class": "cas__login-form"})
+    assert form is not None and form.inputs == soup_cas(cas)
+    assert scan_saml(saml) == soup_saml(saml)
+
+    print(f"CAS login page ({len(cas) // 1024} KiB), best of 5")
+    base = bench("BeautifulSoup", lambda: soup_cas(cas))
+    bench("form scanner", lambda: find_form(cas, {"class": "cas__login-form"}), base)
+    print(f"SAML post page ({len(saml) // 1024} KiB), best of 5")
+    base = bench("BeautifulSoup", lambda: soup_saml(saml))
+    bench("form scanner", lambda: scan_saml(saml), base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of Client.fetch_messages against reading Discussion.messages one by one.
+
+The client answers ``ListeMessages`` locally after a fixed delay standing for the
+round trip to the PRONOTE server, so the difference is the number of requests.
+
+    PYTHONPATH=. python benchmarks/bench_fetch_messages.py
+"""
+
+import time
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+from pronotepy.clients import Client
+from pronotepy.dataClasses import Discussion, _Interner
+
+from fixtures import message_json
+
+DISCUSSIONS = 50
+MESSAGES = 5  # by discussion, one possession each
+ROUND_TRIP = 0.05
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.messages = [message_json(i) for i in range(DISCUSSIONS * MESSAGES)]
+        self.requests = 0
+        self._message_cache: dict = {}
+        self._interner = _Interner()
+
+    fetch_messages: Any = Client.fetch_messages
+
+    def post(self, function_name: str, onglet: int, data: Optional[dict] = None) -> Any:
+        assert data is not None
+        self.requests += 1
+        time.sleep(ROUND_TRIP)
+        possessions = {p["N"] for p in data["listePossessionsMessages"]}
+        messages = [
+            m for m in self.messages if m["possessionMessage"]["V"]["N"] in possessions
+        ]
+        return {"dataSec": {"data": {"listeMessages": {"V": messages}}}}
+
+
+def discussions(client: FakeClient) -> List[Discussion]:
+    return [
+        Discussion(
+            MagicMock(),
+            {
+                "N": f"{i}#discussion",
+                "objet": "Devoir",
+                "listePossessionsMessages": {"V": [{"N": f"{i}#possession"}]},
+                "messagePourParticipants": {"V": {"N": f"{i}#participants"}},
+                "nbNonLus": 0,
+            },
+            {},
+        )
+        for i in range(DISCUSSIONS)
+    ]
+
+
+def run(name: str, fetch: Any) -> float:
+    client = FakeClient()
+    inbox = discussions(client)
+    for d in inbox:
+        d._client = client  # type: ignore[assignment]
+    start = time.perf_counter()
+    messages = fetch(client, inbox)
+    elapsed = time.perf_counter() - start
+    assert sum(map(len, messages)) == DISCUSSIONS * MESSAGES
+    print(f"{name:>20}: {elapsed * 1000:8.1f} ms, {client.requests} requests")
+    return elapsed
+
+
+def main() -> None:
+    print(
+        f"{DISCUSSIONS} discussions of {MESSAGES} messages, "
+        f"{ROUND_TRIP * 1000:.0f} ms round trip"
+    )
+    base = run("one by one", lambda c, inbox: [d.messages for d in inbox])
+    best = run("fetch_messages", lambda c, inbox: c.fetch_messages(inbox))
+    print(f"{'speedup':>20}: {base / best:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
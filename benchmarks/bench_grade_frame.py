@@ -0,0 +1,122 @@
+"""
+Benchmark of GradeFrame against a plain Python computation of the same averages.
+
+The what-if part simulates 41 hypothetical grades (0 to 20 by 0.5) in a subject,
+the Python side recomputing all averages once per hypothetical grade.
+
+    PYTHONPATH=. python benchmarks/bench_grade_frame.py
+"""
+
+import timeit
+import weakref
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from pronotepy.dataClasses import Grade, Period, _Interner
+from pronotepy.frames import GradeFrame
+
+from fixtures import grade_json
+
+Row = Tuple[str, float, float, float, bool, bool, bool]
+
+
+def rows(grades: List[Grade]) -> List[Row]:
+    return [
+        (
+            g.subject.id,
+            g.grade_value,
+            g.out_of_value,
+            g.coefficient_value,
+            g.is_bonus,
+            g.is_optionnal,
+            g.is_out_of_20,
+        )
+        for g in grades
+    ]
+
+
+def python_averages(grades: List[Row]) -> Dict[str, float]:
+    points: Dict[str, float] = {}
+    weights: Dict[str, float] = {}
+    optional: Dict[str, List[Tuple[float, float]]] = {}
+    for subject, value, out_of, coefficient, bonus, opt, out_of_20 in grades:
+        points.setdefault(subject, 0.0)
+        weights.setdefault(subject, 0.0)
+        if value != value or not out_of or out_of != out_of:
+            continue
+        on_20 = value / out_of * 20
+        weight = coefficient if out_of_20 else coefficient * out_of / 20
+        if bonus:
+            points[subject] += weight * max(on_20 - 10, 0)
+        elif opt:
+            optional.setdefault(subject, []).append((on_20, weight))
+        else:
+            points[subject] += weight * on_20
+            weights[subject] += weight
+    averages = {}
+    for subject in points:
+        p, w = points[subject], weights[subject]
+        for on_20, weight in sorted(optional.get(subject, []), reverse=True):
+            if w and on_20 <= p / w:
+                break
+            p, w = p + weight * on_20, w + weight
+        averages[subject] = p / w if w else float("nan")
+    return averages
+
+
+def python_overall(grades: List[Row]) -> float:
+    averages = [a for a in python_averages(grades).values() if a == a]
+    return sum(averages) / len(averages)
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    ratio = f"  ({baseline / best:5.1f}x)" if baseline else ""
+    print(f"{name:>24}: {best * 1000:8.2f} ms{ratio}")
+    return best
+
+
+def main() -> None:
+    client = MagicMock()
+    client._period_registry = weakref.WeakValueDictionary()
+    client._interner = _Interner()
+    period = Period(
+        client,
+        {
+            "N": "1",
+            "L": "Trimestre 1",
+            "dateDebut": {"V": "02/09/2024"},
+            "dateFin": {"V": "30/11/2024"},
+        },
+    )
+    grades = [Grade(client, grade_json(i, period.id)) for i in range(3000)]
+    table = rows(grades)
+    frame = GradeFrame(grades)
+    subject = grades[0].subject.id
+    values = np.arange(0, 20.5, 0.5)
+
+    expected = python_averages(table)
+    for key, average in frame.subject_averages().items():
+        assert abs(expected[key] - average) < 1e-9
+    assert abs(python_overall(table) - frame.overall_average()) < 1e-9
+
+    def python_what_if() -> List[float]:
+        return [
+            python_overall(table + [(subject, v, 20.0, 1.0, False, False, False)])
+            for v in values
+        ]
+
+    assert np.allclose(python_what_if(), frame.what_if(subject, values)[1])
+
+    print(f"{len(grades)} grades, best of 5")
+    bench("GradeFrame(grades)", lambda: GradeFrame(grades))
+    base = bench("python overall", lambda: python_overall(table))
+    bench("frame overall", frame.overall_average, base)
+    base = bench("python what-if", python_what_if)
+    bench("frame what-if", lambda: frame.what_if(subject, values), base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Memory benchmark of the per-client interning of subjects and names.
+
+Decodes a year of lessons, once with the client's interner and once with a
+fresh interner per lesson (what every lesson used to do: its own Subject and
+strings), and reports the memory held by the lessons with tracemalloc.
+The payloads go through json so that equal strings are distinct objects, as
+they are when coming from PRONOTE.
+
+    PYTHONPATH=. python benchmarks/bench_interning.py
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Any, List
+
+from pronotepy.dataClasses import Lesson, _Interner, _TimeGrid
+
+from fixtures import lesson_json, liste_heures
+
+
+class _Client:
+    def __init__(self, shared: bool) -> None:
+        self._end_times = _TimeGrid(liste_heures())
+        self._shared = _Interner() if shared else None
+
+    @property
+    def _interner(self) -> _Interner:
+        return self._shared or _Interner()
+
+
+def held_by(client: Any, jsons: List[dict]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    lessons = [Lesson(client, j) for j in jsons]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lessons
+    return after - before
+
+
+def main() -> None:
+    # 36 weeks of 40 lessons
+    jsons = json.loads(json.dumps([lesson_json(i) for i in range(36 * 40)]))
+
+    print(f"{len(jsons)} lessons, memory held by the decoded lessons")
+    base = held_by(_Client(shared=False), jsons)
+    print(f"{'not interned':>15}: {base / 1024:8.1f} KiB")
+    interned = held_by(_Client(shared=True), jsons)
+    print(
+        f"{'interned':>15}: {interned / 1024:8.1f} KiB  ({base / interned:.2f}x less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark of eager and lazy decoding of a year of lessons.
+
+Listing is what ``Client.lessons`` does with the response, "start + canceled"
+is a caller only looking at those two attributes of every lesson.
+
+    PYTHONPATH=. python benchmarks/bench_lazy.py
+"""
+
+import timeit
+from typing import Any, Callable, List
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import Lesson, _Interner, _TimeGrid
+
+from fixtures import lesson_json, liste_heures
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    ratio = f"  ({baseline / best:4.1f}x)" if baseline else ""
+    print(f"{name:>30}: {best * 1000:8.2f} ms{ratio}")
+    return best
+
+
+def main() -> None:
+    client = MagicMock()
+    client._end_times = _TimeGrid(liste_heures())
+    client._interner = _Interner()
+    jsons = [lesson_json(i) for i in range(36 * 40)]
+
+    def listing(lazy: bool) -> Callable[[], List[Lesson]]:
+        return lambda: [Lesson(client, j, lazy) for j in jsons]
+
+    def start_and_canceled(lazy: bool) -> Callable[[], list]:
+        return lambda: [(l.start, l.canceled) for l in listing(lazy)()]
+
+    def everything(lazy: bool) -> Callable[[], list]:
+        return lambda: [l.to_dict() for l in listing(lazy)()]
+
+    print(f"{len(jsons)} lessons, best of 5")
+    for name, scenario in (
+        ("listing", listing),
+        ("start + canceled", start_and_canceled),
+        ("to_dict", everything),
+    ):
+        base = bench(f"{name} (eager)", scenario(False))
+        bench(f"{name} (lazy)", scenario(True), base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark of ShardedRunner with 1, 2 and 4 worker processes against one ClientPool.
+
+A local http.server stands in for PRONOTE: it serves the same timetable to every
+account, compressed and encrypted like PRONOTE responses, and the stand-in client
+decrypts, decompresses and decodes it into Lesson objects, so the work per account
+is the CPU-bound part of a real poll. The results come back as snapshots, loaded
+in the main process or kept as bytes (``raw``). The scaling depends on the number
+of cores of the machine.
+
+    PYTHONPATH=. python benchmarks/bench_sharding.py
+"""
+
+import json
+import os
+import zlib
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+
+import requests
+
+from pronotepy.dataClasses import Lesson, _Interner, _TimeGrid
+from pronotepy.pronoteAPI import _Encryption
+from pronotepy.pool import ClientPool
+from pronotepy.sharding import ShardedRunner
+
+from fixtures import lesson_json, liste_heures
+
+ACCOUNTS = 64
+LESSONS = 400  # by account and poll
+
+KEY = bytes(range(16))
+
+
+def payload() -> bytes:
+    """The timetable as PRONOTE sends it: deflated, AES encrypted, in hex"""
+    e = _Encryption()
+    e.aes_key = KEY
+    deflate = zlib.compressobj(6, wbits=-15)
+    data = json.dumps([lesson_json(i) for i in range(LESSONS)]).encode()
+    data = deflate.compress(data) + deflate.flush()
+    return json.dumps({"dataSec": e.aes_encrypt(data).hex()}).encode()
+
+
+PAYLOAD = payload()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StandInClient:
+    """Logs in nowhere, fetches and parses the timetable like Client.lessons"""
+
+    def __init__(self, pronote_url: str, username: str, password: str) -> None:
+        self.pronote_url = pronote_url
+        self.communication = type("Communication", (), {})()
+        self.communication.session = requests.Session()
+        self.communication.last_ping = time.time()
+        self._interner = _Interner()
+        self._end_times = _TimeGrid(liste_heures())
+        self._period_registry: Any = weakref.WeakValueDictionary()
+        self.encryption = _Encryption()
+        self.encryption.aes_key = KEY
+
+    def lessons(self) -> List[Lesson]:
+        response = self.communication.session.get(self.pronote_url)
+        data = self.encryption.aes_decrypt(bytes.fromhex(response.json()["dataSec"]))
+        lessons = json.loads(zlib.decompress(data, wbits=-15))
+        return [Lesson(self, j) for j in lessons]  # type: ignore[arg-type]
+
+
+def poll(client: StandInClient) -> List[Lesson]:
+    return client.lessons()
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/pronote/eleve.html"
+    accounts = [
+        {"pronote_url": url, "username": f"user{i}", "password": ""}
+        for i in range(ACCOUNTS)
+    ]
+
+    print(
+        f"{ACCOUNTS} accounts, {LESSONS} lessons each, {os.cpu_count()} CPUs, "
+        "second poll (clients already created)"
+    )
+    with ClientPool(StandInClient, max_per_host=ACCOUNTS) as pool:  # type: ignore
+        list(pool.map(poll, accounts))
+        start = time.perf_counter()
+        assert len(list(pool.map(poll, accounts))) == ACCOUNTS
+        base = time.perf_counter() - start
+    print(f"{'ClientPool':>22}: {base * 1000:8.1f} ms")
+
+    for processes in (1, 2, 4):
+        with ShardedRunner(
+            StandInClient, processes=processes, max_per_host=ACCOUNTS  # type: ignore
+        ) as runner:
+            list(runner.map(poll, accounts))
+            for raw in (False, True):
+                start = time.perf_counter()
+                assert len(list(runner.map(poll, accounts, raw=raw))) == ACCOUNTS
+                elapsed = time.perf_counter() - start
+                name = f"ShardedRunner({processes}{', raw' if raw else ''})"
+                print(f"{name:>22}: {elapsed * 1000:8.1f} ms  ({base / elapsed:4.1f}x)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Size and speed of snapshots of a year of lessons, compared with JSON of to_dicts.
+
+    PYTHONPATH=. python benchmarks/bench_snapshot.py
+"""
+
+import timeit
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+from pronotepy import snapshot
+from pronotepy.dataClasses import IndexedList, Lesson, Object, _Interner, _TimeGrid
+
+from fixtures import lesson_json, liste_heures
+
+
+def bench(name: str, func: Callable[[], Any]) -> None:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    print(f"{name:>20}: {best * 1000:8.2f} ms")
+
+
+def main() -> None:
+    client = MagicMock()
+    client._end_times = _TimeGrid(liste_heures())
+    client._interner = _Interner()
+    lessons = IndexedList(Lesson(client, lesson_json(i)) for i in range(36 * 40))
+
+    data = snapshot.dumps(lessons)
+    as_json = Object.to_json(lessons)
+    print(f"{len(lessons)} lessons, best of 5")
+    print(f"{'snapshot size':>20}: {len(data) / 1024:8.1f} KiB")
+    print(f"{'to_json size':>20}: {len(as_json) / 1024:8.1f} KiB")
+    bench("snapshot.dumps", lambda: snapshot.dumps(lessons))
+    bench("snapshot.loads", lambda: snapshot.loads(data, client))
+    bench("to_json", lambda: Object.to_json(lessons))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark of Object.to_dict with the per-class serialization plans.
+
+The legacy implementation below is the one that looked up the properties with
+dir() and isinstance() on every call.
+
+    PYTHONPATH=. python benchmarks/bench_to_dict.py
+"""
+
+import timeit
+import weakref
+from itertools import chain
+from typing import Any, Callable, Set
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import Grade, Lesson, Object, Period, _Interner, _TimeGrid
+
+from fixtures import grade_json, lesson_json, liste_heures
+
+
+def legacy_to_dict(
+    self: Any, exclude: Set[str] = set(), include_properties: bool = False
+) -> dict:
+    def serialize_slot(slot: Any) -> Any:
+        if isinstance(slot, Object):
+            return legacy_to_dict(slot, type(slot)._to_dict_exclude)
+        else:
+            return slot
+
+    to_iter = (
+        chain(
+            self.__slots__,
+            [
+                prop
+                for prop in dir(self.__class__)
+                if not prop.startswith("_")
+                and isinstance(getattr(self.__class__, prop), property)
+            ],
+        )
+        if include_properties
+        else self.__slots__
+    )
+    serialized = {}
+    for slot_name in to_iter:
+        if slot_name.startswith("_") or slot_name in exclude:
+            continue
+        slot = getattr(self, slot_name)
+        serialized[slot_name] = (
+            [serialize_slot(v) for v in slot]
+            if isinstance(slot, list)
+            else serialize_slot(slot)
+        )
+    return serialized
+
+
+def bench(name: str, func: Callable[[], Any], baseline: float = 0) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=5))
+    ratio = f"  ({baseline / best:4.1f}x)" if baseline else ""
+    print(f"{name:>30}: {best * 1000:8.2f} ms{ratio}")
+    return best
+
+
+def main() -> None:
+    client = MagicMock()
+    client._period_registry = weakref.WeakValueDictionary()
+    client._end_times = _TimeGrid(liste_heures())
+    client._interner = _Interner()
+    period = Period(
+        client,
+        {
+            "N": "1",
+            "L": "Trimestre 1",
+            "dateDebut": {"V": "02/09/2024"},
+            "dateFin": {"V": "30/11/2024"},
+        },
+    )
+    lessons = [Lesson(client, lesson_json(i)) for i in range(2000)]
+    grades = [Grade(client, grade_json(i, period.id)) for i in range(2000)]
+
+    for name, objects in (("Lesson", lessons), ("Grade", grades)):
+        exclude = type(objects[0])._to_dict_exclude
+        assert [legacy_to_dict(o, exclude) for o in objects] == Object.to_dicts(objects)
+        print(f"{name}: {len(objects)} objects, best of 5")
+        base = bench("legacy", lambda: [legacy_to_dict(o, exclude) for o in objects])
+        bench("to_dict", lambda: [o.to_dict() for o in objects], base)
+        bench("to_dicts", lambda: Object.to_dicts(objects), base)
+        base = bench(
+            "legacy (properties)",
+            lambda: [legacy_to_dict(o, exclude, True) for o in objects],
+        )
+        bench(
+            "to_dicts (properties)",
+            lambda: Object.to_dicts(objects, include_properties=True),
+            base,
+        )
+        bench("to_json", lambda: Object.to_json(objects))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Synthetic PRONOTE payloads shaped like the ones of the demo server, shared by the benchmarks.
+"""
+
+import datetime
+
+SUBJECTS = ["MATHEMATIQUES", "FRANCAIS", "ANGLAIS LV1", "HISTOIRE-GEOGRAPHIE", "SVT"]
+TEACHERS = ["M. PROFESSEUR A.", "Mme PROFESSEUR B.", "M. PROFESSEUR C."]
+ROOMS = ["101", "102", "203", "LABO 1", "GYMNASE"]
+GROUPS = ["[3A]", "[3A GR1]", "[3A GR2]"]
+
+START = datetime.datetime(2024, 9, 2, 8)
+
+
+def liste_heures() -> list:
+    """``ListeHeures`` / ``ListeHeuresFin`` of FonctionParametres, half hours from 8h00"""
+    return [{"G": i, "L": f"{8 + i // 2:02}h{30 * (i % 2):02}"} for i in range(20)]
+
+
+def lesson_json(i: int) -> dict:
+    """A lesson of the ``PageEmploiDuTemps`` ListeCours"""
+    start = START + datetime.timedelta(days=i // 8, hours=i % 8)
+    return {
+        "N": f"{i}#lesson",
+        "G": 0,
+        "P": i % 3,
+        "place": (i % 8) * 2,
+        "duree": 2,
+        "DateDuCours": {"_T": 7, "V": start.strftime("%d/%m/%Y %H:%M:%S")},
+        "CouleurFond": "#FFD5D5",
+        "estAnnule": i % 50 == 0,
+        "Statut": "Cours annulé" if i % 50 == 0 else None,
+        "dispenseEleve": False,
+        "cahierDeTextes": {"_T": 24, "V": {"N": f"{i}#cdt", "estDevoir": i % 7 == 0}},
+        "ListeContenus": {
+            "_T": 24,
+            "V": [
+                {
+                    "G": 16,
+                    "N": f"{i % len(SUBJECTS)}#subject",
+                    "L": SUBJECTS[i % len(SUBJECTS)],
+                },
+                {"G": 3, "N": f"{i % 3}#teacher", "L": TEACHERS[i % len(TEACHERS)]},
+                {"G": 17, "N": f"{i % 5}#room", "L": ROOMS[i % len(ROOMS)]},
+                {"G": 2, "N": f"{i % 3}#group", "L": GROUPS[i % len(GROUPS)]},
+            ],
+        },
+    }
+
+
+def grade_json(i: int, period_id: str) -> dict:
+    """A grade of the ``DernieresNotes`` listeDevoirs"""
+    date = START + datetime.timedelta(days=i % 90)
+    return {
+        "N": f"{i}#grade",
+        "note": {"_T": 10, "V": "|1" if i % 40 == 0 else f"{i % 21},5"},
+        "bareme": {"_T": 10, "V": "20"},
+        "baremeParDefaut": {"_T": 10, "V": "20"},
+        "date": {"_T": 7, "V": date.strftime("%d/%m/%Y")},
+        "service": {
+            "_T": 24,
+            "V": {
+                "N": f"{i % len(SUBJECTS)}#subject",
+                "L": SUBJECTS[i % len(SUBJECTS)],
+                "estServiceGroupe": False,
+            },
+        },
+        "periode": {"_T": 24, "V": {"N": period_id, "L": "Trimestre 1"}},
+        "moyenne": {"_T": 10, "V": "11,42"},
+        "noteMax": {"_T": 10, "V": "19"},
+        "noteMin": {"_T": 10, "V": "3,5"},
+        "coefficient": "1" if i % 4 else "2",
+        "commentaire": "Contrôle",
+        "estBonus": i % 30 == 0,
+        "estFacultatif": i % 25 == 0,
+        "estRamenerSur20": False,
+    }
+
+
+def message_json(i: int) -> dict:
+    """A message of the ``ListeMessages`` listeMessages"""
+    date = START + datetime.timedelta(hours=i)
+    return {
+        "N": f"{i}#message",
+        "possessionMessage": {"V": {"N": f"{i // 5}#possession"}},
+        "messageSource": {"V": {"N": f"{i - 1}#message"}},
+        "emetteur": i % 2 == 0,
+        "public_gauche": TEACHERS[i % len(TEACHERS)],
+        "lu": True,
+        "date": {"_T": 7, "V": date.strftime("%d/%m/%Y %H:%M:%S")},
+        "estHTML": i % 3 == 0,
+        "contenu": (
+            {"_T": 21, "V": "<p>Bonjour,</p><p>Le devoir est d&eacute;cal&eacute;.</p>"}
+            if i % 3 == 0
+            else "Bonjour, le devoir est décalé."
+        ),
+    }
+
+
+def cas_login_page() -> str:
+    """A CAS login page (``cas__login-form``) with the usual scripts, styles and footer"""
+    styles = "\n".join(
+        f".cas__block-{i} {{ margin: {i}px; padding: {i % 7}px; color: #{i:06x}; }}"
+        for i in range(300)
+    )
+    menu = "\n".join(
+        f'<li class="nav__item"><a href="/portail/page-{i}" title="Page {i}">Page {i}</a></li>'
+        for i in range(150)
+    )
+    news = "\n".join(
+        f'<article class="news"><h3>Actualité {i}</h3><p>Le collège informe les familles '
+        f"que la réunion n°{i} aura lieu le {i % 28 + 1:02}/10 à 18h.</p></article>"
+        for i in range(60)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8"><title>CAS - Central Authentication Service</title>
+<style>{styles}</style>
+<script>var config = {{"theme": "ent", "locale": "fr", "timeout": 3600}};</script>
+</head>
+<body>
+<header><nav><ul>{menu}</ul></nav></header>
+<main>
+<section class="cas__news">{news}</section>
+<form method="post" id="fm1" class="cas__login-form form" action="login?selection=ATS_parent_eleve">
+  <input type="text" id="username" name="username" value="" autocomplete="off">
+  <input type="password" id="password" name="password" value="">
+  <input type="hidden" name="execution" value="{"e1s1" * 400}">
+  <input type="hidden" name="_eventId" value="submit">
+  <input type="hidden" name="geolocation">
+  <input type="submit" class="btn" value="Se connecter">
+</form>
+</main>
+<footer>{menu}</footer>
+<script src="/cas/js/cas.js"></script>
+</body>
+</html>"""
+
+
+def saml_post_page() -> str:
+    """The page posting a ``SAMLResponse`` back to the service provider"""
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html>
+<head><meta http-equiv="Content-Type" content="text/html; charset=utf-8"/></head>
+<body onload="document.forms[0].submit()">
+<noscript><p><strong>Note:</strong> Since your browser does not support JavaScript,
+you must press the Continue button once to proceed.</p></noscript>
+<form action="https://ent.example.fr/Shibboleth.sso/SAML2/POST" method="post">
+<div>
+<input type="hidden" name="RelayState" value="ss&#x3a;mem&#x3a;{"a1b2" * 16}"/>
+<input type="hidden" name="SAMLResponse" value="{"PHNhbWxwOlJlc3BvbnNl" * 600}"/>
+</div>
+<noscript><div><input type="submit" value="Continue"/></div></noscript>
+</form>
+</body>
+</html>"""
+
+
+def fonction_parametres() -> dict:
+    """A FonctionParametres response with the settings of a school year"""
+    periods = [
+        {
+            "N": f"1#period{i}",
+            "L": name,
+            "G": 2,
+            "periodeNotation": i + 1,
+            "dateDebut": {"_T": 7, "V": "02/09/2024"},
+            "dateFin": {"_T": 7, "V": "20/12/2024"},
+        }
+        for i, name in enumerate(["Trimestre 1", "Trimestre 2", "Trimestre 3", "Année"])
+    ]
+    return {
+        "nom": "FonctionParametres",
+        "dataSec": {
+            "data": {
+                "identifiantNav": "c2VjcmV0LWlkZW50aWZpYW50LW5hdmlnYXRldXI=",
+                "Nom": "COLLEGE DE DEMONSTRATION",
+                "urlSiteIndexEducation": {
+                    "_T": 23,
+                    "V": "https://www.index-education.com/",
+                },
+                "General": {
+                    "versionPN": "2024.3.7",
+                    "millesime": "2024",
+                    "PremierLundi": {"_T": 7, "V": "02/09/2024"},
+                    "PremiereDate": {"_T": 7, "V": "02/09/2024"},
+                    "DerniereDate": {"_T": 7, "V": "04/07/2025"},
+                    "ListeHeures": {"_T": 24, "V": liste_heures()},
+                    "ListeHeuresFin": {"_T": 24, "V": liste_heures()},
+                    "ListePeriodes": periods,
+                    "listeJoursFeries": {
+                        "_T": 24,
+                        "V": [
+                            {
+                                "N": f"0#ferie{i}",
+                                "L": f"Jour férié {i}",
+                                "dateDebut": {"_T": 7, "V": f"{i % 28 + 1:02}/05/2025"},
+                                "dateFin": {"_T": 7, "V": f"{i % 28 + 1:02}/05/2025"},
+                            }
+                            for i in range(12)
+                        ],
+                    },
+                    "ListeNiveauxDAcquisitions": {
+                        "_T": 24,
+                        "V": [
+                            {
+                                "N": f"0#niveau{i}",
+                                "L": f"Niveau {i}",
+                                "G": i,
+                                "abreviation": f"N{i}",
+                                "couleur": f"#{i * 123456 % 0xFFFFFF:06x}",
+                                "positionJauge": i,
+                                "actifPour": {"_T": 26, "V": "[0..3]"},
+                                "listePositionnements": {
+                                    "_T": 24,
+                                    "V": [
+                                        {
+                                            "G": j,
+                                            "L": f"Positionnement {j}",
+                                            "abr": f"P{j}",
+                                        }
+                                        for j in range(4)
+                                    ],
+                                },
+                            }
+                            for i in range(12)
+                        ],
+                    },
+                    "listeAnnotationsAutorisees": {"_T": 26, "V": "[1..12]"},
+                    "couleurs": {f"couleur{i}": f"#{i * 4567:06x}" for i in range(60)},
+                    "messages": {
+                        f"message{i}": f"Texte d'aide numéro {i} affiché dans l'espace."
+                        for i in range(150)
+                    },
+                    "options": {f"avecOption{i}": i % 2 == 0 for i in range(250)},
+                },
+            }
+        },
+    }
+
+
+def parametres_utilisateur() -> dict:
+    """A ParametresUtilisateur response of a student, with the tree of the tabs"""
+    onglets = [
+        {
+            "G": 100 + i,
+            "Onglet": [{"G": 1000 + 10 * i + j} for j in range(6)],
+        }
+        for i in range(20)
+    ]
+    return {
+        "nom": "ParametresUtilisateur",
+        "dataSec": {
+            "data": {
+                "ressource": {
+                    "N": "3#eleve",
+                    "L": "PARENT Fille",
+                    "G": 4,
+                    "classeDEleve": {"N": "1#classe", "L": "3A"},
+                    "Etablissement": {"_T": 24, "V": {"N": "1#etab", "L": "COLLEGE"}},
+                    "avecPhoto": True,
+                    "listeOngletsPourPeriodes": {
+                        "_T": 24,
+                        "V": [
+                            {
+                                "G": 198,
+                                "listePeriodes": {"_T": 24, "V": []},
+                                "periodeParDefaut": {"_T": 24, "V": {"N": "1#period0"}},
+                            }
+                        ],
+                    },
+                },
+                "listeOnglets": onglets,
+                "listeInformationsEtablissements": {
+                    "_T": 24,
+                    "V": [
+                        {
+                            "N": f"1#info{i}",
+                            "L": f"Information {i}",
+                            "Coordonnees": {
+                                "Adresse1": f"{i} rue du Collège",
+                                "CodePostal": "75000",
+                                "LibellePostal": "PARIS",
+                                "Telephone": "0102030405",
+                            },
+                        }
+                        for i in range(5)
+                    ],
+                },
+                "autorisations": {f"autorisation{i}": i % 3 == 0 for i in range(300)},
+                "parametresUtilisateur": {
+                    f"parametre{i}": {"_T": 24, "V": {"valeur": i, "actif": True}}
+                    for i in range(100)
+                },
+                "listeClasses": {"_T": 24, "V": []},
+            }
+        },
+    }
@@ -1,5 +1,9 @@
 import datetime
 import logging
+import weakref
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
 from time import time
 from typing import (
     List,
@@ -10,6 +14,9 @@ from typing import (
     Type,
     TYPE_CHECKING,
     Tuple,
+    Dict,
+    Iterable,
+    Iterator,
 )
 
 from Crypto.Hash import SHA256
@@ -18,6 +25,7 @@ from urllib.parse import urlparse, urlunparse
 
 from . import dataClasses
 from .exceptions import *
+from .scheduler import login_scheduler
 from .pronoteAPI import (
     _Communication,
     _Encryption,
@@ -32,6 +40,9 @@ if TYPE_CHECKING:
     from requests.cookies import RequestsCookieJar
     from typing_extensions import Protocol
 
+    from .ent.cache import ENTCache
+    from .response_cache import ResponseCache
+
     class ENTFunction(Protocol):
         def __call__(self, u: str, p: str, **kwargs: str) -> RequestsCookieJar: ...
 
@@ -40,6 +51,30 @@ __all__ = ("ClientBase", "Client", "ParentClient", "VieScolaireClient")
 
 T = TypeVar("T", bound="ClientBase")
 
+# seconds without logins to a PRONOTE host after it suspended our IP address
+IP_SUSPENSION_DELAY = 300
+
+# requests only reading data, identical concurrent ones share one round trip
+COALESCED_FUNCTIONS = frozenset(
+    {
+        "DernieresEvaluations",
+        "DernieresNotes",
+        "FicheEleve",
+        "ListeMessagerie",
+        "ListeMessages",
+        "ListeRessources",
+        "ListeRessourcesPourCommunication",
+        "PageActualites",
+        "PageBulletins",
+        "PageCahierDeTexte",
+        "PageEmploiDuTemps",
+        "PageEquipePedagogique",
+        "PageInfosPerso",
+        "PageMenus",
+        "PagePresence",
+    }
+)
+
 
 class ClientBase:
     """Base for every PRONOTE client. Provides login.
@@ -64,6 +99,13 @@ class ClientBase:
             to remember a browser / client.
 
         device_name (Optional[str]): A name for registering this client as a device.
+        ent_cache (Optional[ENTCache]): Cache of the ENT cookies, reused instead of
+            logging in the ENT again while valid. See :mod:`pronotepy.ent.cache`.
+        compact (bool): Keep only what the client uses of the ``FonctionParametres``
+            and ``ParametresUtilisateur`` responses, ``func_options`` and
+            ``parametres_utilisateur`` are then empty.
+        response_cache (Optional[ResponseCache]): Cache of the responses of the read
+            requests, see :mod:`pronotepy.response_cache`.
 
     Attributes:
         start_day (datetime.datetime): The first day of the school year
@@ -75,6 +117,8 @@ class ClientBase:
         info (ClientInfo): Provides information about the current client. Name etc...
         last_connection (datetime.datetime)
         client_identifier (str): Identificator of this client provided by PRONOTE
+        response_cache (Optional[ResponseCache]): Cache of the responses of the read
+            requests
     """
 
     def __init__(
@@ -88,6 +132,9 @@ class ClientBase:
         account_pin: Optional[str] = None,
         client_identifier: Optional[str] = None,
         device_name: Optional[str] = None,
+        ent_cache: Optional["ENTCache"] = None,
+        compact: bool = False,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> None:
         log.info("INIT")
         # start communication session
@@ -97,11 +144,9 @@ class ClientBase:
             )
 
         self.ent = ent
+        self.ent_cache = ent_cache
         if ent:
             pronote_url = pronote_url.replace("login=true", "")
-            cookies = ent(username, password, pronote_url=pronote_url)
-        else:
-            cookies = None
 
         if mode != "normal" and not uuid:
             raise PronoteAPIError("UUID must not be empty")
@@ -111,21 +156,26 @@ class ClientBase:
         self.username = username
         self.password = password
         self.pronote_url = pronote_url
-        self.communication = _Communication(pronote_url, cookies)
 
         self.account_pin = account_pin
         self.client_identifier = client_identifier
         self.device_name = device_name
+        self.compact = compact
+        self.response_cache = response_cache
+        self.func_options: dict = {}
+
+        # the whole login waits for its turn, see pronotepy.scheduler
+        with self._login_slot():
+            self._connect()
+            self._read_func_options()
+            self._init_state()
+            self.logged_in = self._login()
+        self._expired = False
 
-        self.attributes, self.func_options = self.communication.initialise(
-            self.client_identifier
-        )
-
-        if not self.client_identifier:
-            self.client_identifier = self.func_options["dataSec"]["data"][
-                "identifiantNav"
-            ]
+        self.last_connection: Optional[datetime.datetime]
 
+    def _init_state(self) -> None:
+        """Sets up the state of the client, before logging in"""
         # set up encryption
         self.encryption = _Encryption()
         self.encryption.aes_iv = self.communication.encryption.aes_iv
@@ -137,20 +187,60 @@ class ClientBase:
         self.auth_cookie: dict = {}
         self.info: dataClasses.ClientInfo
 
-        self.start_day = datetime.datetime.strptime(
-            self.func_options["dataSec"]["data"]["General"]["PremierLundi"]["V"],
-            "%d/%m/%Y",
-        ).date()
         self.week = self.get_week(datetime.date.today())
+        # shared Subject instances and name strings of the decoded objects
+        self._interner = dataClasses._Interner()
+        # messages of the discussions, see Discussion.messages
+        self._message_cache: Dict[Optional[str], tuple] = {}
 
         self._refreshing = False
-
-        self.periods_: Optional[List[dataClasses.Period]]
+        # one thread refreshes the session, the others wait for it
+        self._refresh_lock = threading.RLock()
+        # requests waiting for their response, see post
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+        # every Period of this client by id, used to resolve Grade.period.
+        # Weak, so that periods dropped on refresh do not accumulate.
+        self._period_registry: (
+            "weakref.WeakValueDictionary[str, dataClasses.Period]"
+        ) = weakref.WeakValueDictionary()
+        self.periods_: Optional[dataClasses.IndexedList[dataClasses.Period]]
         self.periods_ = self.periods
-        self.logged_in = self._login()
-        self._expired = False
 
-        self.last_connection: Optional[datetime.datetime]
+    def _read_func_options(self) -> None:
+        """Extracts what the client uses of FonctionParametres"""
+        data = self.func_options["dataSec"]["data"]
+        general = data["General"]
+        if not self.client_identifier:
+            self.client_identifier = data["identifiantNav"]
+
+        self.start_day = datetime.datetime.strptime(
+            general["PremierLundi"]["V"], "%d/%m/%Y"
+        ).date()
+        self._last_day = datetime.datetime.strptime(
+            general["DerniereDate"]["V"], "%d/%m/%Y"
+        ).date()
+        self._pronote_version: str = general["versionPN"]
+        self._period_jsons: List[dict] = general["ListePeriodes"]
+        # lesson start and end times
+        self._start_times: dataClasses._TimeGrid = dataClasses._TimeGrid(
+            general["ListeHeures"]["V"]
+        )
+        self._end_times: dataClasses._TimeGrid = dataClasses._TimeGrid(
+            general["ListeHeuresFin"]["V"]
+        )
+
+        if self.compact:
+            self.func_options = {}
+
+    def _read_parametres(self, parametres: dict) -> None:
+        """Extracts what the client uses of ParametresUtilisateur"""
+        data = parametres["dataSec"]["data"]
+        self.info = dataClasses.ClientInfo(self, data["ressource"])
+        self.communication.authorized_onglets = _prepare_onglets(data["listeOnglets"])
+        if not self.compact:
+            self.parametres_utilisateur = parametres
 
     @classmethod
     def qrcode_login(
@@ -279,6 +369,71 @@ class ClientBase:
             device_name=device_name,
         )
 
+    def _init_account(self) -> None:
+        """Sets up what a client class derives from ParametresUtilisateur, after logging in"""
+
+    @property
+    def _user_resource(self) -> dict:
+        """The resource of the user the requests are about"""
+        return self.info.raw_resource
+
+    @contextmanager
+    def _login_slot(self) -> Iterator[None]:
+        """Turn of the login in the scheduler of the PRONOTE host"""
+        key = login_scheduler.pronote_key(self.pronote_url)
+        with login_scheduler.slot(key):
+            try:
+                yield
+            except PronoteAPIError as e:
+                if "IP address is suspended" in str(e):
+                    # let the suspension end instead of failing every waiting login
+                    login_scheduler.suspend(key, IP_SUSPENSION_DELAY)
+                raise
+
+    def _connect(self) -> None:
+        """Opens the communication with PRONOTE, logging in the ENT first if needed"""
+        cookies = None
+        if self.ent:
+            cache, key = self.ent_cache, ""
+            if cache is not None:
+                key = cache.key(self.ent, self.username)
+                cookies = cache.get(key)
+                if cookies is not None and self._initialise(cookies):
+                    log.debug("reused the cached ENT cookies")
+                    return
+                if cookies is not None:
+                    log.info("cached ENT cookies refused, logging in the ENT again")
+                    self.communication.session.close()
+                    cache.delete(key)
+
+            with login_scheduler.slot(login_scheduler.ent_key(self.ent)):
+                cookies = self.ent(
+                    self.username, self.password, pronote_url=self.pronote_url
+                )
+            if cache is not None:
+                cache.set(key, cookies)
+
+        self._initialise(cookies, strict=True)
+
+    def _initialise(
+        self, cookies: Optional["RequestsCookieJar"], strict: bool = False
+    ) -> bool:
+        """
+        Starts a new communication with PRONOTE. Unless ``strict``, returns False
+        instead of raising when the ENT cookies were not accepted.
+        """
+        self.communication = _Communication(self.pronote_url, cookies)
+        try:
+            self.attributes, self.func_options = self.communication.initialise(
+                self.client_identifier
+            )
+        except PronoteAPIError:
+            if strict:
+                raise
+            return False
+        # the ENT credentials are only given with a valid ENT session
+        return not self.ent or ("e" in self.attributes and "f" in self.attributes)
+
     def _login(self) -> bool:
         """Logs in the user.
 
@@ -389,13 +544,7 @@ class ClientBase:
                 ]
 
             # getting listeOnglets separately because of pronote API change
-            self.parametres_utilisateur = self.post("ParametresUtilisateur")
-            self.info = dataClasses.ClientInfo(
-                self, self.parametres_utilisateur["dataSec"]["data"]["ressource"]
-            )
-            self.communication.authorized_onglets = _prepare_onglets(
-                self.parametres_utilisateur["dataSec"]["data"]["listeOnglets"]
-            )
+            self._read_parametres(self.post("ParametresUtilisateur"))
             log.info("got onglets data.")
             return True
         else:
@@ -469,16 +618,17 @@ class ClientBase:
         return 1 + int((date - self.start_day).days / 7)
 
     @property
-    def periods(self) -> List[dataClasses.Period]:
+    def periods(self) -> dataClasses.IndexedList[dataClasses.Period]:
         """Get all of the periods of the year.
 
         Returns:
-            List[Period]: All the periods of the year
+            IndexedList[Period]: All the periods of the year
         """
         if hasattr(self, "periods_") and self.periods_:
             return self.periods_
-        json = self.func_options["dataSec"]["data"]["General"]["ListePeriodes"]
-        return [dataClasses.Period(self, j) for j in json]
+        return dataClasses.IndexedList(
+            dataClasses.Period(self, j) for j in self._period_jsons
+        )
 
     def keep_alive(self) -> _KeepAlive:
         """
@@ -492,26 +642,26 @@ class ClientBase:
         Now this is the true jank part of this program. It refreshes the connection if something went wrong.
         This is the classical procedure if something is broken.
         """
+        with self._refresh_lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
         logging.debug("Reinitialisation")
         self.communication.session.close()
 
-        if self.ent:
-            cookies = self.ent(
-                self.username, self.password, pronote_url=self.pronote_url
-            )
-        else:
-            cookies = None
-
-        self.communication = _Communication(self.pronote_url, cookies)
-        self.attributes, self.func_options = self.communication.initialise(
-            self.client_identifier
-        )
+        with self._login_slot():
+            self._connect()
+            self._read_func_options()
 
-        # set up encryption
+            # set up encryption
 
-        self.encryption = _Encryption()
-        self.encryption.aes_iv = self.communication.encryption.aes_iv
-        self._login()
+            self.encryption = _Encryption()
+            self.encryption.aes_iv = self.communication.encryption.aes_iv
+            self._interner.clear()
+            self._message_cache.clear()
+            if self.response_cache is not None:
+                self.response_cache.invalidate(self._account)
+            self._login()
         self.periods_ = None
         self.periods_ = self.periods
         self.week = self.get_week(datetime.date.today())
@@ -533,6 +683,12 @@ class ClientBase:
     ) -> dict:
         """Preforms a raw post to the PRONOTE server. Adds signature, then passes it to _Communication.post
 
+        A read request (see :data:`COALESCED_FUNCTIONS`) identical to one already
+        waiting for its response is not sent again: both calls get the same response
+        object, which must not be changed.
+        With a :attr:`response_cache`, a read request also gets the cached response of
+        the same request if any.
+
         Args:
             function_name (str)
             onglet (int)
@@ -542,12 +698,62 @@ class ClientBase:
         """
         post_data = {}
         if onglet:
-            post_data["Signature"] = {"onglet": onglet}
+            post_data["Signature"] = self._signature(onglet)
         if data:
             post_data["data"] = data
 
+        if function_name not in COALESCED_FUNCTIONS:
+            response = self._post(function_name, post_data)
+            if self.response_cache is not None:
+                self.response_cache.written(self._account, function_name)
+            return response
+
+        request = json.dumps(post_data, sort_keys=True)
+        cache = self.response_cache
+        if cache is not None:
+            cached = cache.get(self._account, function_name, request)
+            if cached is not None:
+                return cached
+        response = self._single_flight(function_name, post_data, request)
+        if cache is not None:
+            cache.set(self._account, function_name, request, response)
+        return response
+
+    def _single_flight(self, function_name: str, post_data: dict, request: str) -> dict:
+        """Sends a request, or waits for the response of the same request sent by another thread"""
+        key = (function_name, request)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            return future.result()
+
         try:
-            return self.communication.post(function_name, post_data)
+            response = self._post(function_name, post_data)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    @property
+    def _account(self) -> Tuple[str, str]:
+        return self.pronote_url, self.username
+
+    def _signature(self, onglet: int) -> dict:
+        return {"onglet": onglet}
+
+    def _post(self, function_name: str, post_data: dict) -> dict:
+        """Sends a request, refreshing the session once if it fails"""
+        communication = self.communication
+        try:
+            return communication.post(function_name, post_data)
         except PronoteAPIError as e:
             if isinstance(e, ExpiredObject):
                 raise e
@@ -556,13 +762,17 @@ class ClientBase:
                 f"Have you tried turning it off and on again? ERROR: {e.pronote_error_code} | {e.pronote_error_msg}"
             )
 
-            # prevent refresh recursion
-            if self._refreshing:
-                raise e
-            else:
-                self._refreshing = True
-                self.refresh()
-                self._refreshing = False
+            with self._refresh_lock:
+                # prevent refresh recursion
+                if self._refreshing:
+                    raise e
+                # another thread may have refreshed the session in the meantime
+                if self.communication is communication:
+                    self._refreshing = True
+                    try:
+                        self.refresh()
+                    finally:
+                        self._refreshing = False
 
             return self.communication.post(function_name, post_data)
 
@@ -613,18 +823,21 @@ class Client(ClientBase):
         self,
         date_from: Union[datetime.date, datetime.datetime],
         date_to: Optional[Union[datetime.date, datetime.datetime]] = None,
-    ) -> List[dataClasses.Lesson]:
+        lazy: bool = False,
+    ) -> dataClasses.IndexedList[dataClasses.Lesson]:
         """Gets all lessons in a given timespan.
 
         Args:
             date_from (Union[datetime.date, datetime.datetime]): first date
             date_to (Union[datetime.date, datetime.datetime]): second date,
                 if None, then to the end of day_from
+            lazy (bool): decode the attributes of the lessons only when they are
+                first accessed, parsing errors are then raised on that access
 
         Returns:
-            List[Lesson]: List of lessons
+            IndexedList[Lesson]: List of lessons
         """
-        user = self.parametres_utilisateur["dataSec"]["data"]["ressource"]
+        user = self._user_resource
         data = {
             "ressource": user,
             "avecAbsencesEleve": False,
@@ -658,10 +871,12 @@ class Client(ClientBase):
             response = self.post("PageEmploiDuTemps", 16, data)
             l_list = response["dataSec"]["data"]["ListeCours"]
             for lesson in l_list:
-                output.append(dataClasses.Lesson(self, lesson))
+                output.append(dataClasses.Lesson(self, lesson, lazy))
 
         # since we only have week precision, we need to make it more precise on our own
-        return [lesson for lesson in output if date_from <= lesson.start <= date_to]
+        return dataClasses.IndexedList(
+            lesson for lesson in output if date_from <= lesson.start <= date_to
+        )
 
     def export_ical(self) -> str:
         """Constructs the client's ICal URL"""
@@ -678,26 +893,28 @@ class Client(ClientBase):
                 ("dataSec", "data", "iCal", "liste", "V"),
             ) from e
 
-        ver = self.func_options["dataSec"]["data"]["General"]["versionPN"]
+        ver = self._pronote_version
 
         return f"{self.communication.root_site}/ical/mesinformations.ics?icalsecurise={ical}&version={ver}&param={suppl}"
 
     def homework(
-        self, date_from: datetime.date, date_to: Optional[datetime.date] = None
-    ) -> List[dataClasses.Homework]:
+        self,
+        date_from: datetime.date,
+        date_to: Optional[datetime.date] = None,
+        lazy: bool = False,
+    ) -> dataClasses.IndexedList[dataClasses.Homework]:
         """Get homework between two given points.
 
         Args:
             date_from (datetime): The first date
             date_to (datetime): The second date. If unspecified to the end of the year.
+            lazy (bool): decode the attributes of the homework only when they are
+                first accessed, parsing errors are then raised on that access
         Returns:
-            List[Homework]: Homework between two given points
+            IndexedList[Homework]: Homework between two given points
         """
         if not date_to:
-            date_to = datetime.datetime.strptime(
-                self.func_options["dataSec"]["data"]["General"]["DerniereDate"]["V"],
-                "%d/%m/%Y",
-            ).date()
+            date_to = self._last_day
         json_data = {
             "domaine": {
                 "_T": 8,
@@ -707,13 +924,30 @@ class Client(ClientBase):
 
         response = self.post("PageCahierDeTexte", 88, json_data)
         h_list = response["dataSec"]["data"]["ListeTravauxAFaire"]["V"]
-        out = []
+        out: dataClasses.IndexedList[dataClasses.Homework] = dataClasses.IndexedList()
         for h in h_list:
-            hw = dataClasses.Homework(self, h)
+            hw = dataClasses.Homework(self, h, lazy)
             if date_from <= hw.date <= date_to:
                 out.append(hw)
         return out
 
+    def set_homework_done(
+        self, homeworks: Iterable[dataClasses.Homework], status: bool
+    ) -> None:
+        """Sets the status of many homework in one request.
+
+        Args:
+            homeworks (Iterable[Homework]): The homework to change
+            status (bool): The status to which to change
+        """
+        homeworks = list(homeworks)
+        if not homeworks:
+            return
+        data = {"listeTAF": [{"N": hw.id, "TAFFait": status} for hw in homeworks]}
+        self.post("SaisieTAFFaitEleve", 88, data)
+        for hw in homeworks:
+            hw.done = status
+
     def generate_timetable_pdf(
         self,
         day: Optional[datetime.date] = None,
@@ -736,7 +970,7 @@ class Client(ClientBase):
         """
         user = {
             "G": 4,
-            "N": self.parametres_utilisateur["dataSec"]["data"]["ressource"]["N"],
+            "N": self._user_resource["N"],
         }
 
         data = {
@@ -769,11 +1003,11 @@ class Client(ClientBase):
             self.communication.root_site + "/" + response["dataSec"]["data"]["url"]["V"]
         )
 
-    def get_recipients(self) -> List[dataClasses.Recipient]:
+    def get_recipients(self) -> dataClasses.IndexedList[dataClasses.Recipient]:
         """Get recipients for new discussion
 
         Returns:
-            List[Recipient]: list of available recipients
+            IndexedList[Recipient]: list of available recipients
         """
         # add teacher
         data = {"onglet": {"N": 0, "G": 3}}
@@ -786,20 +1020,22 @@ class Client(ClientBase):
             "dataSec"
         ]["data"]["listeRessourcesPourCommunication"]["V"]
 
-        return [dataClasses.Recipient(self, r) for r in recipients]
+        return dataClasses.IndexedList(
+            dataClasses.Recipient(self, r) for r in recipients
+        )
 
-    def get_teaching_staff(self) -> List[dataClasses.TeachingStaff]:
+    def get_teaching_staff(self) -> dataClasses.IndexedList[dataClasses.TeachingStaff]:
         """Get the teacher list
 
         Returns:
-            List[TeachingStaff]: list of teachers and other staff
+            IndexedList[TeachingStaff]: list of teachers and other staff
         """
         # add teacher
         teachers = self.post("PageEquipePedagogique", 37)["dataSec"]["data"]["liste"][
             "V"
         ]
 
-        return [dataClasses.TeachingStaff(t) for t in teachers]
+        return dataClasses.IndexedList(dataClasses.TeachingStaff(t) for t in teachers)
 
     # TODO: change to "subject"
     def new_discussion(
@@ -821,7 +1057,9 @@ class Client(ClientBase):
 
         self.post("SaisieMessage", 131, data)
 
-    def discussions(self, only_unread: bool = False) -> List[dataClasses.Discussion]:
+    def discussions(
+        self, only_unread: bool = False
+    ) -> dataClasses.IndexedList[dataClasses.Discussion]:
         """Gets all the discussions in the discussions tab"""
         discussions = self.post(
             "ListeMessagerie", 131, {"avecMessage": True, "avecLu": not only_unread}
@@ -832,18 +1070,76 @@ class Client(ClientBase):
             for l in discussions["dataSec"]["data"]["listeEtiquettes"]["V"]
         }
 
-        return [
+        return dataClasses.IndexedList(
             dataClasses.Discussion(self, d, labels)
             for d in discussions["dataSec"]["data"]["listeMessagerie"]["V"]
             if d.get("estUneDiscussion") and d.get("profondeur", 1) == 0
-        ]
+        )
+
+    def fetch_messages(
+        self,
+        discussions: Iterable[dataClasses.Discussion],
+        chunk_size: Optional[int] = None,
+    ) -> List[List[dataClasses.Message]]:
+        """Gets the messages of many discussions at once
+
+        Instead of one request per discussion (like :attr:`.Discussion.messages`), the
+        possessions of all the discussions are requested together and the messages are
+        given back to their discussion. Discussions whose messages are already cached
+        are not requested again.
+
+        Args:
+            discussions (Iterable[Discussion]): discussions from :meth:`discussions`
+            chunk_size (Optional[int]): maximum number of discussions in one request,
+                all of them by default
+        Returns:
+            List[List[Message]]: the messages of every discussion, in the order of
+                ``discussions``
+        """
+        discussions = list(discussions)
+        stale: Dict[Optional[str], dataClasses.Discussion] = {}
+        for d in discussions:
+            if not d._messages_cached():
+                stale.setdefault(d._cache_key, d)
+        to_fetch = list(stale.values())
+
+        step = chunk_size or len(to_fetch) or 1
+        for i in range(0, len(to_fetch), step):
+            chunk = to_fetch[i : i + step]
+            response = self.post(
+                "ListeMessages",
+                131,
+                {
+                    "listePossessionsMessages": [
+                        p for d in chunk for p in d._possessions
+                    ]
+                },
+            )
+            by_possession: Dict[str, List[dict]] = {}
+            for m in response["dataSec"]["data"]["listeMessages"]["V"]:
+                by_possession.setdefault(m["possessionMessage"]["V"]["N"], []).append(m)
+            for d in chunk:
+                # the reply data of a grouped response is not the discussion's own,
+                # replying fetches the messages again
+                d._cache_messages(
+                    dataClasses._parse_messages(
+                        self,
+                        [
+                            m
+                            for p in d._possessions
+                            for m in by_possession.get(p["N"], [])
+                        ],
+                    )
+                )
+
+        return [d.messages for d in discussions]
 
     def information_and_surveys(
         self,
         date_from: Optional[datetime.datetime] = None,
         date_to: Optional[datetime.datetime] = None,
         only_unread: bool = False,
-    ) -> List[dataClasses.Information]:
+    ) -> dataClasses.IndexedList[dataClasses.Information]:
         """Gets all the information and surveys in the information and surveys tab.
 
         Args:
@@ -880,18 +1176,18 @@ class Client(ClientBase):
                 )
             )
 
-        return info
+        return dataClasses.IndexedList(info)
 
     def menus(
         self, date_from: datetime.date, date_to: Optional[datetime.date] = None
-    ) -> List[dataClasses.Menu]:
+    ) -> dataClasses.IndexedList[dataClasses.Menu]:
         """Get menus between two given points.
 
         Args:
             date_from (datetime): The first date
             date_to (datetime): The second date. If unspecified to the end of the year.
         Returns:
-            List[Menu]: Menu between two given points
+            IndexedList[Menu]: Menu between two given points
         """
         output = []
 
@@ -912,21 +1208,24 @@ class Client(ClientBase):
             first_day += datetime.timedelta(days=7)
 
         # since we only have week precision, we need to make it more precise on our own
-        return [menu for menu in output if date_from <= menu.date <= date_to]
+        return dataClasses.IndexedList(
+            menu for menu in output if date_from <= menu.date <= date_to
+        )
 
     @property
     def current_period(self) -> dataClasses.Period:
         """the current period"""
-        onglets = self.parametres_utilisateur["dataSec"]["data"]["ressource"][
-            "listeOngletsPourPeriodes"
-        ]["V"]
+        onglets = self._user_resource["listeOngletsPourPeriodes"]["V"]
 
         # get onglet with number 198 (mes notes), otherwise fallback to the
         # first one in the list
         onglet = next(filter(lambda x: x.get("G") == 198, onglets), onglets[0])
 
         id_period = onglet["periodeParDefaut"]["V"]["N"]
-        return dataClasses.Util.get(self.periods, id=id_period)[0]
+        period = self.periods.get(id_period)
+        if period is None:
+            raise DataError(f"Could not find the current period ({id_period})")
+        return period
 
 
 class ParentClient(Client):
@@ -953,9 +1252,16 @@ class ParentClient(Client):
             to remember a browser / client.
 
         device_name (Optional[str]): A name for registering this client as a device.
+        ent_cache (Optional[ENTCache]): Cache of the ENT cookies, reused instead of
+            logging in the ENT again while valid. See :mod:`pronotepy.ent.cache`.
+        compact (bool): Keep only what the client uses of the ``FonctionParametres``
+            and ``ParametresUtilisateur`` responses, ``func_options`` and
+            ``parametres_utilisateur`` are then empty.
+        response_cache (Optional[ResponseCache]): Cache of the responses of the read
+            requests, see :mod:`pronotepy.response_cache`.
 
     Attributes:
-        children (List[ClientInfo]): List of sub-clients representing all the
+        children (IndexedList[ClientInfo]): List of sub-clients representing all the
             children connected to the main parent account.
     """
 
@@ -970,6 +1276,9 @@ class ParentClient(Client):
         account_pin: Optional[str] = None,
         client_identifier: Optional[str] = None,
         device_name: Optional[str] = None,
+        ent_cache: Optional["ENTCache"] = None,
+        compact: bool = False,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> None:
         super().__init__(
             pronote_url,
@@ -981,21 +1290,33 @@ class ParentClient(Client):
             account_pin,
             client_identifier,
             device_name,
+            ent_cache,
+            compact,
+            response_cache,
         )
 
-        self.children: List[dataClasses.ClientInfo] = []
-        for c in self.parametres_utilisateur["dataSec"]["data"]["ressource"][
-            "listeRessources"
-        ]:
-            self.children.append(dataClasses.ClientInfo(self, c))
+        self._init_account()
+
+    def _init_account(self) -> None:
+        self.children: dataClasses.IndexedList[dataClasses.ClientInfo] = (
+            dataClasses.IndexedList(
+                dataClasses.ClientInfo(self, c)
+                for c in self.info.raw_resource["listeRessources"]
+            )
+        )
 
         if not self.children:
             raise ChildNotFound("No children were found.")
 
         self._selected_child: dataClasses.ClientInfo = self.children[0]
-        self.parametres_utilisateur["dataSec"]["data"][
-            "ressource"
-        ] = self._selected_child.raw_resource
+        if not self.compact:
+            self.parametres_utilisateur["dataSec"]["data"][
+                "ressource"
+            ] = self._selected_child.raw_resource
+
+    @property
+    def _user_resource(self) -> dict:
+        return self._selected_child.raw_resource
 
     def set_child(self, child: Union[str, dataClasses.ClientInfo]) -> None:
         """Select a child
@@ -1004,7 +1325,7 @@ class ParentClient(Client):
             child (Union[str, ClientInfo]): Name or ClientInfo of a child.
         """
         if not isinstance(child, dataClasses.ClientInfo):
-            candidates = dataClasses.Util.get(self.children, name=child)
+            candidates = self.children.filter(name=child)
             c = candidates[0] if candidates else None
         else:
             c = child
@@ -1013,48 +1334,13 @@ class ParentClient(Client):
             raise ChildNotFound(f"A child with the name {child} was not found.")
 
         self._selected_child = c
-        self.parametres_utilisateur["dataSec"]["data"][
-            "ressource"
-        ] = self._selected_child.raw_resource
+        if not self.compact:
+            self.parametres_utilisateur["dataSec"]["data"][
+                "ressource"
+            ] = self._selected_child.raw_resource
 
-    def post(
-        self,
-        function_name: str,
-        onglet: Optional[int] = None,
-        data: Optional[dict] = None,
-    ) -> dict:
-        """Preforms a raw post to the PRONOTE server.
-
-        Adds signature, then passes it to _Communication.post
-
-        Args:
-            function_name (str)
-            onglet (int)
-            data (dict)
-        Returns:
-            Raw JSON
-        """
-        post_data = {}
-        if onglet:
-            post_data["Signature"] = {
-                "onglet": onglet,
-                "membre": {"N": self._selected_child.id, "G": 4},
-            }
-
-        if data:
-            post_data["data"] = data
-
-        try:
-            return self.communication.post(function_name, post_data)
-        except PronoteAPIError as e:
-            if isinstance(e, ExpiredObject):
-                raise e
-
-            log.info(
-                f"Have you tried turning it off and on again? ERROR: {e.pronote_error_code} | {e.pronote_error_msg}"
-            )
-            self.refresh()
-            return self.communication.post(function_name, post_data)
+    def _signature(self, onglet: int) -> dict:
+        return {"onglet": onglet, "membre": {"N": self._selected_child.id, "G": 4}}
 
 
 class VieScolaireClient(ClientBase):
@@ -1080,9 +1366,16 @@ class VieScolaireClient(ClientBase):
             to remember a browser / client.
 
         device_name (Optional[str]): A name for registering this client as a device.
+        ent_cache (Optional[ENTCache]): Cache of the ENT cookies, reused instead of
+            logging in the ENT again while valid. See :mod:`pronotepy.ent.cache`.
+        compact (bool): Keep only what the client uses of the ``FonctionParametres``
+            and ``ParametresUtilisateur`` responses, ``func_options`` and
+            ``parametres_utilisateur`` are then empty.
+        response_cache (Optional[ResponseCache]): Cache of the responses of the read
+            requests, see :mod:`pronotepy.response_cache`.
 
     Attributes:
-        classes (List[StudentClass]): List of all classes this account has access to.
+        classes (IndexedList[StudentClass]): List of all classes this account has access to.
     """
 
     def __init__(
@@ -1096,6 +1389,9 @@ class VieScolaireClient(ClientBase):
         account_pin: Optional[str] = None,
         client_identifier: Optional[str] = None,
         device_name: Optional[str] = None,
+        ent_cache: Optional["ENTCache"] = None,
+        compact: bool = False,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> None:
         super().__init__(
             pronote_url,
@@ -1107,10 +1403,19 @@ class VieScolaireClient(ClientBase):
             account_pin,
             client_identifier,
             device_name,
+            ent_cache,
+            compact,
+            response_cache,
         )
-        self.classes = [
-            dataClasses.StudentClass(self, json)
-            for json in self.parametres_utilisateur["dataSec"]["data"]["listeClasses"][
-                "V"
-            ]
+        self._init_account()
+
+    def _read_parametres(self, parametres: dict) -> None:
+        super()._read_parametres(parametres)
+        self._class_jsons: List[dict] = parametres["dataSec"]["data"]["listeClasses"][
+            "V"
         ]
+
+    def _init_account(self) -> None:
+        self.classes = dataClasses.IndexedList(
+            dataClasses.StudentClass(self, json) for json in self._class_jsons
+        )
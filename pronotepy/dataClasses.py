@@ -3,7 +3,9 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import math
 import re
+from functools import lru_cache
 from html import unescape
 from typing import (
     Union,
@@ -13,12 +15,15 @@ from typing import (
     TypeVar,
     Optional,
     Tuple,
+    Dict,
     Set,
+    FrozenSet,
+    Type,
     Iterable,
     TYPE_CHECKING,
 )
 from urllib.parse import quote
-from autoslot import Slots  # type: ignore
+from autoslot import Slots, SlotsMeta  # type: ignore
 
 from Crypto.Util import Padding
 
@@ -27,15 +32,15 @@ if TYPE_CHECKING:
 from .exceptions import (
     DataError,
     DiscussionClosed,
+    LazyParsingError,
     ParsingError,
     DateParsingError,
     UnsupportedOperation,
 )
 
-from itertools import chain
-
 __all__ = (
     "Util",
+    "IndexedList",
     "Object",
     "Subject",
     "Absence",
@@ -82,6 +87,67 @@ class MissingType:
     pass
 
 
+_DATE = re.compile(r"\d{2}/\d{2}/\d{4}$")
+_DATETIME = re.compile(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$")
+_DATE_SHORT_YEAR = re.compile(r"\d{2}/\d{2}/\d{2}$")
+_DATETIME_SHORT_YEAR = re.compile(r"\d{2}/\d{2}/\d{2} \d{2}h\d{2}$")
+_DAY_MONTH = re.compile(r"\d{2}/\d{2}")
+_HOUR_MINUTE = re.compile(r"\d{2}\d{2}$")
+
+
+@lru_cache(maxsize=4096)
+def _decode_fixed_datetime(formatted_date: str) -> Optional[datetime.datetime]:
+    """
+    Decodes the two layouts PRONOTE uses almost everywhere, ``dd/mm/yyyy`` and
+    ``dd/mm/yyyy HH:MM:SS``, by slicing. Returns None for any other layout.
+
+    The same timestamps come back over and over (lesson starts, period bounds),
+    so results are memoized. datetime objects are immutable, sharing them is safe.
+    """
+    length = len(formatted_date)
+    if length == 10:
+        digits = formatted_date[:2] + formatted_date[3:5] + formatted_date[6:]
+    elif length == 19:
+        if (
+            formatted_date[10] != " "
+            or formatted_date[13] != ":"
+            or formatted_date[16] != ":"
+        ):
+            return None
+        digits = (
+            formatted_date[:2]
+            + formatted_date[3:5]
+            + formatted_date[6:10]
+            + formatted_date[11:13]
+            + formatted_date[14:16]
+            + formatted_date[17:]
+        )
+    else:
+        return None
+    if (
+        formatted_date[2] != "/"
+        or formatted_date[5] != "/"
+        or not digits.isascii()
+        or not digits.isdigit()
+    ):
+        return None
+
+    if length == 10:
+        return datetime.datetime(int(digits[4:8]), int(digits[2:4]), int(digits[:2]))
+    return datetime.datetime(
+        int(digits[4:8]),
+        int(digits[2:4]),
+        int(digits[:2]),
+        int(digits[8:10]),
+        int(digits[10:12]),
+        int(digits[12:]),
+    )
+
+
+# special grades counting as a zero in averages
+_ZERO_GRADES = frozenset({"AbsentZero", "NonRenduZero"})
+
+
 class Util:
     """Utilities for the API wrapper"""
 
@@ -103,6 +169,8 @@ class Util:
         Args:
             iterable (list): The iterable to loop over
         """
+        if isinstance(iterable, IndexedList):
+            return iterable.filter(**kwargs)
         output = []
         for i in iterable:
             for attr in kwargs:
@@ -119,24 +187,42 @@ class Util:
         else:
             return string
 
+    @classmethod
+    def grade_value(cls, string: str) -> float:
+        """
+        Parses a grade (or a coefficient) as a number.
+        Special grades are 0 when they count as a zero (AbsentZero, NonRenduZero),
+        and NaN otherwise. Unreadable values are NaN too.
+        """
+        if "|" in string:
+            special = cls.grade_translate[int(string[1]) - 1]
+            return 0.0 if special in _ZERO_GRADES else math.nan
+        try:
+            return float(string.replace(",", "."))
+        except ValueError:
+            return math.nan
+
     @staticmethod
     def date_parse(formatted_date: str) -> datetime.date:
         """convert date to a datetime.date object"""
+        fast = _decode_fixed_datetime(formatted_date)
+        if fast is not None:
+            return fast.date()
 
-        if re.match(r"\d{2}/\d{2}/\d{4}$", formatted_date):
+        if _DATE.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%Y").date()
-        elif re.match(r"\d{2}/\d{2}/\d{2}$", formatted_date):
+        elif _DATE_SHORT_YEAR.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%y").date()
-        elif re.match(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$", formatted_date):
+        elif _DATETIME.match(formatted_date):
             return datetime.datetime.strptime(
                 formatted_date, "%d/%m/%Y %H:%M:%S"
             ).date()
-        elif re.match(r"\d{2}/\d{2}/\d{2} \d{2}h\d{2}$", formatted_date):
+        elif _DATETIME_SHORT_YEAR.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%y %Hh%M").date()
-        elif re.match(r"\d{2}/\d{2}", formatted_date):
+        elif _DAY_MONTH.match(formatted_date):
             formatted_date += f"/{datetime.date.today().year}"
             return datetime.datetime.strptime(formatted_date, "%d/%m/%Y").date()
-        elif re.match(r"\d{2}\d{2}$", formatted_date):
+        elif _HOUR_MINUTE.match(formatted_date):
             date = datetime.date.today()
             hours = int(formatted_date[:2])
             minutes = int(formatted_date[2:])
@@ -148,15 +234,43 @@ class Util:
     @staticmethod
     def datetime_parse(formatted_date: str) -> datetime.datetime:
         """convert date to a datetime.datetime object"""
-        if re.match(r"\d{2}/\d{2}/\d{4}$", formatted_date):
+        fast = _decode_fixed_datetime(formatted_date)
+        if fast is not None:
+            return fast
+
+        if _DATE.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%Y")
-        elif re.match(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$", formatted_date):
+        elif _DATETIME.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%Y %H:%M:%S")
-        elif re.match(r"\d{2}/\d{2}/\d{2} \d{2}h\d{2}$", formatted_date):
+        elif _DATETIME_SHORT_YEAR.match(formatted_date):
             return datetime.datetime.strptime(formatted_date, "%d/%m/%y %Hh%M")
         else:
             raise DateParsingError("Could not parse date", formatted_date)
 
+    @staticmethod
+    def date_parse_many(formatted_dates: Iterable[str]) -> List[datetime.date]:
+        """:meth:`date_parse` for a whole column of dates"""
+        decode = _decode_fixed_datetime
+        out = []
+        for formatted_date in formatted_dates:
+            fast = decode(formatted_date)
+            out.append(
+                fast.date() if fast is not None else Util.date_parse(formatted_date)
+            )
+        return out
+
+    @staticmethod
+    def datetime_parse_many(formatted_dates: Iterable[str]) -> List[datetime.datetime]:
+        """:meth:`datetime_parse` for a whole column of dates"""
+        decode = _decode_fixed_datetime
+        out = []
+        for formatted_date in formatted_dates:
+            fast = decode(formatted_date)
+            out.append(
+                fast if fast is not None else Util.datetime_parse(formatted_date)
+            )
+        return out
+
     @staticmethod
     def html_parse(html_text: str) -> str:
         """remove tags from html text"""
@@ -177,12 +291,383 @@ class Util:
         return start_time
 
 
-class Object(Slots):
+class _TimeGrid:
+    """
+    Times of the day indexed by PRONOTE "place", built once per client from
+    ``ListeHeures`` or ``ListeHeuresFin``. Lookups follow :meth:`Util.place2time`.
+    """
+
+    __slots__ = ("_times", "_count")
+
+    def __init__(self, liste_heures: List[dict]) -> None:
+        self._count = len(liste_heures)
+        times: List[Optional[datetime.time]] = [None] * (
+            max((h["G"] for h in liste_heures), default=-1) + 1
+        )
+        for h in liste_heures:
+            if times[h["G"]] is None:
+                times[h["G"]] = datetime.datetime.strptime(h["L"], "%Hh%M").time()
+        self._times = times
+
+    def __len__(self) -> int:
+        return self._count
+
+    def dump(self) -> dict:
+        """The grid as JSON data, see :meth:`load`"""
+        return {
+            "count": self._count,
+            "times": [t and t.strftime("%H:%M") for t in self._times],
+        }
+
+    @classmethod
+    def load(cls, data: dict) -> "_TimeGrid":
+        grid = cls.__new__(cls)
+        grid._count = data["count"]
+        grid._times = [
+            t and datetime.datetime.strptime(t, "%H:%M").time() for t in data["times"]
+        ]
+        return grid
+
+    def __getitem__(self, place: int) -> datetime.time:
+        if place > self._count:
+            # might be wrong... works with demo
+            place = place % (self._count - 1)
+        time = self._times[place] if 0 <= place < len(self._times) else None
+        if time is None:
+            raise ValueError(f"Could not find starting time for place {place}")
+        return time
+
+
+class IndexedList(List[T]):
+    """
+    A list of data objects with hash indexes for fast lookups.
+
+    Behaves exactly like a normal ``list`` (it is one). Indexes are built the
+    first time they are needed and are thrown away whenever the list is
+    modified, so lookups stay correct without any bookkeeping from the user.
+
+    .. code-block:: python
+
+        grades = period.grades
+        grade = grades.get("42#xyz")           # by id
+        maths = grades.by_subject(subject)     # all grades of a subject
+        today = client.lessons(day).by_date(day)
+    """
+
+    __slots__ = ("_indexes",)
+
+    def __init__(self, iterable: Iterable[T] = ()) -> None:
+        super().__init__(iterable)
+        self._indexes: dict = {}
+
+    def _invalidate(self) -> None:
+        self._indexes.clear()
+
+    def _index(self, name: str, key: Callable[[Any], Any]) -> dict:
+        index = self._indexes.get(name)
+        if index is None:
+            index = {}
+            for item in self:
+                try:
+                    index.setdefault(key(item), []).append(item)
+                except (AttributeError, TypeError):
+                    # missing attribute or unhashable value, not indexable
+                    continue
+            self._indexes[name] = index
+        return index
+
+    def get(self, id: str, default: Optional[T] = None) -> Optional[T]:  # type: ignore[override]
+        """Get an item by its ``id`` attribute.
+
+        Args:
+            id (str): id of the item
+            default: returned when no item has this id
+        """
+        found = self._index("id", lambda i: i.id).get(id)
+        return found[0] if found else default
+
+    def filter(self, **kwargs: Any) -> List[T]:
+        """Items which have all the given attributes equal to the given values.
+
+        Same semantics as :meth:`Util.get`, but uses an index for every attribute.
+        """
+        output: Optional[List[T]] = None
+        for attr, value in kwargs.items():
+            try:
+                found = self._index(
+                    "attr:" + attr, lambda i, a=attr: getattr(i, a)  # type: ignore[misc]
+                ).get(value, [])
+            except TypeError:
+                # unhashable value, fall back to a scan
+                found = [i for i in self if getattr(i, attr, MissingType) == value]
+            if output is None:
+                output = found
+            else:
+                ids = set(map(id, found))
+                output = [i for i in output if id(i) in ids]
+            if not output:
+                return []
+        return list(self) if output is None else list(output)
+
+    def by_subject(self, subject: Union["Subject", str]) -> List[T]:
+        """Items with the given subject (or subject id)."""
+        subject_id = subject if isinstance(subject, str) else subject.id
+        return list(self._index("subject", lambda i: i.subject.id).get(subject_id, []))
+
+    def by_period(self, period: Union["Period", str]) -> List[T]:
+        """Items from the given period (or period id)."""
+        period_id = period if isinstance(period, str) else period.id
+        return list(self._index("period", lambda i: i.period.id).get(period_id, []))
+
+    def by_date(self, date: datetime.date) -> List[T]:
+        """Items that happen on the given day.
+
+        Uses the ``date`` attribute of items, or ``start`` if there is no ``date``.
+        """
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+
+        def key(i: Any) -> datetime.date:
+            d = i.date if hasattr(i, "date") else i.start
+            return d.date() if isinstance(d, datetime.datetime) else d
+
+        return list(self._index("date", key).get(date, []))
+
+    # every mutating method drops the indexes
+
+    def __setitem__(self, *args: Any) -> None:
+        self._invalidate()
+        super().__setitem__(*args)
+
+    def __delitem__(self, *args: Any) -> None:
+        self._invalidate()
+        super().__delitem__(*args)
+
+    def __iadd__(self, other: Iterable[T]) -> "IndexedList[T]":  # type: ignore[override,misc]
+        self._invalidate()
+        return super().__iadd__(other)  # type: ignore[return-value]
+
+    def __imul__(self, n: int) -> "IndexedList[T]":  # type: ignore[override,misc]
+        self._invalidate()
+        return super().__imul__(n)  # type: ignore[return-value]
+
+    def append(self, item: T) -> None:
+        self._invalidate()
+        super().append(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        self._invalidate()
+        super().extend(items)
+
+    def insert(self, index: int, item: T) -> None:  # type: ignore[override]
+        self._invalidate()
+        super().insert(index, item)
+
+    def remove(self, item: T) -> None:
+        self._invalidate()
+        super().remove(item)
+
+    def pop(self, index: int = -1) -> T:  # type: ignore[override]
+        self._invalidate()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._invalidate()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._invalidate()
+        super().reverse()
+
+
+_missing = MissingType()
+
+
+class Field:
+    """
+    Declares how one attribute of a data class is decoded from its json dict.
+    Same semantics as :class:`Object._Resolver`.
+
+    Args:
+        name (str): name of the attribute
+        converter (Callable[[Any], Any]): the found value is passed to it
+        path (str): keys leading to the value, without any the whole dict is converted
+        default (Any): value used (without conversion) when the path does not exist,
+            lists, dicts and sets are copied for every object
+        strict (bool): if False, a missing path gives None instead of raising
+        bound (bool): if True, the converter is called with the decoded object first,
+            for values depending on the object's client
+    """
+
+    __slots__ = ("name", "converter", "path", "default", "strict", "bound")
+
+    def __init__(
+        self,
+        name: str,
+        converter: Callable[..., Any],
+        *path: str,
+        default: Any = _missing,
+        strict: bool = True,
+        bound: bool = False,
+    ) -> None:
+        if not name.isidentifier():
+            raise ValueError(f"invalid field name {name!r}")
+        self.name = name
+        self.converter = converter
+        self.path = path
+        self.default = default
+        self.strict = strict
+        self.bound = bound
+
+
+def _compile_decoder(qualname: str, fields: Tuple[Field, ...]) -> Callable:
+    """
+    Generates a function setting all ``fields`` on an object from a json dict.
+    The paths are unrolled into plain subscripts, so decoding does no generic
+    path walking or argument handling.
+    """
+    env: dict = {"ParsingError": ParsingError}
+    lines = ["def decode(self, d):"]
+    for i, field in enumerate(fields):
+        env[f"c{i}"], env[f"p{i}"], env[f"d{i}"] = (
+            field.converter,
+            field.path,
+            field.default,
+        )
+        lines += [
+            "    try:",
+            "        v = d" + "".join(f"[{key!r}]" for key in field.path),
+            "    except KeyError as e:",
+        ]
+        if isinstance(field.default, (list, dict, set)):
+            # every object gets its own list / dict
+            lines.append(f"        v = d{i}.copy()")
+        elif field.default is not _missing:
+            lines.append(f"        v = d{i}")
+        elif field.strict:
+            lines.append(
+                f"        raise ParsingError('Could not follow path', d, p{i}) from e"
+            )
+        else:
+            lines.append("        v = None")
+        if field.converter is not noop:
+            lines += [
+                "    else:",
+                "        try:",
+                (
+                    f"            v = c{i}(self, v)"
+                    if field.bound
+                    else f"            v = c{i}(v)"
+                ),
+                "        except Exception as e:",
+                f"            raise ParsingError(f'Error while converting value: {{e}}', d, p{i}) from e",
+            ]
+        lines.append(f"    self.{field.name} = v")
+    if not fields:
+        lines.append("    pass")
+
+    exec(compile("\n".join(lines), f"<decoder of {qualname}>", "exec"), env)
+    return env["decode"]
+
+
+def _compute_with(method: str) -> Callable[[Any, dict], None]:
+    """Lazy decoder calling ``method`` of the object, looked up at call time"""
+
+    def compute(self: Any, d: dict) -> None:
+        getattr(self, method)(d)
+
+    return compute
+
+
+class _ObjectMeta(SlotsMeta):
+    """Adds slots for declared fields and compiles their decoders, once per class"""
+
+    def __new__(mcs, name: str, bases: tuple, ns: dict) -> "_ObjectMeta":
+        fields = ns.get("_fields", ())
+        computed = ns.get("_computed", {})
+        if fields:
+            ns["__slots__"] = set(ns.get("__slots__", ())) | {f.name for f in fields}
+        cls = super().__new__(mcs, name, bases, ns)
+        if fields or computed:
+            qualname = ns.get("__qualname__", name)
+            cls._decoder = _compile_decoder(qualname, fields)  # type: ignore[attr-defined]
+
+            # used in lazy mode: one decoder per attribute, a computed attribute
+            # is derived after its field (if it is one) has been decoded
+            lazy: Dict[str, Tuple[Callable[[Any, dict], None], ...]] = {
+                f.name: (_compile_decoder(f"{qualname}.{f.name}", (f,)),)
+                for f in fields
+            }
+            for attribute, method in computed.items():
+                lazy[attribute] = lazy.get(attribute, ()) + (_compute_with(method),)
+            cls._lazy_decoders = lazy  # type: ignore[attr-defined]
+        return cls
+
+
+@lru_cache(maxsize=None)
+def _serialization_plan(cls: Type[Object], include_properties: bool) -> Tuple[str, ...]:
+    """Names serialized by ``to_dict`` for ``cls``, computed once per class"""
+    names = list(cls.__slots__)
+    if include_properties:
+        names += [
+            prop
+            for prop in dir(cls)
+            if not prop.startswith("_") and isinstance(getattr(cls, prop), property)
+        ]
+    return tuple(
+        name
+        for name in names
+        if not name.startswith("_") and name not in cls._to_dict_exclude
+    )
+
+
+def _serialize_child(value: Any) -> Any:
+    if isinstance(value, Object):
+        return value.to_dict()
+    elif isinstance(value, list):
+        return [v.to_dict() if isinstance(v, Object) else v for v in value]
+    else:
+        # Assume all other values are primitives
+        return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    elif isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class Object(Slots, metaclass=_ObjectMeta):
     """
     Base object for all pronotepy data classes.
+
+    Attributes can either be resolved one by one in ``__init__`` with ``self._resolver``,
+    or declared in a ``_fields`` tuple of :class:`Field` and decoded at once with
+    ``self._decode(json_dict)``.
+
+    Classes with ``_fields`` can also be built lazily with ``self._defer(json_dict)``:
+    the json dict is kept and each field is decoded on its first access. Attributes
+    that are derived in ``__init__`` instead of declared as fields are listed in
+    ``_computed``, mapping their name to the method (taking the json dict) that sets them.
     """
 
-    __slots__ = ("_resolver",)
+    # __weakref__ lets clients keep weak registries of their objects
+    __slots__ = ("_resolver", "_json", "__weakref__")
+    _fields: Tuple[Field, ...] = ()
+    _computed: Dict[str, str] = {}
+    # never serialized by to_dict
+    _to_dict_exclude: FrozenSet[str] = frozenset()
+    # bumped when the attributes of a class change meaning, see pronotepy.snapshot
+    _snapshot_version: int = 1
+    _lazy_decoders: Dict[str, Tuple[Callable[[Any, dict], None], ...]] = {}
 
     class _Resolver:
         """
@@ -254,6 +739,61 @@ class Object(Slots):
     def __init__(self, json_dict: dict) -> None:
         self._resolver: Object._Resolver = self._Resolver(json_dict)
 
+    def _decode(self, json_dict: dict) -> None:
+        """Sets all the attributes declared in ``_fields``"""
+        self._decoder(json_dict)  # type: ignore[attr-defined]
+
+    def rebind(self, client: ClientBase) -> None:
+        """
+        Binds this object to ``client``, used for objects loaded from a snapshot.
+        Methods and properties contacting PRONOTE then go through ``client``.
+
+        Args:
+            client (ClientBase): a logged in client of the account the object comes from
+        """
+        if hasattr(type(self), "_client"):
+            self._client = client  # type: ignore[misc]
+
+    def _defer(self, json_dict: dict) -> None:
+        """
+        Keeps ``json_dict`` to decode the fields and computed attributes on first
+        access, until they are all decoded. Their errors are raised as
+        :class:`LazyParsingError`.
+        """
+        self._json = json_dict
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when the slot is not set yet
+        decoders = self._lazy_decoders.get(name)
+        if decoders is not None:
+            try:
+                json_dict = object.__getattribute__(self, "_json")
+            except AttributeError:
+                pass
+            else:
+                try:
+                    for decoder in decoders:
+                        decoder(self, json_dict)
+                except ParsingError as e:
+                    raise LazyParsingError(str(e), e.json_dict, e.path) from e
+                except Exception as e:
+                    raise LazyParsingError(
+                        f"Error while decoding {name}: {e!r}", json_dict, ()
+                    ) from e
+                value = object.__getattribute__(self, name)
+                for attribute in self._lazy_decoders:
+                    try:
+                        object.__getattribute__(self, attribute)
+                    except AttributeError:
+                        break
+                else:
+                    # every attribute is decoded
+                    del self._json
+                return value
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
     def to_dict(
         self, exclude: Set[str] = set(), include_properties: bool = False
     ) -> dict:
@@ -275,43 +815,65 @@ class Object(Slots):
             dict: A dictionary containing all non-private properties
         """
 
-        def serialize_slot(slot: Any) -> Any:
-            if isinstance(slot, Object):
-                return slot.to_dict()
-            else:
-                # Assume all other values are primitives
-                return slot
-
-        serialized = {}
-
-        # Join __slots__ with a list of all properties if include_properties is True
-        # otherwise just iterate overs __slots__
-        to_iter = (
-            chain(
-                self.__slots__,
-                [
-                    prop
-                    for prop in dir(self.__class__)
-                    if not prop.startswith("_")
-                    and isinstance(getattr(self.__class__, prop), property)
-                ],
-            )
-            if include_properties
-            else self.__slots__
-        )
-        for slot_name in to_iter:  # type: ignore
-            if slot_name.startswith("_") or slot_name in exclude:
-                # Skip private and excluded slots
-                continue
+        plan = _serialization_plan(type(self), include_properties)
+        if exclude:
+            plan = tuple(name for name in plan if name not in exclude)
+        return {name: _serialize_child(getattr(self, name)) for name in plan}
 
-            slot = getattr(self, slot_name)
+    @staticmethod
+    def to_dicts(
+        objects: Iterable[Object],
+        exclude: Set[str] = set(),
+        include_properties: bool = False,
+    ) -> List[dict]:
+        """
+        Serializes many objects at once, same as calling :meth:`to_dict` on each of them
 
-            serialized[slot_name] = (
-                [serialize_slot(v) for v in slot]
-                if isinstance(slot, list)
-                else serialize_slot(slot)
-            )
-        return serialized
+        Args:
+            objects (Iterable[Object]): objects to serialize
+            exclude (Set[str]): items to exclude from serialization
+            include_properties (bool): whether to evaluate properties
+        Returns:
+            List[dict]: the dictionaries in the order of ``objects``
+        """
+        plans: Dict[Type[Object], Tuple[str, ...]] = {}
+        out = []
+        for obj in objects:
+            cls = type(obj)
+            plan = plans.get(cls)
+            if plan is None:
+                plan = _serialization_plan(cls, include_properties)
+                if exclude:
+                    plan = tuple(name for name in plan if name not in exclude)
+                plans[cls] = plan
+            out.append({name: _serialize_child(getattr(obj, name)) for name in plan})
+        return out
+
+    @staticmethod
+    def to_json(
+        objects: Union[Object, Iterable[Object]],
+        exclude: Set[str] = set(),
+        include_properties: bool = False,
+    ) -> bytes:
+        """
+        Serializes one or many objects to utf-8 encoded JSON.
+        Dates are written in ISO 8601 and durations in seconds.
+
+        Args:
+            objects (Union[Object, Iterable[Object]]): an object, or objects to serialize as an array
+            exclude (Set[str]): items to exclude from serialization
+            include_properties (bool): whether to evaluate properties
+        Returns:
+            bytes: the JSON document
+        """
+        data: Any = (
+            objects.to_dict(exclude, include_properties)
+            if isinstance(objects, Object)
+            else Object.to_dicts(objects, exclude, include_properties)
+        )
+        return json.dumps(
+            data, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
 
 
 class Subject(Object):
@@ -324,12 +886,57 @@ class Subject(Object):
         groups (bool): if the subject is in groups
     """
 
+    id: str
+    name: str
+    groups: bool
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("name", str, "L"),
+        Field("groups", bool, "estServiceGroupe", default=False),
+    )
+
     def __init__(self, parsed_json: dict) -> None:
-        super().__init__(parsed_json)
+        self._decode(parsed_json)
 
-        self.id: str = self._resolver(str, "N")
-        self.name: str = self._resolver(str, "L")
-        self.groups: bool = self._resolver(bool, "estServiceGroupe", default=False)
+
+class _Interner:
+    """
+    Per-client table of shared values. Thousands of lessons, grades and homework
+    refer to a handful of subjects, teachers, rooms and groups, so equal ones are
+    decoded once and the same instance is handed out.
+
+    .. note:: Interned subjects are shared, modifying one modifies it everywhere.
+    """
+
+    __slots__ = ("_subjects", "_strings")
+
+    def __init__(self) -> None:
+        self._subjects: Dict[Tuple[Any, Any, Any], Subject] = {}
+        self._strings: Dict[str, str] = {}
+
+    def subject(self, json_dict: dict) -> Subject:
+        key = (
+            json_dict.get("N"),
+            json_dict.get("L"),
+            json_dict.get("estServiceGroupe", False),
+        )
+        subject = self._subjects.get(key)
+        if subject is None:
+            subject = self._subjects[key] = Subject(json_dict)
+        return subject
+
+    def string(self, s: str) -> str:
+        return self._strings.setdefault(s, s)
+
+    def clear(self) -> None:
+        self._subjects.clear()
+        self._strings.clear()
+
+
+def _client_subject(obj: Any, json_dict: dict) -> Subject:
+    """Bound converter giving the subject interned by the client of ``obj``"""
+    return obj._client._interner.subject(json_dict)
 
 
 class Report(Object):
@@ -425,24 +1032,26 @@ class Absence(Object):
         reasons (List[str]): The reason(s) for the absence
     """
 
-    def __init__(self, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    id: str
+    from_date: datetime.datetime
+    to_date: datetime.datetime
+    justified: bool
+    hours: Optional[str]
+    days: int
+    reasons: List[str]
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("from_date", Util.datetime_parse, "dateDebut", "V"),
+        Field("to_date", Util.datetime_parse, "dateFin", "V"),
+        Field("justified", bool, "justifie", default=False),
+        Field("hours", str, "NbrHeures", strict=False),
+        Field("days", int, "NbrJours", default=0),
+        Field("reasons", lambda l: [i["L"] for i in l], "listeMotifs", "V", default=[]),
+    )
 
-        self.id: str = self._resolver(str, "N")
-        self.from_date: datetime.datetime = self._resolver(
-            Util.datetime_parse, "dateDebut", "V"
-        )
-        self.to_date: datetime.datetime = self._resolver(
-            Util.datetime_parse, "dateFin", "V"
-        )
-        self.justified: bool = self._resolver(bool, "justifie", default=False)
-        self.hours: Optional[str] = self._resolver(str, "NbrHeures", strict=False)
-        self.days: int = self._resolver(int, "NbrJours", default=0)
-        self.reasons: List[str] = self._resolver(
-            lambda l: [i["L"] for i in l], "listeMotifs", "V", default=[]
-        )
-
-        del self._resolver
+    def __init__(self, json_dict: dict) -> None:
+        self._decode(json_dict)
 
 
 class Delay(Object):
@@ -458,21 +1067,24 @@ class Delay(Object):
         reasons (List[str]): The reason(s) for the delay
     """
 
-    def __init__(self, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    id: str
+    date: datetime.datetime
+    minutes: int
+    justified: bool
+    justification: Optional[str]
+    reasons: List[str]
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("date", Util.datetime_parse, "date", "V"),
+        Field("minutes", int, "duree", default=0),
+        Field("justified", bool, "justifie", default=False),
+        Field("justification", str, "justification", strict=False),
+        Field("reasons", lambda l: [i["L"] for i in l], "listeMotifs", "V", default=[]),
+    )
 
-        self.id: str = self._resolver(str, "N")
-        self.date: datetime.datetime = self._resolver(Util.datetime_parse, "date", "V")
-        self.minutes: int = self._resolver(int, "duree", default=0)
-        self.justified: bool = self._resolver(bool, "justifie", default=False)
-        self.justification: Optional[str] = self._resolver(
-            str, "justification", strict=False
-        )
-        self.reasons: List[str] = self._resolver(
-            lambda l: [i["L"] for i in l], "listeMotifs", "V", default=[]
-        )
-
-        del self._resolver
+    def __init__(self, json_dict: dict) -> None:
+        self._decode(json_dict)
 
 
 class Period(Object):
@@ -486,24 +1098,27 @@ class Period(Object):
         end (datetime.datetime): date on which the period ends
     """
 
-    instances: Set[Any] = set()
+    id: str
+    name: str
+    start: datetime.datetime
+    end: datetime.datetime
 
-    def __init__(self, client: ClientBase, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    _fields = (
+        Field("id", str, "N"),
+        Field("name", str, "L"),
+        Field("start", Util.datetime_parse, "dateDebut", "V"),
+        Field("end", Util.datetime_parse, "dateFin", "V"),
+    )
 
-        self.__class__.instances.add(self)
+    def __init__(self, client: ClientBase, json_dict: dict) -> None:
         self._client = client
+        self._decode(json_dict)
 
-        self.id: str = self._resolver(str, "N")
-        self.name: str = self._resolver(str, "L")
-        self.start: datetime.datetime = self._resolver(
-            Util.datetime_parse, "dateDebut", "V"
-        )
-        self.end: datetime.datetime = self._resolver(
-            Util.datetime_parse, "dateFin", "V"
-        )
+        client._period_registry[self.id] = self
 
-        del self._resolver
+    def rebind(self, client: ClientBase) -> None:
+        super().rebind(client)
+        client._period_registry[self.id] = self
 
     @property
     def report(self) -> Optional[Report]:
@@ -519,22 +1134,22 @@ class Period(Object):
         return Report(data) if "Message" not in data else None
 
     @property
-    def grades(self) -> List["Grade"]:
+    def grades(self) -> IndexedList["Grade"]:
         """Get grades from the period."""
         json_data = {"Periode": {"N": self.id, "L": self.name}}
         response = self._client.post("DernieresNotes", 198, json_data)
         grades = response["dataSec"]["data"]["listeDevoirs"]["V"]
-        return [Grade(g) for g in grades]
+        return IndexedList(Grade(self._client, g) for g in grades)
 
     @property
-    def averages(self) -> List["Average"]:
+    def averages(self) -> IndexedList["Average"]:
         """Get averages from the period."""
 
         json_data = {"Periode": {"N": self.id, "L": self.name}}
         response = self._client.post("DernieresNotes", 198, json_data)
         crs = response["dataSec"]["data"]["listeServices"]["V"]
         try:
-            return [Average(c) for c in crs]
+            return IndexedList(Average(self._client, c) for c in crs)
         except ParsingError as e:
             if e.path == ["moyEleve", "V"]:
                 raise UnsupportedOperation("Could not get averages")
@@ -583,17 +1198,17 @@ class Period(Object):
             return None
 
     @property
-    def evaluations(self) -> List["Evaluation"]:
+    def evaluations(self) -> IndexedList["Evaluation"]:
         """
         All evaluations from this period
         """
         json_data = {"periode": {"N": self.id, "L": self.name, "G": 2}}
         response = self._client.post("DernieresEvaluations", 201, json_data)
         evaluations = response["dataSec"]["data"]["listeEvaluations"]["V"]
-        return [Evaluation(e) for e in evaluations]
+        return IndexedList(Evaluation(e) for e in evaluations)
 
     @property
-    def absences(self) -> List[Absence]:
+    def absences(self) -> IndexedList[Absence]:
         """
         All absences from this period
         """
@@ -605,10 +1220,10 @@ class Period(Object):
 
         response = self._client.post("PagePresence", 19, json_data)
         absences = response["dataSec"]["data"]["listeAbsences"]["V"]
-        return [Absence(a) for a in absences if a["G"] == 13]
+        return IndexedList(Absence(a) for a in absences if a["G"] == 13)
 
     @property
-    def delays(self) -> List[Delay]:
+    def delays(self) -> IndexedList[Delay]:
         """
         All delays from this period
         """
@@ -620,10 +1235,10 @@ class Period(Object):
 
         response = self._client.post("PagePresence", 19, json_data)
         delays = response["dataSec"]["data"]["listeAbsences"]["V"]
-        return [Delay(a) for a in delays if a["G"] == 14]
+        return IndexedList(Delay(a) for a in delays if a["G"] == 14)
 
     @property
-    def punishments(self) -> List[Punishment]:
+    def punishments(self) -> IndexedList[Punishment]:
         """
         All punishments from a given period
         """
@@ -635,7 +1250,9 @@ class Period(Object):
 
         response = self._client.post("PagePresence", 19, json_data)
         absences = response["dataSec"]["data"]["listeAbsences"]["V"]
-        return [Punishment(self._client, a) for a in absences if a["G"] == 41]
+        return IndexedList(
+            Punishment(self._client, a) for a in absences if a["G"] == 41
+        )
 
 
 class Average(Object):
@@ -653,7 +1270,7 @@ class Average(Object):
         background_color (str): background color of the subject
     """
 
-    def __init__(self, json_dict: dict) -> None:
+    def __init__(self, client: Optional[ClientBase], json_dict: dict) -> None:
         super().__init__(json_dict)
 
         self.student: str = self._resolver(Util.grade_parse, "moyEleve", "V")
@@ -664,7 +1281,9 @@ class Average(Object):
         self.class_average: str = self._resolver(Util.grade_parse, "moyClasse", "V")
         self.min: str = self._resolver(Util.grade_parse, "moyMin", "V")
         self.max: str = self._resolver(Util.grade_parse, "moyMax", "V")
-        self.subject = Subject(json_dict)
+        self.subject = (
+            client._interner.subject(json_dict) if client else Subject(json_dict)
+        )
         self.background_color: Optional[str] = self._resolver(
             str, "couleur", strict=False
         )
@@ -691,50 +1310,121 @@ class Grade(Object):
         is_bonus (bool): is the grade bonus : only points above 10 count
         is_optionnal (bool): is the grade optionnal : the grade only counts if it increases the average
         is_out_of_20 (bool): is the grade out of 20. Example 8/10 -> 16/20
+        grade_value (float): :attr:`grade` as a number, see :meth:`Util.grade_value`
+        out_of_value (float): :attr:`out_of` as a number
+        default_out_of_value (float): :attr:`default_out_of` as a number
+        average_value (float): :attr:`average` as a number
+        max_value (float): :attr:`max` as a number
+        min_value (float): :attr:`min` as a number
+        coefficient_value (float): :attr:`coefficient` as a number, 1 if not given
+
+    The ``*_value`` attributes are 0.0 for the grades counting as a zero
+    (AbsentZero, NonRenduZero) and NaN for the other special grades, unreadable or
+    missing values. They are not serialized by :meth:`to_dict`.
     """
 
     # TODO: optionnal -> optional
 
-    def __init__(self, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    # Exclude self.period, because it would otherwise cause a loop
+    _to_dict_exclude = frozenset(
+        {
+            "period",
+            "grade_value",
+            "out_of_value",
+            "default_out_of_value",
+            "average_value",
+            "max_value",
+            "min_value",
+            "coefficient_value",
+        }
+    )
+    # the numeric values were added, then made NaN instead of None when missing
+    _snapshot_version = 3
+
+    id: str
+    grade: str
+    out_of: str
+    default_out_of: str
+    date: datetime.date
+    subject: Subject
+    average: str
+    max: str
+    min: str
+    coefficient: str
+    comment: str
+    is_bonus: bool
+    is_optionnal: bool
+    is_out_of_20: bool
+    grade_value: float
+    out_of_value: float
+    default_out_of_value: float
+    average_value: float
+    max_value: float
+    min_value: float
+    coefficient_value: float
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("grade", Util.grade_parse, "note", "V"),
+        Field("out_of", Util.grade_parse, "bareme", "V"),
+        Field("default_out_of", Util.grade_parse, "baremeParDefaut", "V", strict=False),
+        Field("date", Util.date_parse, "date", "V"),
+        Field("subject", _client_subject, "service", "V", bound=True),
+        Field("average", Util.grade_parse, "moyenne", "V", strict=False),
+        Field("max", Util.grade_parse, "noteMax", "V", strict=False),
+        Field("min", Util.grade_parse, "noteMin", "V", strict=False),
+        Field("coefficient", str, "coefficient", strict=False),
+        Field("comment", str, "commentaire", strict=False),
+        Field("is_bonus", bool, "estBonus", default=False),
+        Field("is_optionnal", bool, "estFacultatif", default=False),
+        Field("is_out_of_20", bool, "estRamenerSur20", default=False),
+        Field("grade_value", Util.grade_value, "note", "V"),
+        Field("out_of_value", Util.grade_value, "bareme", "V"),
+        Field(
+            "default_out_of_value",
+            Util.grade_value,
+            "baremeParDefaut",
+            "V",
+            default=math.nan,
+        ),
+        Field("average_value", Util.grade_value, "moyenne", "V", default=math.nan),
+        Field("max_value", Util.grade_value, "noteMax", "V", default=math.nan),
+        Field("min_value", Util.grade_value, "noteMin", "V", default=math.nan),
+        Field("coefficient_value", Util.grade_value, "coefficient", default=1.0),
+    )
+
+    def __init__(self, client: ClientBase, json_dict: dict) -> None:
+        self._client = client
+        self._decode(json_dict)
+        self.is_optionnal = self.is_optionnal and not self.is_bonus
 
-        self.id: str = self._resolver(str, "N")
-        self.grade: str = self._resolver(Util.grade_parse, "note", "V")
-        self.out_of: str = self._resolver(Util.grade_parse, "bareme", "V")
-        self.default_out_of: str = self._resolver(
-            Util.grade_parse, "baremeParDefaut", "V", strict=False
-        )
-        self.date: datetime.date = self._resolver(Util.date_parse, "date", "V")
-        self.subject: Subject = self._resolver(Subject, "service", "V")
         # TODO: remove, because it creates a loop when trying to `to_dict`
-        self.period: Period = self._resolver(
-            lambda p: Util.get(Period.instances, id=p)[0], "periode", "V", "N"
-        )
-        self.average: str = self._resolver(
-            Util.grade_parse, "moyenne", "V", strict=False
-        )
-        self.max: str = self._resolver(Util.grade_parse, "noteMax", "V", strict=False)
-        self.min: str = self._resolver(Util.grade_parse, "noteMin", "V", strict=False)
-        self.coefficient: str = self._resolver(str, "coefficient", strict=False)
-        self.comment: str = self._resolver(str, "commentaire", strict=False)
-        self.is_bonus: bool = self._resolver(bool, "estBonus", default=False)
-        self.is_optionnal: bool = (
-            self._resolver(bool, "estFacultatif", default=False) and not self.is_bonus
-        )
-        self.is_out_of_20: bool = self._resolver(bool, "estRamenerSur20", default=False)
+        try:
+            self.period: Period = client._period_registry[
+                json_dict["periode"]["V"]["N"]
+            ]
+        except KeyError as e:
+            raise ParsingError(
+                "Could not find the period of the grade",
+                json_dict,
+                ("periode", "V", "N"),
+            ) from e
 
-        del self._resolver
 
-    def to_dict(
-        self, exclude: Set[str] = set(), include_properties: bool = False
-    ) -> dict:
-        # Exclude self.period, because it would otherwise cause a loop
-        return super().to_dict(
-            exclude={
-                "period",
-            }.union(exclude),
-            include_properties=include_properties,
+def _file_urls(client: ClientBase, files: Iterable[Attachment]) -> List[str]:
+    """Urls of file attachments, which contain their encrypted id"""
+    prefix = f"{client.communication.root_site}/FichiersExternes/"
+    suffix = f"?Session={client.attributes['h']}"
+    encrypt = client.communication.encryption.aes_encrypt
+    urls = []
+    for a in files:
+        padd = Padding.pad(
+            json.dumps({"N": a.id, "Actif": True}).replace(" ", "").encode(), 16
         )
+        urls.append(
+            prefix + encrypt(padd).hex() + "/" + quote(a.name, safe="~()*!.'") + suffix
+        )
+    return urls
 
 
 class Attachment(Object):
@@ -744,37 +1434,73 @@ class Attachment(Object):
     Attributes:
         name (str): Name of the file or url of the link.
         id (str): id of the file (used internally and for url)
-        url (str): url of the file/link
+        url (str): url of the file/link, built on first access
         type (int): type of the attachment (0 = link, 1 = file)
     """
 
-    def __init__(self, client: ClientBase, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    name: str
+    id: str
+    type: int
+    url: str
 
+    __slots__ = ("_client", "_data", "url")
+    _fields = (
+        Field("name", str, "L", default=""),
+        Field("id", str, "N"),
+        Field("type", int, "G"),  # 0 link, 1 file
+    )
+    # the url of a file is encrypted, it is only built when used
+    _computed = {"url": "_decode_url"}
+
+    def __init__(self, client: ClientBase, json_dict: dict) -> None:
         self._client = client
+        self._data: Optional[bytes] = None
+        self._decode(json_dict)
+        self._defer(json_dict)
 
-        self.name: str = self._resolver(str, "L", default="")
-        self.id: str = self._resolver(str, "N")
-        self.type: int = self._resolver(int, "G")  # 0 link, 1 file
+    def rebind(self, client: ClientBase) -> None:
+        super().rebind(client)
+        if self.type == 1:
+            # the url of a file is only valid in its session, build it again
+            try:
+                object.__getattribute__(self, "url")
+            except AttributeError:
+                pass  # not built yet, it will be with the new client
+            else:
+                self.url = _file_urls(client, [self])[0]
 
+    def _decode_url(self, json_dict: dict) -> None:
         if self.type == 0:
-            url = self._resolver(str, "url", default=None)
-            self.url: str = self.name if url is None else url
+            url = json_dict.get("url")
+            self.url = self.name if url is None else str(url)
         else:
-            padd = Padding.pad(
-                json.dumps({"N": self.id, "Actif": True}).replace(" ", "").encode(), 16
-            )
-            magic_stuff = client.communication.encryption.aes_encrypt(padd).hex()
-
-            self.url = (
-                f"{client.communication.root_site}/FichiersExternes/{magic_stuff}/"
-                + quote(self.name, safe="~()*!.'")
-                + f"?Session={client.attributes['h']}"
-            )
+            self.url = _file_urls(self._client, [self])[0]
 
-        self._data = None
+    @staticmethod
+    def generate_urls(attachments: Iterable[Attachment]) -> List[str]:
+        """
+        Builds the urls of many attachments at once, the same as reading their
+        :attr:`url` one by one but sharing the work done per client.
 
-        del self._resolver
+        Args:
+            attachments (Iterable[Attachment]): attachments, possibly of different clients
+        Returns:
+            List[str]: the urls in the order of ``attachments``
+        """
+        attachments = list(attachments)
+        pending: Dict[int, List[Attachment]] = {}
+        for a in attachments:
+            try:
+                object.__getattribute__(a, "url")
+            except AttributeError:
+                if a.type == 0:
+                    a.url  # links need no encryption
+                else:
+                    pending.setdefault(id(a._client), []).append(a)
+        for files in pending.values():
+            for a, url in zip(files, _file_urls(files[0]._client, files)):
+                a.url = url
+        return [a.url for a in attachments]
 
     def save(self, file_name: Optional[str] = None) -> None:
         """
@@ -792,16 +1518,25 @@ class Attachment(Object):
                     "The file was not found on pronote. The url may be badly formed."
                 )
             with open(file_name, "wb") as handle:
-                for block in response.iter_content(1024):
+                for block in response.iter_content(1024**2):
                     handle.write(block)
 
     @property
     def data(self) -> bytes:
-        """Gets the raw file data."""
-        if self._data:
-            return self._data
-        response = self._client.communication.session.get(self.url)
-        return response.content
+        """
+        Gets the raw file data, downloaded once.
+
+        Raises:
+            FileNotFoundError: if PRONOTE did not give the file
+        """
+        if self._data is None:
+            response = self._client.communication.session.get(self.url)
+            if response.status_code != 200:
+                raise FileNotFoundError(
+                    "The file was not found on pronote. The url may be badly formed."
+                )
+            self._data = response.content
+        return self._data
 
 
 class LessonContent(Object):
@@ -863,39 +1598,72 @@ class Lesson(Object):
         test (bool): if there will be a test in the lesson
     """
 
-    def __init__(self, client: ClientBase, json_dict: dict) -> None:
-        super().__init__(json_dict)
+    id: str
+    canceled: bool
+    status: Optional[str]
+    memo: Optional[str]
+    background_color: Optional[str]
+    outing: bool
+    start: datetime.datetime
+    exempted: bool
+    virtual_classrooms: List[str]
+    num: int
+    detention: bool
+    test: bool
+    end: datetime.datetime
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("canceled", bool, "estAnnule", default=False),
+        Field("status", str, "Statut", strict=False),
+        Field("memo", str, "memo", strict=False),
+        Field("background_color", str, "CouleurFond", strict=False),
+        Field("outing", bool, "estSortiePedagogique", default=False),
+        Field("start", Util.datetime_parse, "DateDuCours", "V"),
+        Field("exempted", bool, "dispenseEleve", default=False),
+        Field(
+            "virtual_classrooms",
+            lambda l: [i["url"] for i in l],
+            "listeVisios",
+            "V",
+            default=[],
+        ),
+        Field("num", int, "P", default=0),
+        Field("detention", bool, "estRetenue", default=False),
+        Field("test", bool, "cahierDeTextes", "V", "estDevoir", default=False),
+        Field("end", Util.datetime_parse, "DateDuCoursFin", "V", strict=False),
+    )
+
+    # attributes derived from ListeContenus instead of declared as fields
+    _contents_attributes = (
+        "subject",
+        "teacher_names",
+        "classrooms",
+        "group_names",
+        "teacher_name",
+        "classroom",
+        "group_name",
+    )
+    __slots__ = ("_client", "_content") + _contents_attributes
+    _computed = {
+        "end": "_decode_end",
+        **{name: "_decode_contents" for name in _contents_attributes},
+    }
+
+    def __init__(self, client: ClientBase, json_dict: dict, lazy: bool = False) -> None:
         self._client = client
         self._content: Optional[LessonContent] = None
 
-        self.id: str = self._resolver(str, "N")
-        self.canceled: bool = self._resolver(bool, "estAnnule", default=False)
-        self.status: Optional[str] = self._resolver(str, "Statut", strict=False)
-        self.memo: Optional[str] = self._resolver(str, "memo", strict=False)
-        self.background_color: Optional[str] = self._resolver(
-            str, "CouleurFond", strict=False
-        )
-        self.outing: bool = self._resolver(bool, "estSortiePedagogique", default=False)
-        self.start: datetime.datetime = self._resolver(
-            Util.datetime_parse, "DateDuCours", "V"
-        )
-        self.exempted: bool = self._resolver(bool, "dispenseEleve", default=False)
-        self.virtual_classrooms: List[str] = self._resolver(
-            lambda l: [i["url"] for i in l], "listeVisios", "V", default=[]
-        )
-        self.num: int = self._resolver(int, "P", default=0)
-        self.detention: bool = self._resolver(bool, "estRetenue", default=False)
-        self.test: bool = self._resolver(
-            bool, "cahierDeTextes", "V", "estDevoir", default=False
-        )
+        if lazy:
+            self._defer(json_dict)
+            return
+        self._decode(json_dict)
+        self._decode_end(json_dict)
+        self._decode_contents(json_dict)
 
-        self.end: datetime.datetime = self._resolver(
-            Util.datetime_parse, "DateDuCoursFin", "V", strict=False
-        )
+    def _decode_end(self, json_dict: dict) -> None:
         if self.end is None:
-            end_times = client.func_options["dataSec"]["data"]["General"][
-                "ListeHeuresFin"
-            ]["V"]
+            end_times = self._client._end_times
 
             # get correct ending time
             # Pronote gives us the place where the hour should be in a week, when
@@ -905,10 +1673,11 @@ class Lesson(Object):
                 json_dict["place"] % (len(end_times) - 1) + json_dict["duree"] - 1
             )
 
-            # With the end "place" now known we can look up the ending time in func_options
-            end_time = Util.place2time(end_times, end_place)
+            # With the end "place" now known we can look up the ending time
+            end_time = end_times[end_place]
             self.end = self.start.replace(hour=end_time.hour, minute=end_time.minute)
 
+    def _decode_contents(self, json_dict: dict) -> None:
         # get additional information about the lesson
         self.teacher_names: Optional[List[str]] = []
         self.classrooms: Optional[List[str]] = []
@@ -922,31 +1691,31 @@ class Lesson(Object):
                 ("ListeContenus", "V"),
             )
 
+        interner = self._client._interner
+        intern = interner.string
         for d in json_dict["ListeContenus"]["V"]:
             if "G" not in d:
                 continue
             elif d["G"] == 16:
-                self.subject = Subject(d)
+                self.subject = interner.subject(d)
             elif d["G"] == 3:
-                self.teacher_names.append(d["L"])
+                self.teacher_names.append(intern(d["L"]))
             elif d["G"] == 17:
-                self.classrooms.append(d["L"])
+                self.classrooms.append(intern(d["L"]))
             elif d["G"] == 2:
-                self.group_names.append(d["L"])
+                self.group_names.append(intern(d["L"]))
 
         # All values joined together to prevent breaking changes
         self.teacher_name: Optional[str] = (
-            ", ".join(self.teacher_names) if self.teacher_names else None
+            intern(", ".join(self.teacher_names)) if self.teacher_names else None
         )
         self.classroom: Optional[str] = (
-            ", ".join(self.classrooms) if self.classrooms else None
+            intern(", ".join(self.classrooms)) if self.classrooms else None
         )
         self.group_name: Optional[str] = (
-            ", ".join(self.group_names) if self.group_names else None
+            intern(", ".join(self.group_names)) if self.group_names else None
         )
 
-        del self._resolver
-
     @property
     def normal(self) -> bool:
         """Is the lesson considered normal (is not detention, or an outing)."""
@@ -991,24 +1760,35 @@ class Homework(Object):
         date (datetime.date): deadline
     """
 
-    def __init__(self, client: ClientBase, json_dict: dict) -> None:
-        super().__init__(json_dict)
-
+    id: str
+    description: str
+    done: bool
+    subject: Subject
+    date: datetime.date
+    background_color: str
+    _files: Tuple[Any, ...]
+
+    _fields = (
+        Field("id", str, "N"),
+        Field("description", Util.html_parse, "descriptif", "V"),
+        Field("done", bool, "TAFFait"),
+        Field("subject", _client_subject, "Matiere", "V", bound=True),
+        Field("date", Util.date_parse, "PourLe", "V"),
+        Field("background_color", str, "CouleurFond"),
+        Field("_files", tuple, "ListePieceJointe", "V"),
+    )
+
+    def __init__(self, client: ClientBase, json_dict: dict, lazy: bool = False) -> None:
         self._client = client
-
-        self.id: str = self._resolver(str, "N")
-        self.description: str = self._resolver(Util.html_parse, "descriptif", "V")
-        self.done: bool = self._resolver(bool, "TAFFait")
-        self.subject: Subject = self._resolver(Subject, "Matiere", "V")
-        self.date: datetime.date = self._resolver(Util.date_parse, "PourLe", "V")
-        self.background_color: str = self._resolver(str, "CouleurFond")
-        self._files = self._resolver(tuple, "ListePieceJointe", "V")
-
-        del self._resolver
+        if lazy:
+            self._defer(json_dict)
+        else:
+            self._decode(json_dict)
 
     def set_done(self, status: bool) -> None:
         """
-        Sets the status of the homework.
+        Sets the status of the homework. See :meth:`.Client.set_homework_done` to
+        change many homework in one request.
 
         Args:
             status (bool): The status to which to change
@@ -1149,6 +1929,16 @@ class Recipient(Object):
         del self._resolver
 
 
+def _message_author(json_dict: dict) -> Optional[str]:
+    return None if json_dict.get("emetteur", False) else str(json_dict["public_gauche"])
+
+
+def _message_content(json_dict: dict) -> str:
+    if json_dict.get("estHTML", False):
+        return Util.html_parse(json_dict["contenu"]["V"])
+    return str(json_dict["contenu"])
+
+
 class Message(Object):
     """
     Represents a message in a discussion.
@@ -1163,35 +1953,31 @@ class Message(Object):
             it is the first message in a discussion
     """
 
+    id: str
+    content: str
+    author: Optional[str]
+    seen: bool
+    created: datetime.datetime
+    _possession: str
+
+    _fields = (
+        Field("_possession", str, "possessionMessage", "V", "N"),
+        Field("id", str, "N"),
+        Field("content", _message_content),
+        Field("author", _message_author),
+        Field("seen", bool, "lu", default=False),
+        Field("created", Util.datetime_parse, "date", "V"),
+    )
+
     def __init__(self, client: ClientBase, json_dict: dict) -> None:
-        super().__init__(json_dict)
         self._client = client
-        self._possession = self._resolver(str, "possessionMessage", "V", "N")
-
-        self.id: str = self._resolver(str, "N")
-        self.content: str = ""
-        self.author: Optional[str] = (
-            None
-            if self._resolver(bool, "emetteur", default=False)
-            else self._resolver(str, "public_gauche")
-        )
-        self.seen: bool = self._resolver(bool, "lu", default=False)
-        self.created: datetime.datetime = self._resolver(
-            Util.datetime_parse, "date", "V"
-        )
+        self._decode(json_dict)
 
         # TODO: DEPRECATED
         self.date = self.created
 
         self.replying_to: Optional[Message] = None
 
-        if json_dict.get("estHTML", False):
-            self.content = self._resolver(Util.html_parse, "contenu", "V")
-        else:
-            self.content = self._resolver(str, "contenu")
-
-        del self._resolver
-
     def recipients(self) -> List[str]:
         """
         Recipients of this message
@@ -1240,6 +2026,27 @@ class Message(Object):
             },
         )
 
+        # the discussion of this message changed
+        cache = self._client._message_cache
+        for key in [k for k, v in cache.items() if self._possession in v[0][1]]:
+            del cache[key]
+
+
+def _parse_messages(client: ClientBase, messages_json: List[dict]) -> List[Message]:
+    """Messages of ``listeMessages`` linked to what they reply to, oldest first"""
+    messages = {}
+
+    for message_json in messages_json:
+        msg = Message(client, message_json)
+        messages[msg.id] = msg
+
+    for message_json in messages_json:
+        messages[message_json["N"]].replying_to = messages.get(
+            message_json["messageSource"]["V"]["N"]
+        )
+
+    return list(sorted(messages.values(), key=lambda x: x.created))
+
 
 class Discussion(Object):
     """
@@ -1299,8 +2106,12 @@ class Discussion(Object):
     def __init__(self, client: Client, json_dict: dict, labels: dict) -> None:
         super().__init__(json_dict)
         self._client = client
+        self.id: Optional[str] = self._resolver(str, "N", strict=False)
         self._possessions: list = self._resolver(noop, "listePossessionsMessages", "V")
-        self._date_cache: Optional[datetime.datetime] = None
+        # the listing usually gives the date, saving a request for the messages
+        self._date_cache: Optional[datetime.datetime] = self._resolver(
+            Util.datetime_parse, "date", "V", strict=False
+        )
 
         self.replyable: bool = True
         self.subject: str = self._resolver(str, "objet")
@@ -1346,38 +2157,71 @@ class Discussion(Object):
         return [i["L"] for i in resp["dataSec"]["data"]["listeDest"]["V"]]
 
     @property
-    def messages(self) -> List[Message]:
-        """
-        Messages linked to the discussion
+    def _cache_key(self) -> Optional[str]:
+        return self.id or self._possessions[0]["N"]
 
-        .. warning:: Makes a request everytime it is accessed
+    @property
+    def _cache_state(self) -> Tuple[int, Tuple[str, ...]]:
+        # new messages change the unread count or the possessions
+        return (self.unread, tuple(p["N"] for p in self._possessions))
 
-        ..
-            TODO: should be a method instead
-        """
-        resp = self._client.post(
-            "ListeMessages",
-            131,
-            {"listePossessionsMessages": self._possessions},
+    def _cache_messages(
+        self, messages: List[Message], response: Optional[dict] = None
+    ) -> None:
+        self._client._message_cache[self._cache_key] = (
+            self._cache_state,
+            messages,
+            response,
         )
 
-        messages = {}
+    def _invalidate_messages(self) -> None:
+        self._client._message_cache.pop(self._cache_key, None)
 
-        for message_json in resp["dataSec"]["data"]["listeMessages"]["V"]:
-            msg = Message(self._client, message_json)
-            messages[msg.id] = msg
+    def _messages_cached(self, need_response: bool = False) -> bool:
+        cached = self._client._message_cache.get(self._cache_key)
+        return (
+            cached is not None
+            and cached[0] == self._cache_state
+            and not (need_response and cached[2] is None)
+        )
 
-        for message_json in resp["dataSec"]["data"]["listeMessages"]["V"]:
-            messages[message_json["N"]].replying_to = messages.get(
-                message_json["messageSource"]["V"]["N"]
+    def _messages_response(self, need_response: bool = False) -> Tuple[Any, ...]:
+        """
+        Cached messages and ``ListeMessages`` response of the discussion, posted again
+        only when the discussion changed (or the response is needed but was not kept)
+        """
+        if not self._messages_cached(need_response):
+            resp = self._client.post(
+                "ListeMessages",
+                131,
+                {"listePossessionsMessages": self._possessions},
+            )
+            data = resp["dataSec"]["data"]
+            self._cache_messages(
+                _parse_messages(self._client, data["listeMessages"]["V"]), data
             )
+        return self._client._message_cache[self._cache_key]
+
+    @property
+    def messages(self) -> List[Message]:
+        """
+        Messages linked to the discussion
+
+        The messages are kept by the client until the discussion changes (its unread count or
+        its possessions in a newer :meth:`.Client.discussions`), or until it is modified with
+        :meth:`reply`, :meth:`mark_as` or :meth:`delete`.
+        See also :meth:`.Client.fetch_messages` to get the messages of many discussions at once.
 
-        return list(sorted(messages.values(), key=lambda x: x.created))
+        ..
+            TODO: should be a method instead
+        """
+        return list(self._messages_response()[1])
 
     @property
     def date(self) -> datetime.datetime:
         """
-        Date when the discussion was opened. Alias for ``Discussion.messages[0].date``.
+        Date of the discussion, as given by the discussion list. If PRONOTE does not give it,
+        it is the date of the first message (``Discussion.messages[0].date``).
         """
         if not self._date_cache:
             msgs = self.messages
@@ -1400,6 +2244,7 @@ class Discussion(Object):
                 "listePossessionsMessages": self._possessions,
             },
         )
+        self._invalidate_messages()
 
     def reply(self, message: str) -> None:
         """
@@ -1413,14 +2258,10 @@ class Discussion(Object):
             raise DiscussionClosed("Cannot reply to discussion")
 
         # get the message we should respond to
-        resp = self._client.post(
-            "ListeMessages",
-            131,
-            {"listePossessionsMessages": self._possessions},
-        )
+        data = self._messages_response(need_response=True)[2]
 
-        msg = resp["dataSec"]["data"]["messagePourReponse"]["V"]
-        button = resp["dataSec"]["data"]["listeBoutons"]["V"][0]
+        msg = data["messagePourReponse"]["V"]
+        button = data["listeBoutons"]["V"][0]
 
         self._client.post(
             "SaisieMessage",
@@ -1432,6 +2273,7 @@ class Discussion(Object):
                 "bouton": button,  # pronote wants the specific button we pressed
             },
         )
+        self._invalidate_messages()
 
     def delete(self) -> None:
         """
@@ -1445,6 +2287,7 @@ class Discussion(Object):
                 "listePossessionsMessages": self._possessions,
             },
         )
+        self._invalidate_messages()
 
 
 class ClientInfo(Slots):
@@ -2018,12 +2861,9 @@ class Punishment(Object):
 
             self.start: Union[datetime.datetime, datetime.date]
             if place is not None:
-                liste_heures = client.func_options["dataSec"]["data"]["General"][
-                    "ListeHeures"
-                ]["V"]
                 try:
                     self.start = datetime.datetime.combine(
-                        date, Util.place2time(liste_heures, place)
+                        date, client._start_times[place]
                     )
                 except ValueError as e:
                     raise DataError(str(e))
@@ -2047,12 +2887,9 @@ class Punishment(Object):
         self.given: Union[datetime.datetime, datetime.date]
         if self.during_lesson:
             time_place = self._resolver(int, "placeDemande")
-            liste_heures = client.func_options["dataSec"]["data"]["General"][
-                "ListeHeures"
-            ]["V"]
             try:
                 self.given = datetime.datetime.combine(
-                    date, Util.place2time(liste_heures, time_place)
+                    date, client._start_times[time_place]
                 )
             except ValueError as e:
                 raise DataError(str(e))
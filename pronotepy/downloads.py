@@ -0,0 +1,239 @@
+"""
+Concurrent download of attachments into a content-addressed disk cache.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy.downloads import DownloadManager
+
+    manager = DownloadManager("~/.cache/pronotepy", max_size=256 * 1024**2)
+    files = []
+    for homework in client.homework(date_from):
+        files += homework.files
+    paths = manager.download(files)  # attachment -> path in the cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .dataClasses import Attachment
+
+__all__ = ("DownloadManager",)
+
+log = logging.getLogger(__name__)
+
+_INDEX = "index.json"
+
+
+class DownloadManager:
+    """
+    Downloads file attachments concurrently and keeps them in a disk cache.
+
+    Files are stored under the sha256 of their content, so the same file attached
+    to many homework is stored once. An index maps every downloaded attachment
+    (by PRONOTE server and attachment id) to its content, attachments already in the
+    cache are not downloaded again. When the cache grows above ``max_size``, the
+    least recently used files are removed.
+
+    Args:
+        cache_dir (Union[str, os.PathLike]): directory of the cache, created if needed
+        max_workers (int): maximum number of concurrent downloads
+        max_size (int): maximum size of the cache in bytes
+        buffer_size (int): size of the chunks streamed to disk
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, os.PathLike],
+        max_workers: int = 4,
+        max_size: int = 512 * 1024**2,
+        buffer_size: int = 1024**2,
+    ) -> None:
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_workers = max_workers
+        self.max_size = max_size
+        self.buffer_size = buffer_size
+
+        self._objects = self.cache_dir / "objects"
+        self._tmp = self.cache_dir / "tmp"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._tmp.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: Dict[str, str] = self._load_index()
+
+    @staticmethod
+    def _key(attachment: Attachment) -> str:
+        return f"{attachment._client.communication.root_site}|{attachment.id}"
+
+    def _path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest
+
+    def _load_index(self) -> Dict[str, str]:
+        try:
+            with open(self.cache_dir / _INDEX, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            log.warning("Ignoring the corrupted download cache index")
+            return {}
+        return {k: v for k, v in index.items() if self._path(v).exists()}
+
+    def _save_index(self) -> None:
+        # caller holds the lock
+        fd, tmp = tempfile.mkstemp(dir=self._tmp)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self.cache_dir / _INDEX)
+
+    def cached(self, attachment: Attachment) -> Optional[Path]:
+        """
+        Path of an attachment in the cache
+
+        Args:
+            attachment (Attachment): a file attachment
+        Returns:
+            Optional[Path]: the path, None if the attachment is not in the cache
+        """
+        with self._lock:
+            digest = self._index.get(self._key(attachment))
+        if digest is None:
+            return None
+        path = self._path(digest)
+        try:
+            # mark as recently used for the eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def download(self, attachments: Iterable[Attachment]) -> Dict[Attachment, Path]:
+        """
+        Downloads the files that are not in the cache yet, at most ``max_workers`` at once.
+        Links (attachments of type 0) are skipped, and an attachment present many times
+        is downloaded once.
+
+        Args:
+            attachments (Iterable[Attachment]): attachments, possibly of different clients
+        Returns:
+            Dict[Attachment, Path]: path in the cache of every given file attachment
+        Raises:
+            FileNotFoundError: if PRONOTE did not give a file
+        """
+        files = [a for a in attachments if a.type == 1]
+        # attachments of different servers can have the same id
+        paths: Dict[str, Path] = {}
+        missing: Dict[str, Attachment] = {}
+        for a in files:
+            key = self._key(a)
+            if key in paths or key in missing:
+                continue
+            path = self.cached(a)
+            if path is None:
+                missing[key] = a
+            else:
+                paths[key] = path
+
+        if missing:
+            # the urls are built up front, sharing the work per client
+            Attachment.generate_urls(missing.values())
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(missing)),
+                    thread_name_prefix="pronotepy-download",
+                ) as executor:
+                    for key, path in executor.map(self._fetch, missing.values()):
+                        paths[key] = path
+            finally:
+                with self._lock:
+                    self._save_index()
+            self._evict(keep=set(paths.values()))
+        return {a: paths[self._key(a)] for a in files}
+
+    def save(
+        self, attachments: Iterable[Attachment], directory: Union[str, os.PathLike]
+    ) -> List[Path]:
+        """
+        Downloads the files and copies them to ``directory`` under their names
+
+        Args:
+            attachments (Iterable[Attachment]): the attachments
+            directory (Union[str, os.PathLike]): destination, created if needed
+        Returns:
+            List[Path]: the saved files
+        """
+        attachments = [a for a in attachments if a.type == 1]
+        paths = self.download(attachments)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        saved = []
+        for a in attachments:
+            destination = directory / Path(a.name).name
+            shutil.copyfile(paths[a], destination)
+            saved.append(destination)
+        return saved
+
+    def _fetch(self, attachment: Attachment) -> Tuple[str, Path]:
+        """Downloads an attachment, returns its key and path in the cache"""
+        session = attachment._client.communication.session
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with os.fdopen(fd, "wb", buffering=self.buffer_size) as handle, closing(
+                session.get(attachment.url, stream=True)
+            ) as response:
+                if response.status_code != 200:
+                    raise FileNotFoundError(
+                        "The file was not found on pronote. The url may be badly formed."
+                    )
+                for block in response.iter_content(self.buffer_size):
+                    digest.update(block)
+                    handle.write(block)
+            path = self._path(digest.hexdigest())
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        key = self._key(attachment)
+        with self._lock:
+            self._index[key] = path.name
+        return key, path
+
+    def _evict(self, keep: Iterable[Path] = ()) -> None:
+        """Removes the least recently used files until the cache fits in ``max_size``"""
+        keep = set(keep)
+        with self._lock:
+            files = []
+            total = 0
+            for path in self._objects.glob("*/*"):
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            if total <= self.max_size:
+                return
+
+            removed = set()
+            for _, size, path in sorted(files):
+                if total <= self.max_size:
+                    break
+                if path in keep:
+                    continue
+                path.unlink()
+                removed.add(path.name)
+                total -= size
+            self._index = {k: v for k, v in self._index.items() if v not in removed}
+            self._save_index()
@@ -44,3 +44,4 @@ from .ent import (
     extranet_colleges_somme,
 )
 from .complex_ent import ac_rennes
+from .cache import ENTCache, MemoryENTCache, DiskENTCache
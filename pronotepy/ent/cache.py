@@ -0,0 +1,212 @@
+"""
+Caches of the cookies returned by ENT functions, so that a client logging in again
+(a new client for the same account, or :meth:`.ClientBase.refresh`) reuses the ENT
+session instead of going through the whole ENT login.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy import Client
+    from pronotepy.ent import ac_reunion, DiskENTCache
+
+    cache = DiskENTCache("~/.cache/pronotepy/ent", ttl=3600)
+    client = Client(url, username, password, ent=ac_reunion, ent_cache=cache)
+"""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from requests.cookies import RequestsCookieJar, create_cookie
+
+__all__ = ("ENTCache", "MemoryENTCache", "DiskENTCache")
+
+log = logging.getLogger(__name__)
+
+
+def _dump_cookies(cookies: RequestsCookieJar) -> List[dict]:
+    return [
+        {
+            "name": c.name,
+            "value": c.value,
+            "domain": c.domain,
+            "path": c.path,
+            "expires": c.expires,
+            "secure": c.secure,
+            "rest": c._rest,  # type: ignore[attr-defined]
+        }
+        for c in cookies
+    ]
+
+
+def _load_cookies(cookies: List[dict]) -> RequestsCookieJar:
+    jar = RequestsCookieJar()
+    for c in cookies:
+        jar.set_cookie(create_cookie(**c))
+    return jar
+
+
+class ENTCache(abc.ABC):
+    """
+    Base of the ENT cookie caches. Subclasses store entries with :meth:`_read`,
+    :meth:`_write` and :meth:`delete`.
+
+    An entry expires after ``ttl`` seconds, or sooner if one of its cookies expires
+    before. The client also forgets an entry whose cookies are refused by PRONOTE.
+
+    Args:
+        ttl (float): time in seconds for which cookies are reused
+    """
+
+    def __init__(self, ttl: float = 1800) -> None:
+        self.ttl = ttl
+
+    @staticmethod
+    def key(ent: Callable[..., Any], username: str) -> str:
+        """
+        Key of the cookies of an account: the ENT function with its arguments and
+        the sha256 of the username
+
+        Args:
+            ent (Callable): the ENT function, usually a :func:`functools.partial`
+            username (str)
+        """
+        keywords: Dict[str, Any] = {}
+        while isinstance(ent, partial):
+            keywords = {**ent.keywords, **keywords}
+            ent = ent.func
+        # an ENT function can also be any callable object
+        named = ent if hasattr(ent, "__qualname__") else type(ent)
+        name = f"{named.__module__}.{named.__qualname__}"
+        arguments = ",".join(f"{k}={v!r}" for k, v in sorted(keywords.items()))
+        return f"{name}({arguments})|{hashlib.sha256(username.encode()).hexdigest()}"
+
+    def get(self, key: str) -> Optional[RequestsCookieJar]:
+        """
+        Args:
+            key (str): see :meth:`key`
+        Returns:
+            Optional[RequestsCookieJar]: the cookies, None if missing or expired
+        """
+        entry = self._read(key)
+        if entry is None:
+            return None
+        if entry["expires"] <= time.time():
+            self.delete(key)
+            return None
+        return _load_cookies(entry["cookies"])
+
+    def set(self, key: str, cookies: RequestsCookieJar) -> None:
+        """
+        Args:
+            key (str): see :meth:`key`
+            cookies (RequestsCookieJar): cookies returned by the ENT function
+        """
+        dumped = _dump_cookies(cookies)
+        expires = min(
+            [time.time() + self.ttl]
+            + [c["expires"] for c in dumped if c["expires"] is not None]
+        )
+        self._write(key, {"expires": expires, "cookies": dumped})
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Forgets the cookies of ``key``"""
+
+    @abc.abstractmethod
+    def _read(self, key: str) -> Optional[dict]:
+        """The entry of ``key``, None if missing"""
+
+    @abc.abstractmethod
+    def _write(self, key: str, entry: dict) -> None:
+        """Stores the entry of ``key``, replacing its previous one"""
+
+
+class MemoryENTCache(ENTCache):
+    """
+    ENT cookies kept in memory, for the clients of one process
+
+    Args:
+        ttl (float): time in seconds for which cookies are reused
+    """
+
+    def __init__(self, ttl: float = 1800) -> None:
+        super().__init__(ttl)
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forgets every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def _read(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def _write(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+
+class DiskENTCache(ENTCache):
+    """
+    ENT cookies kept in a directory, one file per account, so that they outlive the
+    process. The files are only readable by their owner, but they give access to the
+    ENT account: keep the directory private.
+
+    Args:
+        directory (Union[str, os.PathLike]): directory of the cache, created if needed
+        ttl (float): time in seconds for which cookies are reused
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], ttl: float = 1800) -> None:
+        super().__init__(ttl)
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            log.warning("Ignoring a corrupted ENT cache entry")
+            return None
+        return entry
+
+    def _write(self, key: str, entry: dict) -> None:
+        # mkstemp creates the file readable only by its owner
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
@@ -6,6 +6,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs
 
 from ..exceptions import *
+from .forms import parse_forms
 from .generic_func import _educonnect
 
 log = getLogger(__name__)
@@ -40,12 +41,9 @@ def ac_rennes(username: str, password: str) -> requests.cookies.RequestsCookieJa
 
     with requests.Session() as session:
         response = session.get(toutatice_url, headers=HEADERS)
-        soup = BeautifulSoup(response.text, "html.parser")
-        payload = {
-            "entityID": soup.find("input", {"name": "entityID"})["value"],
-            "return": soup.find("input", {"name": "return"})["value"],
-            "_saml_idp": soup.find("input", {"name": "_saml_idp"})["value"],
-        }
+        _, payload = parse_forms(response.text, ("entityID", "return", "_saml_idp"))
+        if len(payload) != 3:
+            raise ENTLoginError("Toutatice ENT (ac_rennes) : login form not found")
 
         log.debug(f"[ENT Toutatice] Logging in with {username}")
         response = session.post(toutatice_login, data=payload, headers=HEADERS)
@@ -0,0 +1,159 @@
+"""
+Extraction of the forms of ENT pages.
+
+The ENT logins only need a few values of each page (a SAML form, the inputs of a CAS
+login form), so the pages are scanned with :class:`html.parser.HTMLParser` without
+building a tree, stopping as soon as the values are found. BeautifulSoup is used if
+the page cannot be scanned.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Collection, Dict, List, Mapping, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+__all__ = ("Form", "parse_forms", "find_form")
+
+
+class Form:
+    """
+    A form of a page
+
+    Attributes:
+        attrs (Dict[str, Optional[str]]): attributes of the form tag
+        inputs (Dict[str, Optional[str]]): value of the named inputs of the form
+    """
+
+    def __init__(self, attrs: Dict[str, Optional[str]]) -> None:
+        self.attrs = attrs
+        self.inputs: Dict[str, Optional[str]] = {}
+
+    @property
+    def action(self) -> Optional[str]:
+        return self.attrs.get("action")
+
+    def matches(self, attrs: Mapping[str, str]) -> bool:
+        """If the form has the attributes, ``class`` matching any of the form's classes"""
+        for name, value in attrs.items():
+            actual = self.attrs.get(name)
+            if actual is None:
+                return False
+            if actual != value and not (name == "class" and value in actual.split()):
+                return False
+        return True
+
+
+class _Stop(Exception):
+    pass
+
+
+class _FormScanner(HTMLParser):
+    def __init__(
+        self, names: Collection[str], form: Optional[Mapping[str, str]]
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self.names = names
+        self.form_attrs = form
+        self.form: Optional[Form] = None
+        self.inputs: Dict[str, Optional[str]] = {}
+        self._open: Optional[Form] = None
+        self._form_done = form is None
+
+    def _check(self) -> None:
+        if self._form_done and all(n in self.inputs for n in self.names):
+            raise _Stop
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "form":
+            self._open = Form(dict(attrs))
+            if (
+                self.form is None
+                and self.form_attrs is not None
+                and self._open.matches(self.form_attrs)
+            ):
+                self.form = self._open
+        elif tag == "input":
+            attributes = dict(attrs)
+            name = attributes.get("name")
+            if name is None:
+                return
+            value = attributes.get("value")
+            self.inputs.setdefault(name, value)
+            if self._open is not None:
+                self._open.inputs[name] = value
+            self._check()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "form" and self._open is not None:
+            if self._open is self.form:
+                self._form_done = True
+            self._open = None
+            self._check()
+
+
+def _parse_soup(
+    html: str, names: Collection[str], form: Optional[Mapping[str, str]]
+) -> Tuple[Optional[Form], Dict[str, Optional[str]]]:
+    soup = BeautifulSoup(html, "html.parser")
+    inputs: Dict[str, Optional[str]] = {}
+    for name in names:
+        tag = soup.find("input", {"name": name})
+        if isinstance(tag, Tag):
+            inputs[name] = tag.get("value")  # type: ignore[assignment]
+
+    found = None
+    if form is not None:
+        for tag in soup.find_all("form"):
+            candidate = Form(
+                {
+                    k: " ".join(v) if isinstance(v, list) else v
+                    for k, v in tag.attrs.items()
+                }
+            )
+            if candidate.matches(form):
+                for input_ in tag.find_all("input"):
+                    input_name = input_.get("name")
+                    if isinstance(input_name, str):
+                        candidate.inputs[input_name] = input_.get("value")  # type: ignore
+                found = candidate
+                break
+    return found, inputs
+
+
+def parse_forms(
+    html: str, names: Collection[str] = (), form: Optional[Mapping[str, str]] = None
+) -> Tuple[Optional[Form], Dict[str, Optional[str]]]:
+    """
+    Finds a form and inputs of a page
+
+    Args:
+        html (str): the page
+        names (Collection[str]): names of inputs to find anywhere in the page
+        form (Optional[Mapping[str, str]]): attributes of the form to find, ``{}`` for
+            the first form, None to find no form
+    Returns:
+        Tuple[Optional[Form], Dict[str, Optional[str]]]: the first matching form, and the
+            value of the first input of each name, missing names are not in the dict
+    """
+    scanner = _FormScanner(names, form)
+    try:
+        scanner.feed(html)
+        scanner.close()
+    except _Stop:
+        pass
+    except Exception:
+        return _parse_soup(html, names, form)
+    return scanner.form, {n: scanner.inputs[n] for n in names if n in scanner.inputs}
+
+
+def find_form(html: str, attrs: Optional[Mapping[str, str]] = None) -> Optional[Form]:
+    """
+    Args:
+        html (str): the page
+        attrs (Optional[Mapping[str, str]]): attributes of the form, the first form if None
+    Returns:
+        Optional[Form]: the first matching form
+    """
+    return parse_forms(html, form=attrs or {})[0]
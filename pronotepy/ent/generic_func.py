@@ -2,10 +2,10 @@ from logging import getLogger, DEBUG
 import typing
 
 import requests
-from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from ..exceptions import *
+from .forms import find_form, parse_forms
 
 log = getLogger(__name__)
 log.setLevel(DEBUG)
@@ -22,28 +22,25 @@ def _sso_redirect(
     request_url: str = "",
     request_payload: dict = {},
 ) -> typing.Optional[requests.Response]:
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    saml = soup.find("input", {"name": saml_type})
-    if not saml and response.status_code == 200 and request_url != response.url:
+    names = (saml_type, "RelayState")
+    form, inputs = parse_forms(response.text, names, {})
+    if (
+        saml_type not in inputs
+        and response.status_code == 200
+        and request_url != response.url
+    ):
         # manual redirect
         response = session.post(response.url, headers=HEADERS, data=request_payload)
-        soup = BeautifulSoup(response.text, "html.parser")
-        saml = soup.find("input", {"name": saml_type})
+        form, inputs = parse_forms(response.text, names, {})
 
-    if not saml:
+    if saml_type not in inputs or form is None:
         return None
 
-    assert isinstance(saml, Tag)
-
-    payload = {saml_type: saml.get("value")}
-
-    relay_state = soup.find("input", {"name": "RelayState"})
-    assert isinstance(relay_state, Tag)
-    if relay_state:
-        payload["RelayState"] = relay_state["value"]
+    payload = {saml_type: inputs[saml_type]}
+    if "RelayState" in inputs:
+        payload["RelayState"] = inputs["RelayState"]
 
-    url: str = soup.find("form")["action"]  # type: ignore
+    url: str = form.action  # type: ignore
 
     return session.post(url, headers=HEADERS, data=payload)
 
@@ -168,18 +165,16 @@ def _cas(
     with requests.Session() as session:
         response = session.get(url, headers=HEADERS)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        form = soup.find("form", {"class": "cas__login-form"})
-        payload = {}
-        for input_ in form.findAll("input"):
-            payload[input_["name"]] = input_.get("value")
+        form = find_form(response.text, {"class": "cas__login-form"})
+        if form is None:
+            raise ENTLoginError(f"Login form not found on CAS {url}")
+        payload = dict(form.inputs)
         payload["username"] = username
         payload["password"] = password
 
         r = session.post(response.url, data=payload, headers=HEADERS)
-        soup = BeautifulSoup(r.text, "html.parser")
 
-        if soup.find("form", {"class": "cas__login-form"}):
+        if find_form(r.text, {"class": "cas__login-form"}):
             raise ENTLoginError(
                 f"Fail to connect with CAS {url} : probably wrong login information"
             )
@@ -381,11 +376,10 @@ def _oze_ent(
         if domain not in username:
             username = f"{username}@{domain}"
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        form = soup.find("form", {"id": "kc-form-login"})
-        payload = {}
-        for input_ in form.findAll("input"):
-            payload[input_["name"]] = input_.get("value")
+        form = find_form(response.text, {"id": "kc-form-login"})
+        if form is None:
+            raise ENTLoginError(f"Login form not found on Oze ENT {url}")
+        payload = dict(form.inputs)
         payload["username"] = username
         payload["password"] = password
 
@@ -474,18 +468,16 @@ def _simple_auth(
     with requests.Session() as session:
         response = session.get(url, headers=HEADERS)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        form = soup.find("form", form_attr)
-        payload = {}
-        for input_ in form.findAll("input"):
-            payload[input_["name"]] = input_.get("value")
+        form = find_form(response.text, form_attr)
+        if form is None:
+            raise ENTLoginError(f"Login form not found on {url}")
+        payload = dict(form.inputs)
         payload["username"] = username
         payload["password"] = password
 
         r = session.post(response.url, data=payload, headers=HEADERS)
-        soup = BeautifulSoup(r.text, "html.parser")
 
-        if soup.find("form", form_attr):
+        if find_form(r.text, form_attr):
             raise ENTLoginError(
                 f"Fail to connect with {url} : probably wrong login information"
             )
@@ -0,0 +1,147 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+from functools import partial
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
+
+from requests.cookies import RequestsCookieJar
+
+from pronotepy.clients import ClientBase
+from pronotepy.ent import DiskENTCache, ENTCache, MemoryENTCache, ac_reunion
+from pronotepy.exceptions import PronoteAPIError
+
+
+def _jar(**cookies: Any) -> RequestsCookieJar:
+    jar = RequestsCookieJar()
+    for name, value in cookies.items():
+        jar.set(name, value, domain="ent.example.com", path="/")
+    return jar
+
+
+class TestENTCache(unittest.TestCase):
+    def test_key(self) -> None:
+        key = ENTCache.key(ac_reunion, "user")
+        self.assertEqual(key, ENTCache.key(ac_reunion, "user"))
+        self.assertNotIn("user", key.split("|")[1])
+        self.assertIn("_cas_edu", key)
+        self.assertNotEqual(key, ENTCache.key(ac_reunion, "other"))
+        self.assertNotEqual(
+            key, ENTCache.key(partial(ac_reunion, redirect_form=False), "user")
+        )
+        # any callable
+        self.assertIn("MagicMock", ENTCache.key(MagicMock(), "user"))
+
+    def test_memory(self) -> None:
+        cache = MemoryENTCache(ttl=60)
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", _jar(TGC="ticket"))
+        jar = cache.get("k")
+        assert jar is not None
+        self.assertEqual(jar.get("TGC", domain="ent.example.com"), "ticket")
+        # a copy, using it does not change the cache
+        jar.set("other", "1")
+        self.assertEqual(len(cache.get("k") or []), 1)
+
+        cache.delete("k")
+        self.assertIsNone(cache.get("k"))
+
+    def test_expiry(self) -> None:
+        cache = MemoryENTCache(ttl=0)
+        cache.set("k", _jar(TGC="ticket"))
+        self.assertIsNone(cache.get("k"))
+
+        # an expiring cookie shortens the ttl
+        cache = MemoryENTCache(ttl=60)
+        jar = _jar()
+        jar.set("TGC", "ticket", expires=int(time.time()) - 1)
+        cache.set("k", jar)
+        self.assertIsNone(cache.get("k"))
+
+    def test_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskENTCache(directory, ttl=60)
+            cache.set("k", _jar(TGC="ticket", JSESSIONID="id"))
+
+            jar = DiskENTCache(directory).get("k")
+            assert jar is not None
+            self.assertEqual(jar.get_dict(), {"TGC": "ticket", "JSESSIONID": "id"})
+            path = cache._path("k")
+            if os.name == "posix":
+                self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o600)
+
+            path.write_text("{")
+            self.assertIsNone(cache.get("k"))
+            cache.delete("k")
+            cache.delete("k")
+            self.assertFalse(path.exists())
+
+    def test_base_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            ENTCache()  # type: ignore[abstract]
+
+
+class TestClientENTCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ent_calls = 0
+
+        def ent(username: str, password: str, **kwargs: str) -> RequestsCookieJar:
+            self.ent_calls += 1
+            return _jar(TGC="fresh")
+
+        self.ent = ent
+        self.cache = MemoryENTCache()
+        self.key = ENTCache.key(ent, "user")
+
+        self.client = cast(Any, ClientBase.__new__(ClientBase))
+        self.client.ent = self.ent
+        self.client.ent_cache = self.cache
+        self.client.username = "user"
+        self.client.password = "password"
+        self.client.pronote_url = "https://pronote.example.com/pronote/eleve.html"
+        self.client.client_identifier = None
+
+    def cached_tgc(self) -> Any:
+        jar = self.cache.get(self.key)
+        return jar and jar.get("TGC")
+
+    def connect(self, valid: set) -> Any:
+        """Connects with a PRONOTE accepting the TGC cookie values of ``valid``"""
+
+        def communication(url: str, cookies: RequestsCookieJar) -> MagicMock:
+            com = MagicMock()
+            if cookies.get("TGC") in valid:
+                com.initialise.return_value = ({"e": "u", "f": "p"}, {})
+            else:
+                com.initialise.side_effect = PronoteAPIError("no ENT session")
+            return com
+
+        with patch("pronotepy.clients._Communication", side_effect=communication):
+            self.client._connect()
+
+    def test_fresh_login_is_cached(self) -> None:
+        self.connect({"fresh"})
+        self.assertEqual(self.ent_calls, 1)
+        self.assertEqual(self.cached_tgc(), "fresh")
+
+        self.connect({"fresh"})
+        self.assertEqual(self.ent_calls, 1)
+
+    def test_refused_cookies(self) -> None:
+        self.cache.set(self.key, _jar(TGC="stale"))
+        self.connect({"fresh"})
+        self.assertEqual(self.ent_calls, 1)
+        self.assertEqual(self.cached_tgc(), "fresh")
+        self.assertEqual(self.client.attributes, {"e": "u", "f": "p"})
+
+    def test_without_cache(self) -> None:
+        self.client.ent_cache = None
+        self.connect({"fresh"})
+        self.connect({"fresh"})
+        self.assertEqual(self.ent_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from pronotepy.ent.forms import _parse_soup, find_form, parse_forms
+
+PAGE = """<html><body>
+<form id="search" action="/search"><input name="q" value="x"></form>
+<p>&eacute;t&eacute;</p>
+<form id="fm1" class="cas__login-form form" action="login?a=1&amp;b=2">
+  <input type="text" name="username" value="">
+  <input type="hidden" name="execution" value="e1s1&#x3a;">
+  <input type="hidden" name="geolocation">
+  <input type="submit" value="Se connecter">
+</form>
+<input name="RelayState" value="late">
+</body></html>"""
+
+
+class TestForms(unittest.TestCase):
+    def test_find_form(self) -> None:
+        for attrs in ({"class": "cas__login-form"}, {"id": "fm1"}):
+            form = find_form(PAGE, attrs)
+            assert form is not None
+            self.assertEqual(form.action, "login?a=1&b=2")
+            self.assertEqual(
+                form.inputs,
+                {"username": "", "execution": "e1s1:", "geolocation": None},
+            )
+
+        first = find_form(PAGE)
+        assert first is not None
+        self.assertEqual(first.attrs["id"], "search")
+        self.assertIsNone(find_form(PAGE, {"class": "cas"}))
+        self.assertIsNone(find_form(PAGE, {"id": "fm1", "method": "post"}))
+
+    def test_inputs(self) -> None:
+        form, inputs = parse_forms(PAGE, ("q", "RelayState", "missing"), {})
+        assert form is not None
+        self.assertEqual(form.action, "/search")
+        self.assertEqual(inputs, {"q": "x", "RelayState": "late"})
+
+        form, inputs = parse_forms(PAGE, ("q",))
+        self.assertIsNone(form)
+        self.assertEqual(inputs, {"q": "x"})
+
+    def test_soup_fallback(self) -> None:
+        names = ("q", "RelayState", "missing")
+        for attrs in ({}, {"class": "cas__login-form"}, {"id": "nope"}):
+            fast_form, fast_inputs = parse_forms(PAGE, names, attrs)
+            soup_form, soup_inputs = _parse_soup(PAGE, names, attrs)
+            self.assertEqual(fast_inputs, soup_inputs)
+            self.assertEqual(
+                fast_form and (fast_form.attrs, fast_form.inputs),
+                soup_form and (soup_form.attrs, soup_form.inputs),
+            )
+
+        with patch("pronotepy.ent.forms._FormScanner.feed", side_effect=AssertionError):
+            form = find_form(PAGE, {"id": "fm1"})
+        assert form is not None
+        self.assertEqual(form.inputs["execution"], "e1s1:")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ __all__ = (
     "ChildNotFound",
     "DataError",
     "ParsingError",
+    "LazyParsingError",
+    "SnapshotError",
     "ICalExportError",
     "DateParsingError",
     "ENTLoginError",
@@ -74,6 +76,22 @@ class ParsingError(DataError):
         self.path = path
 
 
+class LazyParsingError(ParsingError, AttributeError):
+    """
+    Bad json found when decoding an attribute of a lazy object on its first access.
+    Also an :class:`AttributeError`, so :func:`hasattr` and :func:`getattr` with a
+    default see the attribute as missing.
+    """
+
+    pass
+
+
+class SnapshotError(DataError):
+    """Invalid or incompatible snapshot of data objects"""
+
+    pass
+
+
 class ICalExportError(PronoteAPIError):
     """Error while exporting ICal. Pronote did not return token"""
 
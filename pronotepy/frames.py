@@ -0,0 +1,271 @@
+"""
+Columnar views of data objects, for computations over many of them at once.
+
+Needs numpy, which is an optional dependency: ``pip install pronotepy[numpy]``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "pronotepy.frames needs numpy, install it with `pip install pronotepy[numpy]`"
+    ) from e
+
+from .dataClasses import Grade, Subject
+
+__all__ = ("GradeFrame",)
+
+
+class GradeFrame:
+    """
+    Grades stored as columns, with vectorized averages following PRONOTE's rules:
+
+    - a grade counts with its coefficient, or with its coefficient scaled by
+      ``out_of / 20`` if it is not brought back to 20 (``is_out_of_20``)
+    - only the points above 10/20 of a bonus grade count, they are added to the
+      subject without weighing it down
+    - an optional grade counts only if it raises the subject average
+    - absent and not submitted grades counting as a zero count as a zero, the other
+      special grades (absent, exempted, ...) are not counted
+
+    The overall average is the mean of the subject averages, weighted by the
+    given subject coefficients.
+
+    .. note:: The averages are computed from the grades and may differ from the ones
+        given by PRONOTE, for example when a teacher changed the average of a subject.
+
+    Example:
+
+    .. code-block:: python
+
+        from pronotepy.frames import GradeFrame
+
+        frame = GradeFrame(client.current_period.grades)
+        print(frame.overall_average())
+
+    Args:
+        grades (Sequence[Grade]): the grades, usually :attr:`Period.grades`
+
+    Attributes:
+        subjects (List[Subject]): the subjects of the grades, in order of appearance
+        subject_index (numpy.ndarray): for each grade, index of its subject in ``subjects``
+        value (numpy.ndarray): the grades, NaN when not counted
+        out_of (numpy.ndarray): what the grades are out of
+        coefficient (numpy.ndarray): coefficients of the grades
+        is_bonus (numpy.ndarray)
+        is_optionnal (numpy.ndarray)
+        is_out_of_20 (numpy.ndarray)
+    """
+
+    def __init__(self, grades: Sequence[Grade]) -> None:
+        self.subjects: List[Subject] = []
+        positions: Dict[str, int] = {}
+        subject_index = []
+        for g in grades:
+            position = positions.get(g.subject.id)
+            if position is None:
+                position = positions[g.subject.id] = len(self.subjects)
+                self.subjects.append(g.subject)
+            subject_index.append(position)
+        self._positions = positions
+
+        self.subject_index = np.array(subject_index, dtype=np.intp)
+        self.value = np.array([g.grade_value for g in grades], dtype=float)
+        self.out_of = np.array([g.out_of_value for g in grades], dtype=float)
+        self.coefficient = np.array([g.coefficient_value for g in grades], dtype=float)
+        self.is_bonus = np.array([g.is_bonus for g in grades], dtype=bool)
+        self.is_optionnal = np.array([g.is_optionnal for g in grades], dtype=bool)
+        self.is_out_of_20 = np.array([g.is_out_of_20 for g in grades], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Grades out of 20, their weight, and which ones are counted"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            on_20 = self.value / self.out_of * 20
+            weight = np.where(
+                self.is_out_of_20, self.coefficient, self.coefficient * self.out_of / 20
+            )
+        counted = np.isfinite(on_20) & np.isfinite(weight) & (weight > 0)
+        return on_20, weight, counted
+
+    def _totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted sum of the points and total weight of each subject, without optional grades"""
+        on_20, weight, counted = self._columns()
+        n = len(self.subjects)
+        regular = counted & ~self.is_bonus & ~self.is_optionnal
+        bonus = counted & self.is_bonus
+
+        subjects = self.subject_index
+        points = np.bincount(
+            subjects[regular], (weight * on_20)[regular], minlength=n
+        ) + np.bincount(
+            subjects[bonus], (weight * np.maximum(on_20 - 10, 0))[bonus], minlength=n
+        )
+        weights = np.bincount(subjects[regular], weight[regular], minlength=n)
+        return points, weights
+
+    def _optional(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Optional grades sorted by subject and from best to worst, as the subject of
+        each one and the cumulated points and weights of the subject's best ones
+        """
+        on_20, weight, counted = self._columns()
+        optional = counted & self.is_optionnal & ~self.is_bonus
+        subjects, on_20, weight = (
+            self.subject_index[optional],
+            on_20[optional],
+            weight[optional],
+        )
+        order = np.lexsort((-on_20, subjects))
+        subjects, on_20, weight = subjects[order], on_20[order], weight[order]
+
+        points = np.cumsum(weight * on_20)
+        weights = np.cumsum(weight)
+        if len(subjects):
+            # restart the sums at the first grade of every subject
+            starts = np.flatnonzero(np.r_[True, subjects[1:] != subjects[:-1]])
+            counts = np.diff(np.r_[starts, len(subjects)])
+            points -= np.repeat(points[starts] - (weight * on_20)[starts], counts)
+            weights -= np.repeat(weights[starts] - weight[starts], counts)
+        return subjects, points, weights
+
+    def _subject_averages(self) -> np.ndarray:
+        points, weights = self._totals()
+        subjects, optional_points, optional_weights = self._optional()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages = np.where(weights > 0, points / weights, math.nan)
+            # optional grades are taken from the best while they raise the average,
+            # which gives the best of the averages with the first k of them
+            np.fmax.at(
+                averages,
+                subjects,
+                (points[subjects] + optional_points)
+                / (weights[subjects] + optional_weights),
+            )
+        return averages
+
+    def _subject_coefficients(
+        self, subject_coefficients: Optional[Mapping[str, float]]
+    ) -> np.ndarray:
+        if not subject_coefficients:
+            return np.ones(len(self.subjects))
+        return np.array(
+            [subject_coefficients.get(s.id, 1.0) for s in self.subjects], dtype=float
+        )
+
+    @staticmethod
+    def _overall(averages: np.ndarray, coefficients: np.ndarray) -> np.ndarray:
+        """Weighted means over the last axis of ``averages``, skipping NaN"""
+        coefficients = np.where(np.isnan(averages), 0.0, coefficients)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.nansum(averages * coefficients, axis=-1) / coefficients.sum(
+                axis=-1
+            )
+
+    def subject_averages(self) -> Dict[str, float]:
+        """
+        Averages out of 20 of every subject
+
+        Returns:
+            Dict[str, float]: average by subject id, NaN for a subject without counted grades
+        """
+        return {s.id: float(a) for s, a in zip(self.subjects, self._subject_averages())}
+
+    def overall_average(
+        self, subject_coefficients: Optional[Mapping[str, float]] = None
+    ) -> float:
+        """
+        Overall average out of 20
+
+        Args:
+            subject_coefficients (Optional[Mapping[str, float]]): coefficient of the subjects
+                by id, 1 for the missing ones
+        Returns:
+            float: the average, NaN if no grade is counted
+        """
+        return float(
+            self._overall(
+                self._subject_averages(),
+                self._subject_coefficients(subject_coefficients),
+            )
+        )
+
+    def what_if(
+        self,
+        subject: Union[Subject, str],
+        values: Union[Sequence[float], np.ndarray],
+        out_of: float = 20,
+        coefficient: float = 1,
+        is_out_of_20: bool = False,
+        subject_coefficients: Optional[Mapping[str, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulates many hypothetical grades at once, each one added alone to the current ones.
+
+        Example: which grade is needed in maths to reach 12 overall?
+
+        .. code-block:: python
+
+            values = numpy.arange(0, 20.5, 0.5)
+            _, overall = frame.what_if(maths, values)
+            needed = values[overall >= 12]
+
+        Args:
+            subject (Union[Subject, str]): subject (or its id) of the hypothetical grades
+            values (Union[Sequence[float], numpy.ndarray]): the hypothetical grades
+            out_of (float): what the hypothetical grades are out of
+            coefficient (float): their coefficient
+            is_out_of_20 (bool): if they are brought back to 20
+            subject_coefficients (Optional[Mapping[str, float]]): see :meth:`overall_average`
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: the subject averages and overall averages
+                with each of the hypothetical grades
+        """
+        subject_id = subject if isinstance(subject, str) else subject.id
+        on_20 = np.asarray(values, dtype=float) / out_of * 20
+        weight = coefficient if is_out_of_20 else coefficient * out_of / 20
+
+        averages = self._subject_averages()
+        coefficients = self._subject_coefficients(subject_coefficients)
+        points, weights = self._totals()
+        subjects, optional_points, optional_weights = self._optional()
+
+        position = self._positions.get(subject_id)
+        if position is None:
+            # a subject without grades yet
+            position = len(averages)
+            averages = np.append(averages, math.nan)
+            coefficients = np.append(
+                coefficients, (subject_coefficients or {}).get(subject_id, 1.0)
+            )
+            points, weights = np.append(points, 0.0), np.append(weights, 0.0)
+        mine = subjects == position
+
+        scenario_points = points[position] + weight * on_20
+        scenario_weights = weights[position] + weight
+        with np.errstate(divide="ignore", invalid="ignore"):
+            subject_average = np.where(
+                scenario_weights > 0, scenario_points / scenario_weights, math.nan
+            )
+            if mine.any():
+                subject_average = np.fmax(
+                    subject_average,
+                    np.max(
+                        (scenario_points[..., None] + optional_points[mine])
+                        / (scenario_weights[..., None] + optional_weights[mine]),
+                        axis=-1,
+                    ),
+                )
+
+        # every scenario only changes the average of the simulated subject
+        scenarios = np.broadcast_to(averages, subject_average.shape + averages.shape)
+        scenarios = scenarios.copy()
+        scenarios[..., position] = subject_average
+        return subject_average, self._overall(scenarios, coefficients)
@@ -0,0 +1,278 @@
+"""
+Hibernation of idle clients.
+
+A logged in client keeps a :class:`requests.Session`, what it uses of the
+``FonctionParametres`` and ``ParametresUtilisateur`` responses (the whole responses
+unless ``compact``) and the derived objects in memory. :func:`hibernate` turns its
+session (keys, request number, cookies and these responses) into JSON data, and :func:`wake` makes a client of it again without sending any
+request. If the PRONOTE session expired in the meantime, the first request of the
+woken client fails and the client logs in again, as any client does.
+
+The password is not part of the state: it is given again to :func:`wake`, except the
+token of the ``token`` and ``qr_code`` modes, which changes at every login.
+
+:class:`.ClientPool` uses it to keep only its most recently used clients in memory,
+see its ``max_live`` argument.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy import Client
+    from pronotepy.hibernation import hibernate, wake
+
+    state = hibernate(client)
+    del client
+    ...
+    client = wake(Client, state, password=password)
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar, Union
+
+from . import dataClasses
+from .clients import ClientBase, ParentClient, VieScolaireClient
+from .ent.cache import _dump_cookies, _load_cookies
+from .pronoteAPI import _Communication, _Encryption
+
+__all__ = ("hibernate", "wake", "HibernationStore")
+
+log = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=ClientBase)
+
+_VERSION = 2
+
+
+def _class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _dump_encryption(encryption: _Encryption) -> dict:
+    return {
+        "aes_iv": encryption.aes_iv.hex(),
+        "aes_iv_temp": encryption.aes_iv_temp.hex(),
+        "aes_key": encryption.aes_key.hex(),
+        "rsa_keys": encryption.rsa_keys,
+    }
+
+
+def _load_encryption(state: dict) -> _Encryption:
+    encryption = _Encryption()
+    encryption.aes_iv = bytes.fromhex(state["aes_iv"])
+    encryption.aes_iv_temp = bytes.fromhex(state["aes_iv_temp"])
+    encryption.aes_key = bytes.fromhex(state["aes_key"])
+    encryption.rsa_keys = state["rsa_keys"]
+    return encryption
+
+
+def hibernate(client: ClientBase) -> dict:
+    """
+    The session of a logged in client, as JSON data. The client must not be used
+    while hibernating it.
+
+    .. warning:: The state gives access to the account while the session is valid,
+        store it privately.
+
+    Args:
+        client (ClientBase): a logged in client
+    Returns:
+        dict: state for :func:`wake`
+    """
+    communication = client.communication
+    last_connection = getattr(client, "last_connection", None)
+    state = {
+        "version": _VERSION,
+        "class": _class_name(type(client)),
+        "pronote_url": client.pronote_url,
+        "username": client.username,
+        "uuid": client.uuid,
+        "login_mode": client.login_mode,
+        "client_identifier": client.client_identifier,
+        "communication": {
+            "root_site": communication.root_site,
+            "html_page": communication.html_page,
+            "attributes": communication.attributes,
+            "request_number": communication.request_number,
+            "authorized_onglets": communication.authorized_onglets,
+            "compress_requests": communication.compress_requests,
+            "encrypt_requests": communication.encrypt_requests,
+            "last_ping": communication.last_ping,
+            "encryption": _dump_encryption(communication.encryption),
+            "cookies": (
+                None
+                if communication.cookies is None
+                else _dump_cookies(communication.cookies)
+            ),
+            "session_cookies": _dump_cookies(communication.session.cookies),
+        },
+        "aes_iv": client.encryption.aes_iv.hex(),
+        "aes_key": client.encryption.aes_key.hex(),
+        "attributes": client.attributes,
+        "compact": client.compact,
+        "general": {
+            "start_day": client.start_day.isoformat(),
+            "last_day": client._last_day.isoformat(),
+            "version": client._pronote_version,
+            "periods": client._period_jsons,
+            "start_times": client._start_times.dump(),
+            "end_times": client._end_times.dump(),
+        },
+        "func_options": client.func_options,
+        "parametres_utilisateur": client.parametres_utilisateur,
+        "auth_cookie": client.auth_cookie,
+        # a ParentClient puts the selected child in parametres_utilisateur
+        "resource": client.info.raw_resource if client.logged_in else None,
+        "logged_in": client.logged_in,
+        "last_connection": last_connection and last_connection.isoformat(),
+    }
+    if client.login_mode != "normal":
+        # the token of the last login, the one given to the client is used up
+        state["password"] = client.password
+    if isinstance(client, ParentClient):
+        state["child"] = client._selected_child.id
+    if isinstance(client, VieScolaireClient) and client.logged_in:
+        state["classes"] = client._class_jsons
+    return state
+
+
+def wake(client_class: Type[C], state: dict, **account: Any) -> C:
+    """
+    Makes a client of the state of :func:`hibernate`, without sending any request
+
+    Args:
+        client_class (Type[ClientBase]): class of the hibernated client
+        state (dict): the state
+        **account: keyword arguments of ``client_class`` that are not in the state:
+            ``password``, ``ent``, ``ent_cache``, ``response_cache``, ``account_pin``,
+            ``device_name``
+    Raises:
+        ValueError: if the state is not from this version of pronotepy or of another
+            client class
+    Returns:
+        ClientBase: the client
+    """
+    if state.get("version") != _VERSION:
+        raise ValueError(
+            f"unsupported hibernation state version {state.get('version')}"
+        )
+    if state["class"] != _class_name(client_class):
+        raise ValueError(f"the state is of a {state['class']}, not a {client_class}")
+
+    client = client_class.__new__(client_class)
+    client.ent = account.get("ent")
+    client.ent_cache = account.get("ent_cache")
+    client.response_cache = account.get("response_cache")
+    client.uuid = state["uuid"]
+    client.login_mode = state["login_mode"]
+    client.username = state["username"]
+    client.password = state.get("password", account.get("password", ""))
+    client.pronote_url = state["pronote_url"]
+    client.account_pin = account.get("account_pin")
+    client.client_identifier = state["client_identifier"]
+    client.device_name = account.get("device_name")
+    client.compact = state["compact"]
+
+    saved = state["communication"]
+    cookies = saved["cookies"]
+    communication = _Communication(
+        client.pronote_url, None if cookies is None else _load_cookies(cookies)
+    )
+    communication.root_site = saved["root_site"]
+    communication.html_page = saved["html_page"]
+    communication.attributes = saved["attributes"]
+    communication.request_number = saved["request_number"]
+    communication.authorized_onglets = saved["authorized_onglets"]
+    communication.compress_requests = saved["compress_requests"]
+    communication.encrypt_requests = saved["encrypt_requests"]
+    communication.last_ping = saved["last_ping"]
+    communication.encryption = _load_encryption(saved["encryption"])
+    communication.session.cookies.update(_load_cookies(saved["session_cookies"]))
+    client.communication = communication
+
+    client.attributes = state["attributes"]
+    client.func_options = state["func_options"]
+    general = state["general"]
+    client.start_day = datetime.date.fromisoformat(general["start_day"])
+    client._last_day = datetime.date.fromisoformat(general["last_day"])
+    client._pronote_version = general["version"]
+    client._period_jsons = general["periods"]
+    client._start_times = dataClasses._TimeGrid.load(general["start_times"])
+    client._end_times = dataClasses._TimeGrid.load(general["end_times"])
+    client._init_state()
+    client.encryption.aes_iv = bytes.fromhex(state["aes_iv"])
+    client.encryption.aes_key = bytes.fromhex(state["aes_key"])
+    client.parametres_utilisateur = state["parametres_utilisateur"]
+    client.auth_cookie = state["auth_cookie"]
+    client.logged_in = state["logged_in"]
+    client._expired = False
+    last_connection = state["last_connection"]
+    client.last_connection = last_connection and datetime.datetime.fromisoformat(
+        last_connection
+    )
+    if client.logged_in:
+        client.info = dataClasses.ClientInfo(client, state["resource"])
+        if isinstance(client, VieScolaireClient):
+            client._class_jsons = state["classes"]
+        client._init_account()
+        if isinstance(client, ParentClient):
+            child = client.children.get(state["child"])
+            if child is not None:
+                client.set_child(child)
+    return client
+
+
+class HibernationStore:
+    """
+    Hibernated clients kept in a directory, one file per account. The files are only
+    readable by their owner.
+
+    Args:
+        directory (Union[str, os.PathLike]): directory of the store, created if needed
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, pronote_url: str, username: str) -> Path:
+        key = f"{pronote_url}|{username}".encode()
+        return self.directory / f"{hashlib.sha256(key).hexdigest()}.json"
+
+    def save(self, pronote_url: str, username: str, state: dict) -> None:
+        """Stores the state of :func:`hibernate` of an account, replacing its previous one"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self._path(pronote_url, username))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def pop(self, pronote_url: str, username: str) -> Optional[dict]:
+        """
+        Removes the state of an account from the store
+
+        Returns:
+            Optional[dict]: the state, None if missing or unreadable
+        """
+        path = self._path(pronote_url, username)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            log.warning("Ignoring a corrupted hibernated client")
+            state = None  # type: ignore[assignment]
+        path.unlink()
+        return state
@@ -0,0 +1,365 @@
+"""
+Running work for many accounts at once.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy import Client
+    from pronotepy.pool import ClientPool
+
+    accounts = [
+        {"pronote_url": url, "username": username, "password": password}
+        for url, username, password in rows
+    ]
+    with ClientPool(Client, max_workers=32, max_per_host=4) as pool:
+        for account, homework in pool.map(lambda c: c.homework(today), accounts):
+            ...
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import time
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+from . import hibernation
+from .clients import ClientBase
+
+__all__ = ("ClientPool",)
+
+log = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=ClientBase)
+R = TypeVar("R")
+
+Account = Mapping[str, Any]
+
+# same delay as pronoteAPI._KeepAlive
+_KEEP_ALIVE_DELAY = 110
+
+
+class _SharedAdapter(HTTPAdapter):
+    """
+    Adapter of the sessions of every client of a pool. Closing a session, as a
+    refresh of its client does, does not close it: :meth:`ClientPool.close` does.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def close_shared(self) -> None:
+        super().close()
+
+
+class ClientPool(Generic[C]):
+    """
+    Logged in clients of many accounts and a bounded pool of workers using them.
+
+    An account is a mapping of the keyword arguments of ``client_class`` (at least
+    ``pronote_url``, ``username`` and ``password``, and ``ent``, ``mode``... if
+    needed). Its client logs in on its first use and is then kept; refreshing an
+    expired session is done by the client itself. Logins also go through
+    :data:`pronotepy.scheduler.login_scheduler`.
+
+    A client is used by one worker at a time, at most ``max_per_host`` workers use
+    clients of the same PRONOTE host at once (in every call of :meth:`map`
+    together), and the clients share their keep-alive HTTP connections. With ``keep_alive``, one thread of the pool keeps
+    the sessions of idle clients alive.
+
+    With ``max_live``, only the most recently used clients are kept in memory, the
+    others are hibernated in ``hibernation_dir`` (see :mod:`pronotepy.hibernation`)
+    and woken up on their next use, logging in again only if their session expired.
+
+    Args:
+        client_class (Type[ClientBase]): class of the clients, :class:`.Client` for students
+        max_workers (int): maximum number of accounts worked on at once
+        max_per_host (int): maximum number of accounts worked on at once for a PRONOTE host
+        keep_alive (bool): keep the sessions of idle clients alive
+        max_live (Optional[int]): maximum number of clients kept in memory, every
+            client if None
+        hibernation_dir (Optional[Union[str, os.PathLike]]): directory of the
+            hibernated clients, a temporary directory removed by :meth:`close` if None
+    """
+
+    def __init__(
+        self,
+        client_class: Type[C],
+        max_workers: int = 16,
+        max_per_host: int = 4,
+        keep_alive: bool = False,
+        max_live: Optional[int] = None,
+        hibernation_dir: Optional[Union[str, os.PathLike]] = None,
+    ) -> None:
+        self.client_class = client_class
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.max_live = max_live
+
+        self._store: Optional[hibernation.HibernationStore] = None
+        self._store_tmp: Optional[tempfile.TemporaryDirectory] = None
+        if max_live is not None:
+            if hibernation_dir is None:
+                self._store_tmp = tempfile.TemporaryDirectory(prefix="pronotepy-")
+                hibernation_dir = self._store_tmp.name
+            self._store = hibernation.HibernationStore(hibernation_dir)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pronotepy-pool"
+        )
+        self._adapter = _SharedAdapter(
+            pool_connections=max_workers, pool_maxsize=max_per_host
+        )
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[Tuple[str, str], C]" = OrderedDict()
+        self._client_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._hibernating = threading.Lock()
+
+        self._closed = threading.Event()
+        self._keep_alive: Optional[threading.Thread] = None
+        if keep_alive:
+            self._keep_alive = threading.Thread(
+                target=self._keep_alive_loop,
+                name="pronotepy-pool-keep-alive",
+                daemon=True,
+            )
+            self._keep_alive.start()
+
+    @staticmethod
+    def _key(account: Account) -> Tuple[str, str]:
+        return account["pronote_url"], account.get("username", "")
+
+    @staticmethod
+    def _host(account: Account) -> str:
+        return urlparse(account["pronote_url"]).netloc
+
+    def _client_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._client_locks.setdefault(key, threading.Lock())
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.Semaphore(self.max_per_host)
+            return slot
+
+    def _share_connections(self, client: C) -> None:
+        session = client.communication.session
+        # a refresh gives the client a new session
+        if session.adapters.get("https://") is not self._adapter:
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+
+    def _get_client(self, account: Account) -> C:
+        # caller holds the lock of the account
+        key = self._key(account)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+        if client is None:
+            client = self._wake(account)
+            if client is None:
+                client = self.client_class(**account)
+            with self._lock:
+                self._clients[key] = client
+            self._hibernate_idle()
+        self._share_connections(client)
+        return client
+
+    def _wake(self, account: Account) -> Optional[C]:
+        if self._store is None:
+            return None
+        state = self._store.pop(*self._key(account))
+        if state is None:
+            return None
+        try:
+            return hibernation.wake(self.client_class, state, **account)
+        except Exception:
+            log.exception("could not wake the client of %s", account["pronote_url"])
+            return None
+
+    def _hibernate_idle(self) -> None:
+        """Hibernates the least recently used idle clients above ``max_live``"""
+        if self._store is None or self.max_live is None:
+            return
+        with self._hibernating:
+            with self._lock:
+                candidates = list(self._clients.items())
+            excess = len(candidates) - self.max_live
+            for key, client in candidates:
+                if excess <= 0:
+                    return
+                lock = self._client_lock(key)
+                # a busy client is not idle, the caller holds the lock of its client
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    try:
+                        state = hibernation.hibernate(client)
+                        self._store.save(*key, state)
+                    except Exception:
+                        log.exception("could not hibernate the client of %s", key[0])
+                        continue
+                    # the session is not closed, it uses the adapter of the pool
+                    with self._lock:
+                        del self._clients[key]
+                    excess -= 1
+                finally:
+                    lock.release()
+
+    def client(self, account: Account) -> C:
+        """
+        The client of an account, logged in if needed
+
+        .. warning:: The client may be used by a worker of the pool at the same time.
+            With ``max_live``, it may also be hibernated and replaced by another one.
+
+        Args:
+            account (Mapping[str, Any]): keyword arguments of ``client_class``
+        """
+        with self._client_lock(self._key(account)):
+            return self._get_client(account)
+
+    def _run(self, fn: Callable[[C], R], account: Account) -> R:
+        try:
+            # map() calls share the limit of the host
+            with self._host_slot(self._host(account)):
+                with self._client_lock(self._key(account)):
+                    return fn(self._get_client(account))
+        finally:
+            # the clients kept above max_live while busy are idle now
+            self._hibernate_idle()
+
+    def map(
+        self,
+        fn: Callable[[C], R],
+        accounts: Iterable[Account],
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[Account, Any]]:
+        """
+        Calls ``fn`` with the client of every account, giving the results as soon as
+        they are ready (not in the order of ``accounts``)
+
+        Args:
+            fn (Callable[[ClientBase], R]): the work to do for an account
+            accounts (Iterable[Mapping[str, Any]]): the accounts
+            return_exceptions (bool): give the exception raised for an account
+                (login failure included) as its result, instead of raising it
+        Returns:
+            Iterator[Tuple[Mapping[str, Any], R]]: the accounts and their results
+        """
+        pending: Dict[str, Deque[Account]] = {}
+        for account in accounts:
+            pending.setdefault(self._host(account), deque()).append(account)
+        running: Dict[str, int] = {host: 0 for host in pending}
+        futures: Dict[Future, Tuple[str, Account]] = {}
+
+        def submit() -> None:
+            # round robin between the hosts, so that one host does not take every worker
+            progress = True
+            while progress and len(futures) < self.max_workers:
+                progress = False
+                for host, queue in pending.items():
+                    if (
+                        queue
+                        and running[host] < self.max_per_host
+                        and len(futures) < self.max_workers
+                    ):
+                        account = queue.popleft()
+                        futures[self._executor.submit(self._run, fn, account)] = (
+                            host,
+                            account,
+                        )
+                        running[host] += 1
+                        progress = True
+
+        try:
+            submit()
+            while futures:
+                done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, account = futures.pop(future)
+                    running[host] -= 1
+                    submit()
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if not return_exceptions:
+                            raise
+                        result = e
+                    yield account, result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _keep_alive_loop(self) -> None:
+        while not self._closed.wait(1):
+            with self._lock:
+                clients = list(self._clients.items())
+            for key, client in clients:
+                if self._closed.is_set():
+                    return
+                if time() - client.communication.last_ping < _KEEP_ALIVE_DELAY:
+                    continue
+                lock = self._client_lock(key)
+                # a busy client is not idle
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    client.post("Navigation", 7, {"onglet": 7, "ongletPrec": 7})
+                except Exception:
+                    log.exception("keep alive failed for %s", key[0])
+                finally:
+                    lock.release()
+
+    def close(self) -> None:
+        """Stops the workers and the keep-alive, and closes the sessions of the clients"""
+        self._closed.set()
+        self._executor.shutdown(wait=True)
+        if self._keep_alive is not None:
+            self._keep_alive.join()
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.communication.session.close()
+        self._adapter.close_shared()
+        if self._store_tmp is not None:
+            self._store_tmp.cleanup()
+
+    def __enter__(self) -> "ClientPool[C]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -55,6 +55,7 @@ class _Communication(object):
         self.compress_requests = False
         self.encrypt_requests = False
         self.last_response: Response
+        self._lock = threading.Lock()
 
     def initialise(self, client_identifier: Optional[str] = None) -> Tuple[Any, Any]:
         """
@@ -149,25 +150,29 @@ class _Communication(object):
                     self.encryption.aes_encrypt(bytes.fromhex(post_data)).hex().upper()
                 )
 
-        # creating the full json dict
-        r_number = self.encryption.aes_encrypt(str(self.request_number).encode()).hex()
-        json = {
-            "session": int(self.attributes["h"]),
-            "no": r_number,
-            "id": function_name,
-            "dataSec": post_data,
-        }
-        log.debug("[_Communication.post] sending post request: %s", json)
-
-        p_site = f'{self.root_site}/appelfonction/{self.attributes["a"]}/{self.attributes["h"]}/{r_number}'
-
-        response: Response = self.session.request(
-            "POST", p_site, json=json, cookies=self.cookies
-        )
+        # the server expects the request numbers in order, one request at a time
+        with self._lock:
+            # creating the full json dict
+            r_number = self.encryption.aes_encrypt(
+                str(self.request_number).encode()
+            ).hex()
+            json = {
+                "session": int(self.attributes["h"]),
+                "no": r_number,
+                "id": function_name,
+                "dataSec": post_data,
+            }
+            log.debug("[_Communication.post] sending post request: %s", json)
+
+            p_site = f'{self.root_site}/appelfonction/{self.attributes["a"]}/{self.attributes["h"]}/{r_number}'
+
+            response: Response = self.session.request(
+                "POST", p_site, json=json, cookies=self.cookies
+            )
 
-        self.request_number += 2
-        self.last_ping = int(time())
-        self.last_response = response
+            self.request_number += 2
+            self.last_ping = int(time())
+            self.last_response = response
 
         # error protection
         if not response.ok:
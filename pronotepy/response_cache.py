@@ -0,0 +1,163 @@
+"""
+Cache of the responses of the read requests of the clients.
+
+A client given a :class:`ResponseCache` reuses the response of a read request (the
+grades, timetable, homework of a week...) while it is younger than the time to live
+of its function, instead of sending the request again. The requests changing data
+invalidate the responses they change, see :data:`INVALIDATIONS`.
+
+The responses are kept as JSON text and every hit decodes its own copy, so a caller
+changing its response does not change the responses of the next callers.
+
+A cache can be shared by many clients: the responses are kept by account, and at
+most ``max_entries`` of them are kept in total, the least recently used ones are
+dropped first.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy import Client
+    from pronotepy.response_cache import ResponseCache
+
+    cache = ResponseCache({"PageEmploiDuTemps": 3600}, max_entries=10_000)
+    client = Client(url, username, password, response_cache=cache)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+__all__ = ("ResponseCache", "DEFAULT_TTLS", "INVALIDATIONS")
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "DernieresNotes": 300,
+    "PagePresence": 300,
+    "PageCahierDeTexte": 300,
+    "PageEmploiDuTemps": 600,
+    "ListeMessagerie": 60,
+    "PageActualites": 300,
+    "PageMenus": 3600,
+    "PageEquipePedagogique": 3600,
+}
+"""Time to live in seconds of the responses of every cached function"""
+
+INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "SaisieTAFFaitEleve": ("PageCahierDeTexte",),
+    "SaisieActualites": ("PageActualites",),
+    "SaisieMessage": ("ListeMessagerie", "ListeMessages"),
+}
+"""Functions whose responses are dropped after a request of a writing function"""
+
+# (pronote_url, username) of the client
+Account = Tuple[str, str]
+_Key = Tuple[Account, str, str]
+
+
+class ResponseCache:
+    """
+    Responses of read requests, kept for the time to live of their function
+
+    Args:
+        ttls (Optional[Mapping[str, float]]): time to live in seconds by function
+            name, replacing the ones of :data:`DEFAULT_TTLS`. A function with a time
+            to live of 0 is not cached. Only the read functions of
+            ``pronotepy.clients.COALESCED_FUNCTIONS`` can be cached.
+        max_entries (int): maximum number of responses kept
+        clock (Callable[[], float]): monotonic clock in seconds
+
+    Attributes:
+        hits (int): number of requests answered by the cache
+        misses (int): number of cacheable requests sent to PRONOTE
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[_Key, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def caches(self, function_name: str) -> bool:
+        """If the responses of ``function_name`` are cached"""
+        return self.ttls.get(function_name, 0) > 0
+
+    def get(self, account: Account, function_name: str, request: str) -> Optional[dict]:
+        """
+        Args:
+            account (Tuple[str, str]): PRONOTE URL and username of the client
+            function_name (str)
+            request (str): JSON of the signature and data of the request
+        Returns:
+            Optional[dict]: a copy of the response, None if missing or expired
+        """
+        if not self.caches(function_name):
+            return None
+        key = (account, function_name, request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        result: dict = json.loads(entry[1])
+        return result
+
+    def set(
+        self, account: Account, function_name: str, request: str, response: dict
+    ) -> None:
+        """Keeps the response of a request, see :meth:`get`"""
+        if not self.caches(function_name):
+            return
+        key = (account, function_name, request)
+        text = json.dumps(response)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttls[function_name], text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, account: Account, *function_names: str) -> None:
+        """
+        Drops the responses of an account
+
+        Args:
+            account (Tuple[str, str]): PRONOTE URL and username of the client
+            *function_names (str): functions whose responses are dropped, every
+                function if none
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == account and (
+                    not function_names or key[1] in function_names
+                ):
+                    del self._entries[key]
+
+    def written(self, account: Account, function_name: str) -> None:
+        """Drops the responses changed by a request of ``function_name``"""
+        functions = INVALIDATIONS.get(function_name)
+        if functions:
+            self.invalidate(account, *functions)
+
+    def clear(self) -> None:
+        """Drops every response"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,252 @@
+"""
+Admission control of the logins of a process.
+
+PRONOTE suspends the IP address of a client logging in too many accounts too fast,
+and ENTs do the same. Every client of the process waits for a slot of
+:data:`login_scheduler` before logging in: at most ``max_concurrent`` logins run at the
+same time for a PRONOTE host or an ENT domain, and at most ``per_minute`` of them
+start in a minute. The other logins wait in a queue, served in order.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy.scheduler import login_scheduler
+
+    login_scheduler.configure(max_concurrent=2, per_minute=20)
+    # a stricter ENT
+    login_scheduler.configure("ent:cas.example.fr", per_minute=5)
+
+    ...  # create clients from many threads
+
+    print(login_scheduler.stats())
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+__all__ = ("LoginScheduler", "login_scheduler")
+
+_WINDOW = 60.0
+
+
+def _check_limits(max_concurrent: Optional[int], per_minute: Optional[int]) -> None:
+    if max_concurrent is not None and max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, not {max_concurrent}")
+    if per_minute is not None and per_minute < 1:
+        raise ValueError(f"per_minute must be at least 1, not {per_minute}")
+
+
+class _Key:
+    """State of the logins of a key"""
+
+    def __init__(self, max_concurrent: int, per_minute: int) -> None:
+        self.max_concurrent = max_concurrent
+        self.per_minute = per_minute
+        self.active = 0
+        self.queue: Deque[object] = deque()
+        self.starts: Deque[float] = deque()
+        self.suspended_until = 0.0
+        self.logins = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class LoginScheduler:
+    """
+    Limits the logins of every key (a PRONOTE host or an ENT domain)
+
+    Args:
+        max_concurrent (int): maximum number of logins running at once for a key
+        per_minute (int): maximum number of logins started in any minute for a key
+        clock (Callable[[], float]): monotonic clock in seconds
+    Raises:
+        ValueError: if a limit is less than 1
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        per_minute: int = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _check_limits(max_concurrent, per_minute)
+        self.max_concurrent = max_concurrent
+        self.per_minute = per_minute
+        self._clock = clock
+        self._limits: Dict[str, tuple] = {}
+        self._keys: Dict[str, _Key] = {}
+        self._condition = threading.Condition()
+
+    def configure(
+        self,
+        key: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        per_minute: Optional[int] = None,
+    ) -> None:
+        """
+        Changes the limits of a key, or the default ones of the keys without their own
+
+        Args:
+            key (Optional[str]): a key as in :meth:`stats`, None for the defaults
+            max_concurrent (Optional[int]): unchanged if None
+            per_minute (Optional[int]): unchanged if None
+        Raises:
+            ValueError: if a limit is less than 1
+        """
+        _check_limits(max_concurrent, per_minute)
+        with self._condition:
+            if key is None:
+                if max_concurrent is not None:
+                    self.max_concurrent = max_concurrent
+                if per_minute is not None:
+                    self.per_minute = per_minute
+                keys = [k for k in self._keys if k not in self._limits]
+            else:
+                current = self._limits.get(key, (None, None))
+                self._limits[key] = (
+                    current[0] if max_concurrent is None else max_concurrent,
+                    current[1] if per_minute is None else per_minute,
+                )
+                keys = [key] if key in self._keys else []
+            for k in keys:
+                self._apply_limits(k, self._keys[k])
+            self._condition.notify_all()
+
+    def _apply_limits(self, key: str, state: _Key) -> None:
+        max_concurrent, per_minute = self._limits.get(key, (None, None))
+        state.max_concurrent = (
+            self.max_concurrent if max_concurrent is None else max_concurrent
+        )
+        state.per_minute = self.per_minute if per_minute is None else per_minute
+
+    def _state(self, key: str) -> _Key:
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _Key(self.max_concurrent, self.per_minute)
+            self._apply_limits(key, state)
+        return state
+
+    def _delay(self, state: _Key, now: float) -> Optional[float]:
+        """Time before the head of the queue can start, None if unknown (a login must end)"""
+        while state.starts and state.starts[0] <= now - _WINDOW:
+            state.starts.popleft()
+        delays = [0.0, state.suspended_until - now]
+        if len(state.starts) >= state.per_minute:
+            delays.append(state.starts[-state.per_minute] + _WINDOW - now)
+        if state.active >= state.max_concurrent:
+            return None
+        return max(delays)
+
+    @contextmanager
+    def slot(self, key: str, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Waits for the turn of a login of ``key``, then runs it
+
+        Args:
+            key (str): PRONOTE host or ENT domain, see :meth:`pronote_key` and :meth:`ent_key`
+            timeout (Optional[float]): maximum time to wait in seconds
+        Raises:
+            TimeoutError: if the login did not start before ``timeout``
+        """
+        ticket = object()
+        with self._condition:
+            state = self._state(key)
+            state.queue.append(ticket)
+            start = self._clock()
+            deadline = None if timeout is None else start + timeout
+            try:
+                while True:
+                    now = self._clock()
+                    if state.queue[0] is ticket:
+                        delay = self._delay(state, now)
+                        if delay is not None and delay <= 0:
+                            break
+                    else:
+                        delay = None
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            raise TimeoutError(f"no login slot for {key}")
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._condition.wait(delay)
+            finally:
+                state.queue.remove(ticket)
+                # the next login may be able to start too
+                self._condition.notify_all()
+
+            wait = now - start
+            state.active += 1
+            state.starts.append(now)
+            state.logins += 1
+            state.total_wait += wait
+            state.max_wait = max(state.max_wait, wait)
+        try:
+            yield
+        finally:
+            with self._condition:
+                state.active -= 1
+                self._condition.notify_all()
+
+    def suspend(self, key: str, seconds: float) -> None:
+        """
+        Starts no login of ``key`` for ``seconds``, after the server suspended the client
+
+        Args:
+            key (str)
+            seconds (float)
+        """
+        with self._condition:
+            state = self._state(key)
+            state.suspended_until = max(state.suspended_until, self._clock() + seconds)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Metrics of every key: ``active`` logins, logins ``waiting`` in the queue, number
+        of ``logins`` started, and their ``total_wait`` and ``max_wait`` in seconds
+
+        Returns:
+            Dict[str, Dict[str, float]]: metrics by key
+        """
+        with self._condition:
+            return {
+                key: {
+                    "active": s.active,
+                    "waiting": len(s.queue),
+                    "logins": s.logins,
+                    "total_wait": s.total_wait,
+                    "max_wait": s.max_wait,
+                }
+                for key, s in self._keys.items()
+            }
+
+    @staticmethod
+    def pronote_key(pronote_url: str) -> str:
+        """Key of the logins to a PRONOTE server: ``pronote:<host>``"""
+        return f"pronote:{urlparse(pronote_url).netloc}"
+
+    @staticmethod
+    def ent_key(ent: Callable[..., Any]) -> str:
+        """
+        Key of the logins to an ENT: ``ent:<domain>`` of the ``url`` or ``domain``
+        argument of the ENT function, or ``ent:<function name>``
+        """
+        keywords: Dict[str, Any] = {}
+        while isinstance(ent, partial):
+            keywords = {**ent.keywords, **keywords}
+            ent = ent.func
+        for name in ("url", "domain"):
+            if isinstance(keywords.get(name), str):
+                return f"ent:{urlparse(keywords[name]).netloc}"
+        return f"ent:{getattr(ent, '__qualname__', type(ent).__qualname__)}"
+
+
+login_scheduler = LoginScheduler()
+"""The scheduler of the logins of every client"""
@@ -0,0 +1,243 @@
+"""
+Spreading accounts over worker processes.
+
+Decoding the responses (JSON, AES, parsing the data classes) needs CPU time and
+threads of one process share one core for it. :class:`ShardedRunner` starts worker
+processes, each one with its own :class:`.ClientPool`, and always gives an account to
+the same worker so that its client stays logged in there. Results come back as
+:mod:`.snapshot` data, which does not contain the client.
+
+``fn`` must be picklable, so a function defined at the top level of a module:
+
+.. code-block:: python
+
+    from pronotepy import Client
+    from pronotepy.sharding import ShardedRunner
+
+    def lessons(client):
+        return client.lessons(datetime.date.today())
+
+    if __name__ == "__main__":
+        with ShardedRunner(Client, processes=4) as runner:
+            for account, lessons in runner.map(lessons, accounts):
+                ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from . import snapshot
+from .clients import ClientBase
+from .pool import Account, ClientPool
+
+__all__ = ("ShardedRunner",)
+
+
+def _shard(account: Account, shards: int) -> int:
+    """Worker of an account, the same in every process and every run"""
+    key = f"{account['pronote_url']}|{account.get('username', '')}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big") % shards
+
+
+class _IndexedAccount(dict):
+    """An account with its position in the accounts of a call"""
+
+    index: int
+
+
+def _worker(
+    client_class: Type[ClientBase],
+    pool_options: Dict[str, Any],
+    tasks: Any,
+    results: Any,
+) -> None:
+    with ClientPool(client_class, **pool_options) as pool:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            call, fn, accounts = task
+            indexed = []
+            for i, a in accounts:
+                indexed_account = _IndexedAccount(a)
+                indexed_account.index = i
+                indexed.append(indexed_account)
+            for account, result in pool.map(fn, indexed, return_exceptions=True):
+                index = cast(_IndexedAccount, account).index
+                if isinstance(result, BaseException):
+                    try:
+                        pickle.dumps(result)
+                    except Exception:
+                        result = RuntimeError(repr(result))
+                    results.put((call, index, False, result))
+                else:
+                    try:
+                        data = snapshot.dumps(result)
+                    except Exception as e:
+                        results.put((call, index, False, e))
+                    else:
+                        results.put((call, index, True, data))
+
+
+class ShardedRunner:
+    """
+    Worker processes running work for many accounts
+
+    Args:
+        client_class (Type[ClientBase]): class of the clients, :class:`.Client` for students
+        processes (Optional[int]): number of worker processes, the number of CPUs by default
+        max_workers (int): ``max_workers`` of the :class:`.ClientPool` of every process
+        max_per_host (int): ``max_per_host`` of the :class:`.ClientPool` of every process
+        keep_alive (bool): ``keep_alive`` of the :class:`.ClientPool` of every process
+        mp_context (Optional[str]): :mod:`multiprocessing` start method, the default one
+            if None
+    """
+
+    def __init__(
+        self,
+        client_class: Type[ClientBase],
+        processes: Optional[int] = None,
+        max_workers: int = 16,
+        max_per_host: int = 4,
+        keep_alive: bool = False,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        self.processes = processes or os.cpu_count() or 1
+        context: Any = multiprocessing.get_context(mp_context)
+        pool_options = {
+            "max_workers": max_workers,
+            "max_per_host": max_per_host,
+            "keep_alive": keep_alive,
+        }
+        self._results = context.Queue()
+        self._tasks = [context.Queue() for _ in range(self.processes)]
+        self._workers = [
+            context.Process(
+                target=_worker,
+                args=(client_class, pool_options, tasks, self._results),
+                name=f"pronotepy-shard-{i}",
+                daemon=True,
+            )
+            for i, tasks in enumerate(self._tasks)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._lock = threading.Lock()
+        self._calls = 0
+        # results of the running calls, read from self._results by one thread at a time
+        self._reading = threading.Lock()
+        self._received: Dict[int, "queue.Queue[Tuple[int, bool, Any]]"] = {}
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        accounts: Iterable[Account],
+        return_exceptions: bool = False,
+        client: Optional[ClientBase] = None,
+        raw: bool = False,
+    ) -> Iterator[Tuple[Account, Any]]:
+        """
+        Calls ``fn`` with the client of every account in its worker process, giving the
+        results as soon as they are ready. ``map`` can be called by several threads at
+        once.
+
+        Args:
+            fn (Callable[[ClientBase], Any]): the work to do for an account, picklable,
+                returning data that :func:`.snapshot.dumps` supports
+            accounts (Iterable[Mapping[str, Any]]): the accounts
+            return_exceptions (bool): give the exception raised for an account as its
+                result, instead of raising it
+            client (Optional[ClientBase]): client to bind the results to, see
+                :func:`.snapshot.loads`
+            raw (bool): give the snapshots of the results (bytes) without loading
+                them, to store or forward them as they are
+        Returns:
+            Iterator[Tuple[Mapping[str, Any], Any]]: the accounts and their results
+        """
+        accounts = list(accounts)
+        shards: List[List[Tuple[int, Account]]] = [[] for _ in self._tasks]
+        for i, account in enumerate(accounts):
+            shards[_shard(account, self.processes)].append((i, account))
+        with self._lock:
+            self._calls += 1
+            call = self._calls
+            self._received[call] = queue.Queue()
+            for tasks, shard in zip(self._tasks, shards):
+                if shard:
+                    tasks.put((call, fn, shard))
+
+        try:
+            for _ in range(len(accounts)):
+                index, ok, payload = self._next_result(call)
+                if ok:
+                    yield accounts[index], (
+                        payload if raw else snapshot.loads(payload, client)
+                    )
+                elif return_exceptions:
+                    yield accounts[index], payload
+                else:
+                    raise payload
+        finally:
+            with self._lock:
+                del self._received[call]
+
+    def _next_result(self, call: int) -> Tuple[int, bool, Any]:
+        """Waits for a result of ``call``, giving the ones of other calls to them"""
+        received = self._received[call]
+        while True:
+            with self._reading:
+                # another thread may have read it while this one waited for the lock
+                try:
+                    return received.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    result_call, index, ok, payload = self._results.get(timeout=1)
+                except queue.Empty:
+                    if not all(w.is_alive() for w in self._workers):
+                        raise RuntimeError("a worker process of the runner died")
+                    continue
+                if result_call == call:
+                    return index, ok, payload
+                with self._lock:
+                    other = self._received.get(result_call)
+                # otherwise left over from an interrupted call
+                if other is not None:
+                    other.put((index, ok, payload))
+
+    def close(self) -> None:
+        """Stops the worker processes"""
+        for tasks in self._tasks:
+            tasks.put(None)
+        for worker in self._workers:
+            worker.join()
+
+    def __enter__(self) -> "ShardedRunner":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,396 @@
+"""
+Compact, client independent binary snapshots of data objects.
+
+Snapshots are meant for caching parsed data between polls and for handing it
+over to other processes. Unlike pickle, they never contain the client of the
+objects (which holds a session and cannot be shared) and they can only
+rebuild pronotepy data classes.
+
+Example:
+
+.. code-block:: python
+
+    from pronotepy import snapshot
+
+    data = snapshot.dumps(client.lessons(date_from, date_to))
+    ...
+    lessons = snapshot.loads(data, client)
+
+The format is a stream of tagged values packed with :mod:`struct`. Every data
+class is described once per snapshot by its name, its ``_snapshot_version`` and
+the names of its slots, objects then only contain the values. Shared objects
+(like interned subjects) and repeated strings are written once and referenced
+afterwards.
+"""
+
+from __future__ import annotations
+
+import datetime
+import struct
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from . import dataClasses
+from .dataClasses import IndexedList, Object
+from .exceptions import SnapshotError
+
+if TYPE_CHECKING:
+    from .clients import ClientBase
+
+__all__ = ("dumps", "loads")
+
+_MAGIC = b"PNS"
+_FORMAT_VERSION = 1
+
+# slots holding the session, or only meaningful while decoding
+_SKIPPED_SLOTS = frozenset({"_client", "_resolver", "__weakref__", "__dict__"})
+
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+_INT = b"i"
+_BIG_INT = b"I"
+_FLOAT = b"f"
+_STR = b"s"
+_STR_REF = b"r"
+_BYTES = b"b"
+_LIST = b"l"
+_INDEXED_LIST = b"x"
+_TUPLE = b"t"
+_DICT = b"d"
+_DATE = b"D"
+_DATETIME = b"A"
+_TIME = b"H"
+_TIMEDELTA = b"E"
+_CLASS = b"C"
+_OBJECT = b"o"
+_OBJECT_REF = b"R"
+_UNSET = b"u"
+
+_u32 = struct.Struct("<I")
+_i64 = struct.Struct("<q")
+_f64 = struct.Struct("<d")
+# year, month, day, hour, minute, second, microsecond
+_dt = struct.Struct("<HBBBBBI")
+_td = struct.Struct("<iiI")
+
+
+@lru_cache(maxsize=None)
+def _snapshot_slots(cls: Type[Object]) -> Tuple[str, ...]:
+    """Attribute names stored for ``cls``, sorted so that snapshots are stable"""
+    names = set()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in _SKIPPED_SLOTS:
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                # private names are mangled by the class defining the slot
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.add(name)
+    return tuple(sorted(names))
+
+
+def _find_class(qualname: str) -> Type[Object]:
+    cls: Any = dataClasses
+    for part in qualname.split("."):
+        cls = getattr(cls, part, None)
+    if not (isinstance(cls, type) and issubclass(cls, Object)):
+        raise SnapshotError(f"Unknown data class in snapshot: {qualname}")
+    return cls
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.out: List[bytes] = []
+        self.classes: Dict[type, int] = {}
+        self.objects: Dict[int, int] = {}
+        self.strings: Dict[str, int] = {}
+
+    def length(self, n: int) -> None:
+        self.out.append(_u32.pack(n))
+
+    def string(self, s: str) -> None:
+        index = self.strings.get(s)
+        if index is None:
+            self.strings[s] = len(self.strings)
+            encoded = s.encode()
+            self.out += (_STR, _u32.pack(len(encoded)), encoded)
+        else:
+            self.out += (_STR_REF, _u32.pack(index))
+
+    def value(self, v: Any) -> None:
+        out = self.out
+        # bool before int, datetime before date: they are subclasses
+        if v is None:
+            out.append(_NONE)
+        elif v is True:
+            out.append(_TRUE)
+        elif v is False:
+            out.append(_FALSE)
+        elif isinstance(v, str):
+            self.string(v)
+        elif isinstance(v, int):
+            if -(2**63) <= v < 2**63:
+                out += (_INT, _i64.pack(v))
+            else:
+                out.append(_BIG_INT)
+                self.string(str(v))
+        elif isinstance(v, float):
+            out += (_FLOAT, _f64.pack(v))
+        elif isinstance(v, Object):
+            self.object(v)
+        elif isinstance(v, list):
+            out.append(_INDEXED_LIST if isinstance(v, IndexedList) else _LIST)
+            self.length(len(v))
+            for item in v:
+                self.value(item)
+        elif isinstance(v, tuple):
+            out.append(_TUPLE)
+            self.length(len(v))
+            for item in v:
+                self.value(item)
+        elif isinstance(v, dict):
+            out.append(_DICT)
+            self.length(len(v))
+            for key, item in v.items():
+                self.value(key)
+                self.value(item)
+        elif isinstance(v, datetime.datetime):
+            if v.tzinfo is not None:
+                raise SnapshotError("Timezone aware datetimes are not supported")
+            out += (
+                _DATETIME,
+                _dt.pack(
+                    v.year, v.month, v.day, v.hour, v.minute, v.second, v.microsecond
+                ),
+            )
+        elif isinstance(v, datetime.date):
+            out += (_DATE, _dt.pack(v.year, v.month, v.day, 0, 0, 0, 0))
+        elif isinstance(v, datetime.time):
+            if v.tzinfo is not None:
+                raise SnapshotError("Timezone aware times are not supported")
+            out += (_TIME, _dt.pack(0, 0, 0, v.hour, v.minute, v.second, v.microsecond))
+        elif isinstance(v, datetime.timedelta):
+            out += (_TIMEDELTA, _td.pack(v.days, v.seconds, v.microseconds))
+        elif isinstance(v, (bytes, bytearray)):
+            out += (_BYTES, _u32.pack(len(v)), bytes(v))
+        else:
+            raise SnapshotError(f"Cannot snapshot a value of type {type(v).__name__}")
+
+    def object(self, obj: Object) -> None:
+        index = self.objects.get(id(obj))
+        if index is not None:
+            self.out += (_OBJECT_REF, _u32.pack(index))
+            return
+        self.objects[id(obj)] = len(self.objects)
+
+        cls = type(obj)
+        slots = _snapshot_slots(cls)
+        class_index = self.classes.get(cls)
+        if class_index is None:
+            class_index = self.classes[cls] = len(self.classes)
+            self.out += (
+                _CLASS,
+                _u32.pack(cls._snapshot_version),
+                _u32.pack(len(slots)),
+            )
+            self.string(cls.__qualname__)
+            for name in slots:
+                self.string(name)
+
+        self.out += (_OBJECT, _u32.pack(class_index))
+        for name in slots:
+            try:
+                # no getattr: that would decode the fields of lazy objects
+                v = object.__getattribute__(obj, name)
+            except AttributeError:
+                self.out.append(_UNSET)
+            else:
+                self.value(v)
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+        # (class, slots of the snapshot, whether each slot still exists)
+        self.classes: List[Tuple[Type[Object], Tuple[str, ...], Tuple[bool, ...]]] = []
+        self.objects: List[Object] = []
+        self.strings: List[str] = []
+
+    def unpack(self, s: struct.Struct) -> tuple:
+        values = s.unpack_from(self.data, self.offset)
+        self.offset += s.size
+        return values
+
+    def length(self) -> int:
+        return self.unpack(_u32)[0]
+
+    def take(self, n: int) -> bytes:
+        chunk = self.data[self.offset : self.offset + n]
+        if len(chunk) != n:
+            raise SnapshotError("Truncated snapshot")
+        self.offset += n
+        return chunk
+
+    def string(self) -> str:
+        v = self.value()
+        if not isinstance(v, str):
+            raise SnapshotError("Expected a string in snapshot")
+        return v
+
+    def value(self) -> Any:
+        tag = self.take(1)
+        reader = _READERS.get(tag)
+        if reader is None:
+            raise SnapshotError(f"Unknown tag {tag!r} in snapshot")
+        return reader(self)
+
+    def _class(self) -> Any:
+        version, n = self.unpack(_u32)[0], self.length()
+        qualname = self.string()
+        names = tuple(self.string() for _ in range(n))
+        cls = _find_class(qualname)
+        if version != cls._snapshot_version:
+            raise SnapshotError(
+                f"Snapshot of {qualname} has version {version}, "
+                f"expected {cls._snapshot_version}"
+            )
+        current = set(_snapshot_slots(cls))
+        self.classes.append((cls, names, tuple(name in current for name in names)))
+        return self.value()
+
+    def _object(self) -> Object:
+        index = self.length()
+        try:
+            cls, names, known = self.classes[index]
+        except IndexError:
+            raise SnapshotError("Object of an undeclared class in snapshot") from None
+        obj = cls.__new__(cls)
+        self.objects.append(obj)
+        for name, keep in zip(names, known):
+            if self.data[self.offset : self.offset + 1] == _UNSET:
+                self.offset += 1
+                continue
+            v = self.value()
+            # attributes removed from the class since the snapshot are dropped
+            if keep:
+                object.__setattr__(obj, name, v)
+        return obj
+
+    def _object_ref(self) -> Object:
+        try:
+            return self.objects[self.length()]
+        except IndexError:
+            raise SnapshotError("Dangling object reference in snapshot") from None
+
+    def _str(self) -> str:
+        s = self.take(self.length()).decode()
+        self.strings.append(s)
+        return s
+
+    def _str_ref(self) -> str:
+        try:
+            return self.strings[self.length()]
+        except IndexError:
+            raise SnapshotError("Dangling string reference in snapshot") from None
+
+    def _list(self) -> list:
+        return [self.value() for _ in range(self.length())]
+
+    def _indexed_list(self) -> IndexedList:
+        return IndexedList(self._list())
+
+    def _tuple(self) -> tuple:
+        return tuple(self._list())
+
+    def _dict(self) -> dict:
+        return {self.value(): self.value() for _ in range(self.length())}
+
+    def _datetime(self) -> datetime.datetime:
+        return datetime.datetime(*self.unpack(_dt))
+
+    def _date(self) -> datetime.date:
+        return datetime.date(*self.unpack(_dt)[:3])
+
+    def _time(self) -> datetime.time:
+        return datetime.time(*self.unpack(_dt)[3:])
+
+    def _timedelta(self) -> datetime.timedelta:
+        return datetime.timedelta(*self.unpack(_td))
+
+
+_READERS: Dict[bytes, Callable[[_Reader], Any]] = {
+    _NONE: lambda r: None,
+    _TRUE: lambda r: True,
+    _FALSE: lambda r: False,
+    _INT: lambda r: r.unpack(_i64)[0],
+    _BIG_INT: lambda r: int(r.string()),
+    _FLOAT: lambda r: r.unpack(_f64)[0],
+    _STR: _Reader._str,
+    _STR_REF: _Reader._str_ref,
+    _BYTES: lambda r: r.take(r.length()),
+    _LIST: _Reader._list,
+    _INDEXED_LIST: _Reader._indexed_list,
+    _TUPLE: _Reader._tuple,
+    _DICT: _Reader._dict,
+    _DATE: _Reader._date,
+    _DATETIME: _Reader._datetime,
+    _TIME: _Reader._time,
+    _TIMEDELTA: _Reader._timedelta,
+    _CLASS: _Reader._class,
+    _OBJECT: _Reader._object,
+    _OBJECT_REF: _Reader._object_ref,
+}
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes data objects into a snapshot.
+
+    Args:
+        value (Any): a data object, or lists, tuples and dicts of them and of primitive values
+    Returns:
+        bytes: the snapshot, it does not contain any client
+    Raises:
+        SnapshotError: if a value cannot be stored
+    """
+    writer = _Writer()
+    writer.value(value)
+    return b"".join([_MAGIC, bytes((_FORMAT_VERSION,))] + writer.out)
+
+
+def loads(data: bytes, client: Optional[ClientBase] = None) -> Any:
+    """
+    Rebuilds the data objects of a snapshot.
+
+    Args:
+        data (bytes): a snapshot made by :func:`dumps`
+        client (Optional[ClientBase]): client the objects are bound to, see :meth:`Object.rebind`.
+            Without one, the objects can be read but any method or property contacting
+            PRONOTE fails.
+    Returns:
+        Any: the value given to :func:`dumps`
+    Raises:
+        SnapshotError: if the snapshot is invalid or was made by an incompatible
+            version of a data class
+    """
+    if data[:3] != _MAGIC:
+        raise SnapshotError("Not a pronotepy snapshot")
+    if len(data) < 4 or data[3] != _FORMAT_VERSION:
+        raise SnapshotError("Unsupported snapshot format version")
+    reader = _Reader(data, 4)
+    try:
+        value = reader.value()
+    except struct.error as e:
+        raise SnapshotError("Truncated snapshot") from e
+    except (ValueError, TypeError, OverflowError, RecursionError) as e:
+        # bad utf-8, dates out of range, unhashable dict keys, nesting too deep...
+        raise SnapshotError(f"Corrupted snapshot: {e}") from e
+    if reader.offset != len(data):
+        raise SnapshotError("Trailing data after snapshot")
+    if client is not None:
+        for obj in reader.objects:
+            obj.rebind(client)
+    return value
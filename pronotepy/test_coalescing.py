@@ -0,0 +1,131 @@
+"""Offline tests of the coalescing of identical concurrent posts."""
+
+import threading
+import unittest
+from typing import Any, List, Type, cast
+from unittest.mock import MagicMock
+
+from pronotepy.clients import ClientBase, ParentClient
+from pronotepy.exceptions import ExpiredObject, PronoteAPIError
+
+
+class _Communication:
+    """Answers every post after ``release`` is set"""
+
+    def __init__(self, error: Any = None) -> None:
+        self.posts: List[tuple] = []
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.error = error
+
+    def post(self, function_name: str, post_data: dict) -> dict:
+        with self.lock:
+            self.posts.append((function_name, post_data))
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return {"function": function_name, "data": post_data}
+
+
+def _client(communication: _Communication, cls: Type[ClientBase] = ClientBase) -> Any:
+    client = cast(Any, cls.__new__(cls))
+    client.communication = communication
+    client._refreshing = False
+    client._refresh_lock = threading.RLock()
+    client.response_cache = None
+    client._in_flight = {}
+    client._in_flight_lock = threading.Lock()
+    return client
+
+
+class TestCoalescing(unittest.TestCase):
+    def concurrent(self, client: Any, *calls: tuple) -> List[Any]:
+        results: List[Any] = [None] * len(calls)
+
+        def run(i: int, call: tuple) -> None:
+            try:
+                results[i] = client.post(*call)
+            except Exception as e:
+                results[i] = e
+
+        threads = [
+            threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)
+        ]
+        for thread in threads:
+            thread.start()
+        # every call reaches the communication or waits for an identical one
+        threading.Event().wait(0.2)
+        client.communication.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        return results
+
+    def test_identical_reads_share_a_request(self) -> None:
+        client = _client(_Communication())
+        call = ("DernieresNotes", 198, {"Periode": {"N": "1#a", "L": "T1"}})
+        same = ("DernieresNotes", 198, {"Periode": {"L": "T1", "N": "1#a"}})
+        results = self.concurrent(client, call, same, call, same)
+        self.assertEqual(len(client.communication.posts), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(client._in_flight, {})
+
+        # done requests are not reused
+        client.post(*call)
+        self.assertEqual(len(client.communication.posts), 2)
+
+    def test_different_requests(self) -> None:
+        client = _client(_Communication())
+        self.concurrent(
+            client,
+            ("PageEmploiDuTemps", 16, {"NumeroSemaine": 1}),
+            ("PageEmploiDuTemps", 16, {"NumeroSemaine": 2}),
+            ("PageEmploiDuTemps", 7, {"NumeroSemaine": 1}),
+        )
+        self.assertEqual(len(client.communication.posts), 3)
+
+    def test_writes_are_not_coalesced(self) -> None:
+        client = _client(_Communication())
+        call = ("SaisieTAFFaitEleve", 88, {"listeTAF": [{"N": "1#a", "TAFFait": True}]})
+        self.concurrent(client, call, call)
+        self.assertEqual(len(client.communication.posts), 2)
+
+    def test_errors_are_shared(self) -> None:
+        client = _client(_Communication(ExpiredObject("expired")))
+        call = ("PagePresence", 19, {"periode": {"N": "1#a"}})
+        results = self.concurrent(client, call, call, call)
+        self.assertEqual(len(client.communication.posts), 1)
+        self.assertTrue(all(isinstance(r, ExpiredObject) for r in results))
+        self.assertEqual(client._in_flight, {})
+
+    def test_one_refresh_for_concurrent_failures(self) -> None:
+        client = _client(_Communication(PronoteAPIError("session expired")))
+        refreshed = _Communication()
+        refreshed.release.set()
+        refreshes: List[int] = []
+
+        def refresh() -> None:
+            refreshes.append(1)
+            client.communication = refreshed
+
+        client.refresh = refresh
+        call = ("SaisieTAFFaitEleve", 88, {"listeTAF": [{"N": "1#a", "TAFFait": True}]})
+        results = self.concurrent(client, call, call, call)
+        self.assertEqual(refreshes, [1])
+        self.assertEqual(len(refreshed.posts), 3)
+        self.assertTrue(all(isinstance(r, dict) for r in results))
+        self.assertFalse(client._refreshing)
+
+    def test_parent_signature(self) -> None:
+        communication = _Communication()
+        communication.release.set()
+        client = _client(communication, ParentClient)
+        client._selected_child = MagicMock(id="1#child")
+        client.post("DernieresNotes", 198, {"Periode": {"N": "1#a"}})
+        ((_, post_data),) = communication.posts
+        self.assertEqual(
+            post_data["Signature"], {"onglet": 198, "membre": {"N": "1#child", "G": 4}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Offline tests for pronotepy.downloads."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import Attachment
+from pronotepy.downloads import DownloadManager
+
+
+class _Response:
+    def __init__(self, content: bytes, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class _Session:
+    def __init__(self, files: Dict[str, bytes]) -> None:
+        self.files = files
+        self.requested: List[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, stream: bool = False) -> _Response:
+        with self._lock:
+            self.requested.append(url)
+        if url in self.files:
+            return _Response(self.files[url])
+        return _Response(b"", 404)
+
+
+class TestDownloadManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.session = _Session(
+            {"u1": b"a" * 5000, "u2": b"b" * 3000, "u3": b"a" * 5000}
+        )
+        self.client = MagicMock()
+        self.client.communication.root_site = "https://pronote"
+        self.client.communication.session = self.session
+
+    def attachment(self, n: str, url: str, type: int = 1) -> Attachment:
+        attachment = Attachment(self.client, {"N": n, "L": f"{n}.txt", "G": type})
+        attachment.url = url
+        return attachment
+
+    def test_download_and_cache(self) -> None:
+        manager = DownloadManager(self.dir.name, buffer_size=1024)
+        files = [
+            self.attachment("1", "u1"),
+            self.attachment("2", "u2"),
+            self.attachment("1", "u1"),
+            self.attachment("3", "u3"),
+            self.attachment("link", "https://example.com", type=0),
+        ]
+        paths = manager.download(files)
+        self.assertEqual(list(paths), files[:4])
+        self.assertEqual(sorted(self.session.requested), ["u1", "u2", "u3"])
+        self.assertEqual(paths[files[1]].read_bytes(), b"b" * 3000)
+        self.assertEqual(paths[files[0]], paths[files[2]])
+        # same content, stored once
+        self.assertEqual(paths[files[0]], paths[files[3]])
+
+        # a new manager finds the files in the cache
+        self.session.requested.clear()
+        again = DownloadManager(self.dir.name).download(files)
+        self.assertEqual(again, paths)
+        self.assertEqual(self.session.requested, [])
+
+    def test_save(self) -> None:
+        manager = DownloadManager(self.dir.name)
+        out = Path(self.dir.name) / "out"
+        saved = manager.save([self.attachment("2", "u2")], out)
+        self.assertEqual(saved, [out / "2.txt"])
+        self.assertEqual(saved[0].read_bytes(), b"b" * 3000)
+
+    def test_eviction(self) -> None:
+        manager = DownloadManager(self.dir.name, max_size=6000)
+        first = manager.download([self.attachment("1", "u1")]).popitem()[1]
+        second = manager.download([self.attachment("2", "u2")]).popitem()[1]
+        self.assertFalse(first.exists())
+        self.assertTrue(second.exists())
+        self.assertIsNone(manager.cached(self.attachment("1", "u1")))
+
+    def test_same_id_on_two_servers(self) -> None:
+        other = MagicMock()
+        other.communication.root_site = "https://other-pronote"
+        other.communication.session = _Session({"u1": b"other"})
+        theirs = Attachment(other, {"N": "1", "L": "1.txt", "G": 1})
+        theirs.url = "u1"
+        ours = self.attachment("1", "u1")
+
+        paths = DownloadManager(self.dir.name).download([ours, theirs])
+        self.assertEqual(paths[ours].read_bytes(), b"a" * 5000)
+        self.assertEqual(paths[theirs].read_bytes(), b"other")
+
+    def test_missing_file(self) -> None:
+        manager = DownloadManager(self.dir.name)
+        with self.assertRaises(FileNotFoundError):
+            manager.download([self.attachment("4", "missing")])
+        self.assertEqual(list((Path(self.dir.name) / "tmp").iterdir()), [])
+
+
+class TestAttachmentData(unittest.TestCase):
+    def test_data_is_downloaded_once(self) -> None:
+        client = MagicMock()
+        client.communication.session = _Session({"u": b"data"})
+        attachment = Attachment(client, {"N": "1", "L": "a.txt", "G": 1})
+        attachment.url = "u"
+        self.assertEqual(attachment.data, b"data")
+        self.assertEqual(attachment.data, b"data")
+        self.assertEqual(client.communication.session.requested, ["u"])
+
+    def test_error_is_not_cached(self) -> None:
+        client = MagicMock()
+        client.communication.session = _Session({})
+        attachment = Attachment(client, {"N": "1", "L": "a.txt", "G": 1})
+        attachment.url = "u"
+        with self.assertRaises(FileNotFoundError):
+            attachment.data
+        client.communication.session.files["u"] = b"data"
+        self.assertEqual(attachment.data, b"data")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Offline tests for pronotepy.frames."""
+
+import math
+import unittest
+import weakref
+from typing import List
+from unittest.mock import MagicMock
+
+from pronotepy.dataClasses import Grade, Period, _Interner
+
+try:
+    import numpy as np
+
+    from pronotepy.frames import GradeFrame
+except ImportError:
+    np = None  # type: ignore
+
+
+def _grade(
+    subject: str,
+    note: str,
+    bareme: str = "20",
+    coefficient: str = "1",
+    bonus: bool = False,
+    optional: bool = False,
+    out_of_20: bool = False,
+) -> dict:
+    return {
+        "N": f"{subject}{note}",
+        "note": {"V": note},
+        "bareme": {"V": bareme},
+        "date": {"V": "02/09/2024"},
+        "service": {"V": {"N": subject, "L": subject.upper()}},
+        "periode": {"V": {"N": "p"}},
+        "coefficient": coefficient,
+        "estBonus": bonus,
+        "estFacultatif": optional,
+        "estRamenerSur20": out_of_20,
+    }
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestGradeFrame(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client._period_registry = weakref.WeakValueDictionary()
+        self.client._interner = _Interner()
+        self.period = Period(
+            self.client,
+            {
+                "N": "p",
+                "L": "Trimestre 1",
+                "dateDebut": {"V": "02/09/2024"},
+                "dateFin": {"V": "30/11/2024"},
+            },
+        )
+
+    def frame(self, *grades: dict) -> "GradeFrame":
+        return GradeFrame([Grade(self.client, g) for g in grades])
+
+    def test_weighted_averages(self) -> None:
+        frame = self.frame(
+            _grade("maths", "10"),
+            _grade("maths", "16", coefficient="2"),
+            # not brought back to 20: counts as 8 points out of 10
+            _grade("maths", "8", bareme="10"),
+            _grade("french", "5", bareme="10", out_of_20=True),
+            _grade("french", "|1"),  # absent, not counted
+            _grade("french", "|6"),  # absent, counts as zero
+        )
+        averages = frame.subject_averages()
+        self.assertAlmostEqual(averages["maths"], (10 + 32 + 8) / 3.5 * 1)
+        self.assertAlmostEqual(averages["french"], 5.0)
+        self.assertAlmostEqual(
+            frame.overall_average(), (averages["maths"] + averages["french"]) / 2
+        )
+        self.assertAlmostEqual(
+            frame.overall_average({"maths": 3}),
+            (averages["maths"] * 3 + averages["french"]) / 4,
+        )
+
+    def test_bonus_and_optional(self) -> None:
+        frame = self.frame(
+            _grade("maths", "10"),
+            _grade("maths", "14", bonus=True),
+            _grade("maths", "8", bonus=True),
+            _grade("french", "10"),
+            _grade("french", "18", optional=True),
+            _grade("french", "14", optional=True),
+            _grade("french", "9", optional=True),
+            _grade("english", "12", optional=True),
+        )
+        averages = frame.subject_averages()
+        self.assertAlmostEqual(averages["maths"], 14.0)
+        self.assertAlmostEqual(averages["french"], 14.0)
+        self.assertAlmostEqual(averages["english"], 12.0)
+
+    def test_no_grades(self) -> None:
+        frame = self.frame(_grade("maths", "|2"), _grade("french", "15", bonus=True))
+        self.assertTrue(math.isnan(frame.subject_averages()["maths"]))
+        self.assertTrue(math.isnan(frame.overall_average()))
+
+    def test_what_if(self) -> None:
+        grades = [
+            _grade("maths", "10"),
+            _grade("maths", "13", optional=True),
+            _grade("french", "15"),
+        ]
+        frame = self.frame(*grades)
+        values = [0.0, 12.0, 20.0]
+        for subject in ("maths", "physics"):
+            subject_averages, overall = frame.what_if(subject, values, coefficient=2)
+            for v, s, o in zip(values, subject_averages, overall):
+                expected = self.frame(
+                    *grades, _grade(subject, str(v).replace(".", ","), coefficient="2")
+                )
+                self.assertAlmostEqual(s, expected.subject_averages()[subject])
+                self.assertAlmostEqual(o, expected.overall_average())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,10 +6,11 @@ These tests verify that Grade objects can be constructed without crashing
 when those fields are absent.
 """
 
+import math
 import unittest
 from unittest.mock import MagicMock
 
-from pronotepy.dataClasses import Grade, Period
+from pronotepy.dataClasses import Grade, Period, _Interner
 
 
 def _make_grade_json(
@@ -55,22 +56,21 @@ def _make_grade_json(
 class TestGradeMissingFields(unittest.TestCase):
     """Test that Grade parsing handles missing optional fields gracefully."""
 
+    client: MagicMock
+
     @classmethod
     def setUpClass(cls) -> None:
-        # Create a mock Period instance so the period resolver can find it
+        # Create a mock client with a Period so the period resolver can find it
         mock_period = MagicMock(spec=Period)
         mock_period.id = "test_period_id"
-        Period.instances.add(mock_period)
-
-    @classmethod
-    def tearDownClass(cls) -> None:
-        # Clean up mock period instances
-        Period.instances = {p for p in Period.instances if not isinstance(p, MagicMock)}
+        cls.client = MagicMock()
+        cls.client._period_registry = {"test_period_id": mock_period}
+        cls.client._interner = _Interner()
 
     def test_all_fields_present(self) -> None:
         """Parsing works when all fields are present."""
         json_dict = _make_grade_json()
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertEqual(grade.grade, "15")
         self.assertEqual(grade.max, "19")
         self.assertEqual(grade.min, "5")
@@ -83,7 +83,7 @@ class TestGradeMissingFields(unittest.TestCase):
     def test_missing_noteMax(self) -> None:
         """Parsing does not crash when noteMax is missing."""
         json_dict = _make_grade_json(include_noteMax=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertIsNone(grade.max)
         # Other fields should still be parsed correctly
         self.assertEqual(grade.grade, "15")
@@ -92,43 +92,43 @@ class TestGradeMissingFields(unittest.TestCase):
     def test_missing_noteMin(self) -> None:
         """Parsing does not crash when noteMin is missing."""
         json_dict = _make_grade_json(include_noteMin=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertIsNone(grade.min)
 
     def test_missing_coefficient(self) -> None:
         """Parsing does not crash when coefficient is missing."""
         json_dict = _make_grade_json(include_coefficient=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertIsNone(grade.coefficient)
 
     def test_missing_commentaire(self) -> None:
         """Parsing does not crash when commentaire is missing."""
         json_dict = _make_grade_json(include_commentaire=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertIsNone(grade.comment)
 
     def test_missing_estBonus(self) -> None:
         """Parsing does not crash when estBonus is missing."""
         json_dict = _make_grade_json(include_estBonus=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertFalse(grade.is_bonus)
 
     def test_missing_estFacultatif(self) -> None:
         """Parsing does not crash when estFacultatif is missing."""
         json_dict = _make_grade_json(include_estFacultatif=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertFalse(grade.is_optionnal)
 
     def test_missing_estRamenerSur20(self) -> None:
         """Parsing does not crash when estRamenerSur20 is missing."""
         json_dict = _make_grade_json(include_estRamenerSur20=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertFalse(grade.is_out_of_20)
 
     def test_missing_moyenne(self) -> None:
         """Parsing does not crash when moyenne is missing."""
         json_dict = _make_grade_json(include_moyenne=False)
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertIsNone(grade.average)
 
     def test_all_optional_fields_missing(self) -> None:
@@ -147,7 +147,7 @@ class TestGradeMissingFields(unittest.TestCase):
             include_estRamenerSur20=False,
             include_moyenne=False,
         )
-        grade = Grade(json_dict)
+        grade = Grade(self.client, json_dict)
         self.assertEqual(grade.grade, "15")
         self.assertEqual(grade.out_of, "20")
         self.assertIsNone(grade.max)
@@ -158,6 +158,81 @@ class TestGradeMissingFields(unittest.TestCase):
         self.assertFalse(grade.is_optionnal)
         self.assertFalse(grade.is_out_of_20)
         self.assertIsNone(grade.average)
+        self.assertEqual(grade.grade_value, 15.0)
+        self.assertTrue(math.isnan(grade.average_value))
+        self.assertEqual(grade.coefficient_value, 1.0)
+
+
+class TestGradeNumericValues(unittest.TestCase):
+    """Test the numeric companions of the grade strings."""
+
+    def setUp(self) -> None:
+        mock_period = MagicMock(spec=Period)
+        mock_period.id = "test_period_id"
+        self.client = MagicMock()
+        self.client._period_registry = {"test_period_id": mock_period}
+        self.client._interner = _Interner()
+
+    def test_values(self) -> None:
+        json_dict = _make_grade_json()
+        json_dict["note"] = {"V": "12,5"}
+        json_dict["coefficient"] = "0,5"
+        grade = Grade(self.client, json_dict)
+        self.assertEqual(grade.grade, "12,5")
+        self.assertEqual(grade.grade_value, 12.5)
+        self.assertEqual(grade.out_of_value, 20.0)
+        self.assertEqual(grade.max_value, 19.0)
+        self.assertEqual(grade.min_value, 5.0)
+        self.assertEqual(grade.average_value, 12.0)
+        self.assertEqual(grade.coefficient_value, 0.5)
+        self.assertNotIn("grade_value", grade.to_dict())
+
+    def test_special_grades(self) -> None:
+        json_dict = _make_grade_json()
+        json_dict["note"] = {"V": "|1"}
+        grade = Grade(self.client, json_dict)
+        self.assertEqual(grade.grade, "Absent")
+        self.assertTrue(math.isnan(grade.grade_value))
+
+        json_dict["note"] = {"V": "|6"}
+        grade = Grade(self.client, json_dict)
+        self.assertEqual(grade.grade, "AbsentZero")
+        self.assertEqual(grade.grade_value, 0.0)
+
+
+class TestPeriodRegistry(unittest.TestCase):
+    """Test the per-client registry used to resolve Grade.period."""
+
+    def test_grade_resolves_period_of_its_client(self) -> None:
+        import weakref
+
+        client = MagicMock()
+        client._period_registry = weakref.WeakValueDictionary()
+        client._interner = _Interner()
+        period = Period(
+            client,
+            {
+                "N": "test_period_id",
+                "L": "Trimestre 1",
+                "dateDebut": {"V": "01/09/2025"},
+                "dateFin": {"V": "30/11/2025"},
+            },
+        )
+        grade = Grade(client, _make_grade_json())
+        self.assertIs(grade.period, period)
+
+        # the registry does not keep periods alive
+        del grade, period
+        self.assertNotIn("test_period_id", client._period_registry)
+
+    def test_unknown_period(self) -> None:
+        from pronotepy import ParsingError
+
+        client = MagicMock()
+        client._period_registry = {}
+        client._interner = _Interner()
+        with self.assertRaises(ParsingError):
+            Grade(client, _make_grade_json())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+"""Offline tests of the hibernation of clients."""
+
+import datetime
+import json
+import os
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from typing import Any, List, Type
+from unittest.mock import patch
+
+from pronotepy.clients import Client, ClientBase, ParentClient, VieScolaireClient
+from pronotepy.hibernation import HibernationStore, hibernate, wake
+from pronotepy.pool import ClientPool
+from pronotepy.pronoteAPI import _Communication
+from pronotepy.test_pool import FakeClient, accounts
+
+URL = "https://demo.index-education.net/pronote/eleve.html"
+
+FUNC_OPTIONS = {
+    "dataSec": {
+        "data": {
+            "identifiantNav": "nav",
+            "General": {
+                "PremierLundi": {"V": "02/09/2024"},
+                "DerniereDate": {"V": "04/07/2025"},
+                "versionPN": "2024.3.7",
+                "ListeHeures": {"V": [{"G": 0, "L": "08h00"}, {"G": 1, "L": "09h00"}]},
+                "ListeHeuresFin": {
+                    "V": [{"G": 0, "L": "09h00"}, {"G": 1, "L": "10h00"}]
+                },
+                "ListePeriodes": [],
+            },
+        }
+    }
+}
+
+
+def _logged_in(cls: Type[ClientBase], resource: dict, compact: bool = False) -> Any:
+    """A client in the state of a successful login, without any request"""
+    client: Any = cls.__new__(cls)
+    client.compact = compact
+    client.ent = None
+    client.ent_cache = None
+    client.uuid = ""
+    client.login_mode = "normal"
+    client.username = "user"
+    client.password = "password"
+    client.pronote_url = URL
+    client.account_pin = None
+    client.client_identifier = None
+    client.device_name = None
+
+    client.communication = _Communication(URL, None)
+    client.communication.attributes = client.attributes = {"a": "3", "h": "1234"}
+    client.communication.request_number = 9
+    client.communication.encryption.aes_key = bytes(range(16))
+    client.communication.session.cookies.set(
+        "JSESSIONID", "abc", domain="demo.index-education.net"
+    )
+    client.func_options = json.loads(json.dumps(FUNC_OPTIONS))
+    client._read_func_options()
+    client._init_state()
+    client.encryption.aes_key = bytes(range(16, 32))
+    client._read_parametres(
+        {
+            "dataSec": {
+                "data": {
+                    "ressource": resource,
+                    "listeOnglets": [],
+                    "listeClasses": {
+                        "V": [{"N": "3#c", "L": "3A", "estResponsable": False}]
+                    },
+                }
+            }
+        }
+    )
+    client.communication.authorized_onglets = [7, 88]
+    client.logged_in = True
+    client.last_connection = datetime.datetime(2024, 9, 2, 8, 30)
+    client._expired = False
+    client._init_account()
+    return client
+
+
+class TestHibernation(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        client = _logged_in(Client, {"N": "1#a", "L": "STUDENT Name"})
+        state = json.loads(json.dumps(hibernate(client)))
+        self.assertNotIn("password", state)
+
+        woken: Any = wake(Client, state, password="password")
+        self.assertEqual(woken.password, "password")
+        self.assertEqual(woken.info.name, "STUDENT Name")
+        self.assertEqual(woken.last_connection, client.last_connection)
+        self.assertEqual(woken.encryption.aes_key, client.encryption.aes_key)
+        self.assertEqual(woken.start_day, client.start_day)
+        self.assertEqual(woken.week, client.week)
+        self.assertEqual(woken._last_day, datetime.date(2025, 7, 4))
+        self.assertEqual(woken._pronote_version, "2024.3.7")
+        self.assertEqual(woken._end_times[1], datetime.time(10))
+        self.assertEqual(woken.func_options, client.func_options)
+        communication = woken.communication
+        self.assertEqual(communication.request_number, 9)
+        self.assertEqual(communication.authorized_onglets, [7, 88])
+        self.assertEqual(communication.attributes["h"], "1234")
+        self.assertEqual(
+            communication.encryption.aes_key, client.communication.encryption.aes_key
+        )
+        self.assertEqual(
+            communication.encryption.aes_iv_temp,
+            client.communication.encryption.aes_iv_temp,
+        )
+        self.assertEqual(communication.session.cookies["JSESSIONID"], "abc")
+        self.assertEqual(communication.cookies, None)
+
+    def test_parent_child(self) -> None:
+        children = [{"N": "1#a", "L": "FIRST"}, {"N": "1#b", "L": "SECOND"}]
+        client = _logged_in(
+            ParentClient,
+            {"N": "2#p", "L": "PARENT", "listeRessources": children},
+        )
+        client.set_child("SECOND")
+        woken: Any = wake(ParentClient, hibernate(client), password="password")
+        self.assertEqual(woken.info.name, "PARENT")
+        self.assertEqual([c.name for c in woken.children], ["FIRST", "SECOND"])
+        self.assertEqual(woken._selected_child.name, "SECOND")
+        self.assertEqual(
+            woken.parametres_utilisateur["dataSec"]["data"]["ressource"]["N"], "1#b"
+        )
+
+    def test_compact(self) -> None:
+        client = _logged_in(VieScolaireClient, {"N": "1#a", "L": "CPE"}, compact=True)
+        self.assertEqual(client.func_options, {})
+        self.assertEqual(client.parametres_utilisateur, {})
+        self.assertEqual(client.start_day, datetime.date(2024, 9, 2))
+        self.assertEqual(client._start_times[0], datetime.time(8))
+
+        state = hibernate(client)
+        self.assertEqual(state["func_options"], {})
+        woken: Any = wake(VieScolaireClient, json.loads(json.dumps(state)))
+        self.assertTrue(woken.compact)
+        self.assertEqual(woken.func_options, {})
+        self.assertEqual([c.name for c in woken.classes], ["3A"])
+        self.assertEqual(woken._start_times[0], datetime.time(8))
+
+    def test_token_mode_keeps_the_new_token(self) -> None:
+        client = _logged_in(Client, {"N": "1#a", "L": "STUDENT"})
+        client.login_mode = "token"
+        client.password = "new token"
+        woken = wake(Client, hibernate(client), password="used token")
+        self.assertEqual(woken.password, "new token")
+
+    def test_wrong_class(self) -> None:
+        state = hibernate(_logged_in(Client, {"N": "1#a", "L": "STUDENT"}))
+        with self.assertRaises(ValueError):
+            wake(ParentClient, state)
+        with self.assertRaises(ValueError):
+            wake(Client, {**state, "version": 0})
+
+    def test_store(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            store = HibernationStore(directory)
+            store.save(URL, "user", {"state": 1})
+            (path,) = os.listdir(directory)
+            self.assertEqual(
+                os.stat(os.path.join(directory, path)).st_mode & 0o777, 0o600
+            )
+            self.assertEqual(store.pop(URL, "user"), {"state": 1})
+            self.assertIsNone(store.pop(URL, "user"))
+            self.assertEqual(os.listdir(directory), [])
+
+
+class TestPoolHibernation(unittest.TestCase):
+    def setUp(self) -> None:
+        FakeClient.logins = Counter()
+        self.woken: List[str] = []
+
+        def fake_hibernate(client: Any) -> dict:
+            return {"username": client.username, "host": client.host}
+
+        def fake_wake(cls: Any, state: dict, **account: Any) -> Any:
+            self.woken.append(state["username"])
+            client: Any = FakeClient.__new__(FakeClient)
+            FakeClient.__init__(client, state["host"], state["username"], "password")
+            return client
+
+        patcher = patch.multiple(
+            "pronotepy.hibernation", hibernate=fake_hibernate, wake=fake_wake
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool: Any = ClientPool(FakeClient, max_workers=4, max_live=3)
+        self.addCleanup(self.pool.close)
+
+    def test_max_live(self) -> None:
+        work = accounts(6)
+        list(self.pool.map(FakeClient.work, work))
+        self.assertLessEqual(len(self.pool._clients), 3)
+        self.assertEqual(len(os.listdir(self.pool._store.directory)), 3)
+        self.assertEqual(self.woken, [])
+
+        # the hibernated clients are woken up, not logged in again
+        results = dict(
+            (a["username"], r) for a, r in self.pool.map(FakeClient.work, work)
+        )
+        self.assertEqual(results, {a["username"]: a["username"] for a in work})
+        self.assertGreaterEqual(len(self.woken), 3)
+        # FakeClient counts the wakes as logins
+        self.assertEqual(sum(FakeClient.logins.values()) - len(self.woken), 6)
+        self.assertLessEqual(len(self.pool._clients), 3)
+
+    def test_busy_clients_are_not_hibernated(self) -> None:
+        release = threading.Event()
+        started = threading.Barrier(5)
+
+        def wait(client: Any) -> str:
+            started.wait(timeout=5)
+            release.wait(timeout=5)
+            return str(client.username)
+
+        results = self.pool.map(wait, accounts(4, hosts=4))
+        thread = threading.Thread(target=lambda: list(results))
+        thread.start()
+        started.wait(timeout=5)
+        # every client is busy, the pool is over max_live until they are done
+        self.assertEqual(len(self.pool._clients), 4)
+        release.set()
+        thread.join(timeout=5)
+
+    def test_temporary_directory(self) -> None:
+        directory = self.pool._store.directory
+        list(self.pool.map(FakeClient.work, accounts(5)))
+        self.pool.close()
+        self.assertFalse(directory.exists())
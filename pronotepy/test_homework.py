@@ -0,0 +1,45 @@
+"""Offline tests of the status changes of homework."""
+
+import unittest
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+from pronotepy.clients import Client
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.posts: List[tuple] = []
+
+    set_homework_done: Any = Client.set_homework_done
+
+    def post(self, function_name: str, onglet: int, data: Optional[dict] = None) -> Any:
+        self.posts.append((function_name, onglet, data))
+        return {}
+
+
+class TestSetHomeworkDone(unittest.TestCase):
+    def test_one_request(self) -> None:
+        client = _Client()
+        homeworks = [SimpleNamespace(id=f"1#{i}", done=False) for i in range(5)]
+        client.set_homework_done(iter(homeworks), True)
+        self.assertEqual(
+            client.posts,
+            [
+                (
+                    "SaisieTAFFaitEleve",
+                    88,
+                    {"listeTAF": [{"N": f"1#{i}", "TAFFait": True} for i in range(5)]},
+                )
+            ],
+        )
+        self.assertTrue(all(hw.done for hw in homeworks))
+
+    def test_nothing_to_change(self) -> None:
+        client = _Client()
+        client.set_homework_done([], False)
+        self.assertEqual(client.posts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+"""Offline tests for the message cache of discussions."""
+
+import datetime
+import unittest
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+from pronotepy.clients import Client
+from pronotepy.dataClasses import Discussion
+
+
+def _message(n: str, possession: str, source: str, date: str) -> dict:
+    return {
+        "N": n,
+        "possessionMessage": {"V": {"N": possession}},
+        "messageSource": {"V": {"N": source}},
+        "emetteur": False,
+        "public_gauche": "M. TEACHER",
+        "lu": True,
+        "date": {"V": date},
+        "estHTML": False,
+        "contenu": f"content of {n}",
+    }
+
+
+class _Client:
+    """Answers ListeMessages with the messages of the requested possessions"""
+
+    def __init__(self, messages: List[dict]) -> None:
+        self.messages = messages
+        self.posts: List[tuple] = []
+        self._message_cache: dict = {}
+        self._interner = MagicMock()
+
+    fetch_messages: Any = Client.fetch_messages
+
+    def post(self, function_name: str, onglet: int, data: Optional[dict] = None) -> Any:
+        self.posts.append((function_name, data))
+        if function_name != "ListeMessages":
+            return {}
+        assert data is not None
+        possessions = {p["N"] for p in data["listePossessionsMessages"]}
+        return {
+            "dataSec": {
+                "data": {
+                    "listeMessages": {
+                        "V": [
+                            m
+                            for m in self.messages
+                            if m["possessionMessage"]["V"]["N"] in possessions
+                        ]
+                    },
+                    "messagePourReponse": {"V": {"N": "reply"}},
+                    "listeBoutons": {"V": [{"N": "button"}]},
+                }
+            }
+        }
+
+
+def _discussion(
+    client: Any, n: str, possessions: List[str], unread: int = 0, date: bool = True
+) -> Discussion:
+    json_dict = {
+        "N": n,
+        "objet": f"subject {n}",
+        "listePossessionsMessages": {"V": [{"N": p} for p in possessions]},
+        "messagePourParticipants": {"V": {"N": f"participants {n}"}},
+        "nbNonLus": unread,
+    }
+    if date:
+        json_dict["date"] = {"V": "03/09/2024 10:00:00"}
+    return Discussion(client, json_dict, {})
+
+
+class TestMessageCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = _Client(
+            [
+                _message("m2", "p1", "m1", "02/09/2024 09:00:00"),
+                _message("m1", "p1", "none", "02/09/2024 08:00:00"),
+                _message("m3", "p2", "none", "02/09/2024 10:00:00"),
+            ]
+        )
+
+    def list_messages_posts(self) -> int:
+        return sum(1 for name, _ in self.client.posts if name == "ListeMessages")
+
+    def test_messages_are_cached(self) -> None:
+        discussion = _discussion(self.client, "d1", ["p1"])
+        messages = discussion.messages
+        self.assertEqual([m.id for m in messages], ["m1", "m2"])
+        self.assertIs(messages[1].replying_to, messages[0])
+        self.assertEqual([m.id for m in discussion.messages], ["m1", "m2"])
+        self.assertEqual(self.list_messages_posts(), 1)
+
+        # the same discussion listed again, unchanged
+        self.assertEqual(len(_discussion(self.client, "d1", ["p1"]).messages), 2)
+        self.assertEqual(self.list_messages_posts(), 1)
+
+        # with new messages
+        _discussion(self.client, "d1", ["p1"], unread=1).messages
+        _discussion(self.client, "d1", ["p1", "p3"], unread=1).messages
+        self.assertEqual(self.list_messages_posts(), 3)
+
+    def test_date_from_listing(self) -> None:
+        discussion = _discussion(self.client, "d1", ["p1"])
+        self.assertEqual(discussion.date, datetime.datetime(2024, 9, 3, 10))
+        self.assertEqual(self.client.posts, [])
+
+        discussion = _discussion(self.client, "d2", ["p1"], date=False)
+        self.assertEqual(discussion.date, datetime.datetime(2024, 9, 2, 8))
+
+    def test_modifications_invalidate(self) -> None:
+        discussion = _discussion(self.client, "d1", ["p1"])
+        discussion.messages
+        discussion.reply("hello")
+        # the reply used the cached ListeMessages response
+        self.assertEqual(self.list_messages_posts(), 1)
+        self.assertEqual(self.client.posts[-1][1]["messagePourReponse"], {"N": "reply"})
+
+        discussion.messages
+        discussion.mark_as(True)
+        discussion.messages
+        self.assertEqual(self.list_messages_posts(), 3)
+
+        discussion.messages[0].reply("hello")
+        discussion.messages
+        self.assertEqual(self.list_messages_posts(), 5)
+
+
+class TestFetchMessages(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = _Client(
+            [
+                _message("m1", "p1", "none", "02/09/2024 08:00:00"),
+                _message("m2", "p2", "none", "02/09/2024 09:00:00"),
+                _message("m3", "p3", "m2", "02/09/2024 10:00:00"),
+                _message("m4", "p4", "none", "02/09/2024 11:00:00"),
+            ]
+        )
+        self.discussions = [
+            _discussion(self.client, "d1", ["p1"]),
+            _discussion(self.client, "d2", ["p2", "p3"]),
+            _discussion(self.client, "d3", ["p4"]),
+            _discussion(self.client, "d4", ["p5"]),
+        ]
+
+    def test_one_request(self) -> None:
+        messages = self.client.fetch_messages(self.discussions)
+        self.assertEqual(
+            [[m.id for m in ms] for ms in messages], [["m1"], ["m2", "m3"], ["m4"], []]
+        )
+        self.assertIs(messages[1][1].replying_to, messages[1][0])
+        self.assertEqual(len(self.client.posts), 1)
+        self.assertEqual(
+            [p["N"] for p in self.client.posts[0][1]["listePossessionsMessages"]],
+            ["p1", "p2", "p3", "p4", "p5"],
+        )
+
+        # cached for the discussions
+        self.assertEqual([m.id for m in self.discussions[1].messages], ["m2", "m3"])
+        self.assertEqual(len(self.client.posts), 1)
+
+    def test_cached_and_chunks(self) -> None:
+        self.discussions[0].messages
+        self.client.fetch_messages(self.discussions + self.discussions, chunk_size=2)
+        self.assertEqual(
+            [
+                [p["N"] for p in data["listePossessionsMessages"]]
+                for _, data in self.client.posts
+            ],
+            [["p1"], ["p2", "p3", "p4"], ["p5"]],
+        )
+
+    def test_reply_after_fetch(self) -> None:
+        self.client.fetch_messages(self.discussions)
+        self.discussions[0].reply("hello")
+        # the grouped response cannot be used to reply
+        self.assertEqual(
+            [name for name, _ in self.client.posts],
+            ["ListeMessages", "ListeMessages", "SaisieMessage"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import threading
+import time
+import unittest
+from collections import Counter
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import requests
+
+from pronotepy.pool import ClientPool
+
+
+class FakeClient:
+    logins: Counter = Counter()
+    active: Counter = Counter()
+    max_active: Counter = Counter()
+    lock = threading.Lock()
+
+    def __init__(self, pronote_url: str, username: str, password: str) -> None:
+        if password == "wrong":
+            raise ValueError("bad password")
+        self.host = pronote_url
+        self.username = username
+        with self.lock:
+            self.logins[username] += 1
+        self.communication = MagicMock()
+        self.communication.session = requests.Session()
+        self.communication.last_ping = time.time()
+
+    def work(self) -> str:
+        with self.lock:
+            self.active[self.host] += 1
+            self.max_active[self.host] = max(
+                self.max_active[self.host], self.active[self.host]
+            )
+        time.sleep(0.01)
+        with self.lock:
+            self.active[self.host] -= 1
+        return self.username
+
+
+def accounts(n: int, hosts: int = 2) -> List[Dict[str, Any]]:
+    return [
+        {
+            "pronote_url": f"https://host{i % hosts}.example.com/pronote/eleve.html",
+            "username": f"user{i}",
+            "password": "password",
+        }
+        for i in range(n)
+    ]
+
+
+class TestClientPool(unittest.TestCase):
+    def setUp(self) -> None:
+        FakeClient.logins = Counter()
+        FakeClient.max_active = Counter()
+        self.pool: Any = ClientPool(FakeClient, max_workers=8, max_per_host=3)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def test_map(self) -> None:
+        results = list(self.pool.map(FakeClient.work, accounts(20)))
+        self.assertEqual(
+            sorted(r for _, r in results), sorted(f"user{i}" for i in range(20))
+        )
+        for account, result in results:
+            self.assertEqual(account["username"], result)
+        self.assertEqual(set(FakeClient.max_active.values()), {3})
+
+        # the clients are kept
+        list(self.pool.map(FakeClient.work, accounts(20)))
+        self.assertEqual(set(FakeClient.logins.values()), {1})
+        client = self.pool.client(accounts(1)[0])
+        self.assertIs(
+            client.communication.session.adapters["https://"], self.pool._adapter
+        )
+
+    def test_max_per_host_across_maps(self) -> None:
+        threads = [
+            threading.Thread(
+                target=lambda: list(self.pool.map(FakeClient.work, accounts(12)))
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertLessEqual(max(FakeClient.max_active.values()), 3)
+
+    def test_closing_a_session_keeps_the_adapter(self) -> None:
+        client = self.pool.client(accounts(1)[0])
+        manager = self.pool._adapter.poolmanager
+        manager.connection_from_url("https://host0.example.com")
+        # as a refresh of the client does
+        client.communication.session.close()
+        self.assertEqual(len(manager.pools), 1)
+        self.pool.close()
+        self.assertEqual(len(manager.pools), 0)
+
+    def test_streaming(self) -> None:
+        release = threading.Event()
+
+        def work(client: FakeClient) -> str:
+            if client.username == "user0":
+                release.wait()
+            return client.username
+
+        results = self.pool.map(work, accounts(4))
+        first = [next(results)[1] for _ in range(3)]
+        self.assertNotIn("user0", first)
+        release.set()
+        self.assertEqual(next(results)[1], "user0")
+
+    def test_exceptions(self) -> None:
+        bad = accounts(3)
+        bad[1]["password"] = "wrong"
+        results = dict(
+            (a["username"], r)
+            for a, r in self.pool.map(FakeClient.work, bad, return_exceptions=True)
+        )
+        self.assertIsInstance(results["user1"], ValueError)
+        self.assertEqual(results["user2"], "user2")
+
+        with self.assertRaises(ValueError):
+            list(self.pool.map(FakeClient.work, bad))
+
+    def test_keep_alive(self) -> None:
+        pool: Any = ClientPool(FakeClient, keep_alive=True)
+        try:
+            client = pool.client(accounts(1)[0])
+            client.post = MagicMock()
+            client.communication.last_ping = 0
+            deadline = time.monotonic() + 5
+            while not client.post.called and time.monotonic() < deadline:
+                time.sleep(0.05)
+            client.post.assert_called_with(
+                "Navigation", 7, {"onglet": 7, "ongletPrec": 7}
+            )
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
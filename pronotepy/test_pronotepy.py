@@ -1,5 +1,6 @@
 import datetime
 import unittest
+from typing import List
 
 import pronotepy
 from pronotepy import DiscussionClosed
@@ -120,19 +121,19 @@ class TestPeriod(unittest.TestCase):
                 self.assertIsNotNone(acquisition)
 
     def test_absences(self) -> None:
-        all_absences = []
+        all_absences: List[pronotepy.Absence] = []
         for period in client.periods:
             all_absences.extend(period.absences)
         warn_empty(all_absences)
 
     def test_delays(self) -> None:
-        all_delays = []
+        all_delays: List[pronotepy.Delay] = []
         for period in client.periods:
             all_delays.extend(period.delays)
         warn_empty(all_delays)
 
     def test_punishments(self) -> None:
-        all_punishments = []
+        all_punishments: List[pronotepy.Punishment] = []
         for period in client.periods:
             all_punishments.extend(period.punishments)
 
@@ -0,0 +1,136 @@
+"""Offline tests of the cache of the responses of read requests."""
+
+import threading
+import unittest
+from typing import Any, List, cast
+
+from pronotepy.clients import ClientBase
+from pronotepy.response_cache import ResponseCache
+
+ACCOUNT = ("https://demo.index-education.net/pronote/eleve.html", "user")
+OTHER = ("https://demo.index-education.net/pronote/eleve.html", "other")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Communication:
+    def __init__(self) -> None:
+        self.posts: List[str] = []
+
+    def post(self, function_name: str, post_data: dict) -> dict:
+        self.posts.append(function_name)
+        return {"function": function_name, "number": len(self.posts)}
+
+
+def _client(cache: ResponseCache, username: str = "user") -> Any:
+    client = cast(Any, ClientBase.__new__(ClientBase))
+    client.pronote_url = ACCOUNT[0]
+    client.username = username
+    client.communication = _Communication()
+    client.response_cache = cache
+    client._refreshing = False
+    client._in_flight = {}
+    client._in_flight_lock = threading.Lock()
+    return client
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.cache = ResponseCache(
+            {"PageMenus": 0, "PageEmploiDuTemps": 100}, max_entries=3, clock=self.clock
+        )
+
+    def test_ttl(self) -> None:
+        self.cache.set(ACCOUNT, "PageEmploiDuTemps", "week 1", {"week": 1})
+        self.clock.now = 99
+        self.assertEqual(
+            self.cache.get(ACCOUNT, "PageEmploiDuTemps", "week 1"), {"week": 1}
+        )
+        self.assertIsNone(self.cache.get(OTHER, "PageEmploiDuTemps", "week 1"))
+        self.clock.now = 100
+        self.assertIsNone(self.cache.get(ACCOUNT, "PageEmploiDuTemps", "week 1"))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_not_cached(self) -> None:
+        self.cache.set(ACCOUNT, "PageMenus", "", {})
+        self.cache.set(ACCOUNT, "SaisieMessage", "", {})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru(self) -> None:
+        for week in range(3):
+            self.cache.set(ACCOUNT, "PageEmploiDuTemps", f"week {week}", {})
+        self.cache.get(ACCOUNT, "PageEmploiDuTemps", "week 0")
+        self.cache.set(ACCOUNT, "PageEmploiDuTemps", "week 3", {})
+        self.assertIsNone(self.cache.get(ACCOUNT, "PageEmploiDuTemps", "week 1"))
+        self.assertIsNotNone(self.cache.get(ACCOUNT, "PageEmploiDuTemps", "week 0"))
+        self.assertEqual(len(self.cache), 3)
+
+    def test_written(self) -> None:
+        self.cache.set(ACCOUNT, "PageCahierDeTexte", "", {})
+        self.cache.set(ACCOUNT, "DernieresNotes", "", {})
+        self.cache.set(OTHER, "PageCahierDeTexte", "", {})
+        self.cache.written(ACCOUNT, "SaisieTAFFaitEleve")
+        self.assertIsNone(self.cache.get(ACCOUNT, "PageCahierDeTexte", ""))
+        self.assertIsNotNone(self.cache.get(ACCOUNT, "DernieresNotes", ""))
+        self.assertIsNotNone(self.cache.get(OTHER, "PageCahierDeTexte", ""))
+
+        self.cache.invalidate(ACCOUNT)
+        self.assertIsNone(self.cache.get(ACCOUNT, "DernieresNotes", ""))
+        self.assertIsNotNone(self.cache.get(OTHER, "PageCahierDeTexte", ""))
+
+
+class TestClientCache(unittest.TestCase):
+    def test_post(self) -> None:
+        cache = ResponseCache()
+        client = _client(cache)
+        data = {"domaine": {"_T": 8, "V": "[1..2]"}}
+        first = client.post("PageCahierDeTexte", 88, data)
+        first["number"] = 99
+        cached = client.post("PageCahierDeTexte", 88, data)
+        self.assertEqual(cached, {"function": "PageCahierDeTexte", "number": 1})
+        # every caller gets its own copy
+        cached["number"] = 98
+        self.assertEqual(client.post("PageCahierDeTexte", 88, data)["number"], 1)
+        self.assertEqual(client.communication.posts, ["PageCahierDeTexte"])
+
+        # another request or another account
+        client.post("PageCahierDeTexte", 88, {"domaine": {"_T": 8, "V": "[2..3]"}})
+        _client(cache, "other").post("PageCahierDeTexte", 88, data)
+        self.assertEqual(len(client.communication.posts), 2)
+
+        # marking homework as done changes the homework
+        client.post("SaisieTAFFaitEleve", 88, {"listeTAF": []})
+        self.assertEqual(client.post("PageCahierDeTexte", 88, data)["number"], 4)
+        self.assertEqual(
+            client.communication.posts,
+            ["PageCahierDeTexte"] * 2 + ["SaisieTAFFaitEleve", "PageCahierDeTexte"],
+        )
+
+    def test_reply_drops_the_thread(self) -> None:
+        client = _client(ResponseCache({"ListeMessages": 60}))
+        data = {"listePossessionsMessages": [{"N": "1#a"}]}
+        client.post("ListeMessages", 131, data)
+        client.post("ListeMessages", 131, data)
+        self.assertEqual(client.communication.posts, ["ListeMessages"])
+
+        # as Discussion.reply does
+        client.post("SaisieMessage", 131, {"contenu": "reply"})
+        self.assertEqual(client.post("ListeMessages", 131, data)["number"], 3)
+
+    def test_uncached_reads(self) -> None:
+        client = _client(ResponseCache())
+        client.post("PageBulletins", 13, {})
+        client.post("PageBulletins", 13, {})
+        self.assertEqual(len(client.communication.posts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import threading
+import time
+import unittest
+from typing import Callable, List
+
+from pronotepy.ent import ac_reunion, ac_rennes
+from pronotepy.scheduler import LoginScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+class TestLoginScheduler(unittest.TestCase):
+    def start_logins(
+        self, scheduler: LoginScheduler, n: int, release: threading.Event
+    ) -> List[threading.Thread]:
+        self.order: List[int] = []
+
+        def login(i: int) -> None:
+            with scheduler.slot("pronote:host"):
+                self.order.append(i)
+                release.wait()
+
+        threads = []
+        for i in range(n):
+            thread = threading.Thread(target=login, args=(i,))
+            thread.start()
+            threads.append(thread)
+            # queued in order
+            wait_until(
+                lambda: scheduler.stats().get("pronote:host", {}).get("logins", 0)
+                + scheduler.stats()["pronote:host"]["waiting"]
+                == i + 1
+            )
+        return threads
+
+    def test_concurrency(self) -> None:
+        scheduler = LoginScheduler(max_concurrent=2, per_minute=100)
+        release = threading.Event()
+        threads = self.start_logins(scheduler, 5, release)
+
+        stats = scheduler.stats()["pronote:host"]
+        self.assertEqual((stats["active"], stats["waiting"]), (2, 3))
+        release.set()
+        for thread in threads:
+            thread.join()
+        stats = scheduler.stats()["pronote:host"]
+        self.assertEqual(
+            (stats["active"], stats["waiting"], stats["logins"]), (0, 0, 5)
+        )
+        self.assertEqual(self.order, [0, 1, 2, 3, 4])
+        self.assertGreater(stats["max_wait"], 0)
+
+    def test_rate(self) -> None:
+        clock = FakeClock()
+        scheduler = LoginScheduler(max_concurrent=10, per_minute=2, clock=clock)
+        release = threading.Event()
+        release.set()
+        threads = self.start_logins(scheduler, 3, release)
+        self.assertEqual(scheduler.stats()["pronote:host"]["waiting"], 1)
+
+        clock.now += 30
+        scheduler.configure()  # wakes the waiting logins
+        time.sleep(0.05)
+        self.assertEqual(scheduler.stats()["pronote:host"]["waiting"], 1)
+
+        clock.now += 31
+        scheduler.configure()
+        for thread in threads:
+            thread.join()
+        stats = scheduler.stats()["pronote:host"]
+        self.assertEqual((stats["logins"], stats["max_wait"]), (3, 61))
+
+    def test_configure_and_suspend(self) -> None:
+        clock = FakeClock()
+        scheduler = LoginScheduler(max_concurrent=1, clock=clock)
+        scheduler.configure("pronote:host", max_concurrent=2)
+        scheduler.configure(max_concurrent=3, per_minute=5)
+        self.assertEqual(scheduler._state("pronote:host").max_concurrent, 2)
+        self.assertEqual(scheduler._state("pronote:host").per_minute, 5)
+        self.assertEqual(scheduler._state("other").max_concurrent, 3)
+
+        scheduler.suspend("pronote:host", 60)
+        errors: List[Exception] = []
+
+        def login() -> None:
+            try:
+                with scheduler.slot("pronote:host", timeout=10):
+                    pass
+            except TimeoutError as e:
+                errors.append(e)
+
+        # the timeout is measured with the clock of the scheduler
+        thread = threading.Thread(target=login)
+        thread.start()
+        wait_until(lambda: scheduler.stats()["pronote:host"]["waiting"] == 1)
+        clock.now += 11
+        scheduler.configure()
+        thread.join(timeout=5)
+        self.assertEqual(len(errors), 1)
+
+        clock.now += 60
+        with scheduler.slot("pronote:host", timeout=0.01):
+            pass
+        self.assertEqual(scheduler.stats()["pronote:host"]["waiting"], 0)
+
+    def test_invalid_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            LoginScheduler(per_minute=0)
+        scheduler = LoginScheduler()
+        with self.assertRaises(ValueError):
+            scheduler.configure(max_concurrent=0)
+        with self.assertRaises(ValueError):
+            scheduler.configure("pronote:host", per_minute=-1)
+        self.assertEqual(scheduler.per_minute, 30)
+
+    def test_keys(self) -> None:
+        self.assertEqual(
+            LoginScheduler.pronote_key(
+                "https://0000000a.index-education.net/pronote/eleve.html"
+            ),
+            "pronote:0000000a.index-education.net",
+        )
+        self.assertEqual(LoginScheduler.ent_key(ac_reunion), "ent:sso.ac-reunion.fr")
+        self.assertEqual(LoginScheduler.ent_key(ac_rennes), "ent:ac_rennes")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import threading
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import requests
+
+from pronotepy import snapshot
+from pronotepy.dataClasses import Subject
+from pronotepy.sharding import ShardedRunner, _shard
+
+
+class FakeClient:
+    logins = 0
+
+    def __init__(self, pronote_url: str, username: str, password: str) -> None:
+        if password == "wrong":
+            raise ValueError("bad password")
+        FakeClient.logins += 1
+        self.username = username
+        self.communication = MagicMock()
+        self.communication.session = requests.Session()
+
+
+def work(client: FakeClient) -> Dict[str, Any]:
+    return {
+        "pid": os.getpid(),
+        "logins": FakeClient.logins,
+        "subject": Subject({"N": "1", "L": client.username, "estServiceGroupe": False}),
+    }
+
+
+def accounts(n: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "pronote_url": f"https://host{i % 3}.example.com/pronote/eleve.html",
+            "username": f"user{i}",
+            "password": "password",
+        }
+        for i in range(n)
+    ]
+
+
+class TestShardedRunner(unittest.TestCase):
+    def test_shard(self) -> None:
+        account = accounts(1)[0]
+        self.assertEqual(_shard(account, 4), _shard(dict(account), 4))
+        shards = {_shard(a, 4) for a in accounts(50)}
+        self.assertEqual(shards, {0, 1, 2, 3})
+
+    def test_map(self) -> None:
+        with ShardedRunner(FakeClient, processes=2) as runner:  # type: ignore[arg-type]
+            first = {a["username"]: r for a, r in runner.map(work, accounts(10))}
+            self.assertEqual(len(first), 10)
+            self.assertEqual(first["user3"]["subject"].name, "user3")
+            pids = {r["pid"] for r in first.values()}
+            self.assertEqual(len(pids), 2)
+            self.assertNotIn(os.getpid(), pids)
+
+            # same process, already logged in
+            second = {a["username"]: r for a, r in runner.map(work, accounts(10))}
+            for username, result in second.items():
+                self.assertEqual(result["pid"], first[username]["pid"])
+            self.assertEqual(
+                sum(
+                    max(r["logins"] for r in second.values() if r["pid"] == pid)
+                    for pid in pids
+                ),
+                10,
+            )
+
+    def test_same_account_twice(self) -> None:
+        account = accounts(1)[0]
+        with ShardedRunner(FakeClient, processes=2) as runner:  # type: ignore[arg-type]
+            results = list(runner.map(work, [account, account]))
+            self.assertEqual(len(results), 2)
+            self.assertTrue(all(a == account for a, _ in results))
+
+    def test_concurrent_maps(self) -> None:
+        results: Dict[int, Dict[str, Any]] = {}
+
+        def run(i: int) -> None:
+            work_accounts = accounts(6)[i::2]
+            results[i] = {a["username"]: r for a, r in runner.map(work, work_accounts)}
+
+        with ShardedRunner(FakeClient, processes=2) as runner:  # type: ignore[arg-type]
+            threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+        self.assertEqual(sorted(results[0]), ["user0", "user2", "user4"])
+        self.assertEqual(sorted(results[1]), ["user1", "user3", "user5"])
+        self.assertEqual(results[1]["user3"]["subject"].name, "user3")
+
+    def test_exceptions(self) -> None:
+        bad = accounts(4)
+        bad[2]["password"] = "wrong"
+        with ShardedRunner(FakeClient, processes=2) as runner:  # type: ignore[arg-type]
+            results = {
+                a["username"]: r
+                for a, r in runner.map(work, bad, return_exceptions=True)
+            }
+            self.assertIsInstance(results["user2"], ValueError)
+            self.assertEqual(results["user1"]["subject"].name, "user1")
+
+            with self.assertRaises(ValueError):
+                list(runner.map(work, bad))
+            # the runner is still usable
+            for _, data in runner.map(work, accounts(4), raw=True):
+                self.assertIsInstance(snapshot.loads(data)["subject"], Subject)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Offline tests for pronotepy.snapshot."""
+
+import datetime
+import pickle
+import random
+import unittest
+import weakref
+from unittest.mock import MagicMock
+
+from pronotepy import SnapshotError, snapshot
+from pronotepy.dataClasses import (
+    Grade,
+    IndexedList,
+    Lesson,
+    Period,
+    _Interner,
+    _TimeGrid,
+)
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client._period_registry = weakref.WeakValueDictionary()
+    client._interner = _Interner()
+    client._end_times = _TimeGrid(
+        [{"G": i, "L": f"{8 + i // 2:02}h{30 * (i % 2):02}"} for i in range(20)]
+    )
+    return client
+
+
+def _lesson_json(i: int) -> dict:
+    return {
+        "N": f"lesson_{i}",
+        "place": 0,
+        "duree": 2,
+        "DateDuCours": {"V": f"0{i + 1}/09/2024 08:00:00"},
+        "ListeContenus": {
+            "V": [{"G": 16, "N": "s", "L": "MATHS"}, {"G": 3, "L": "M. TEACHER"}]
+        },
+    }
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = _client()
+        self.period = Period(
+            self.client,
+            {
+                "N": "p",
+                "L": "Trimestre 1",
+                "dateDebut": {"V": "02/09/2024"},
+                "dateFin": {"V": "30/11/2024"},
+            },
+        )
+        self.grade = Grade(
+            self.client,
+            {
+                "N": "g",
+                "note": {"V": "15,5"},
+                "bareme": {"V": "20"},
+                "baremeParDefaut": {"V": "20"},
+                "date": {"V": "02/09/2024"},
+                "service": {"V": {"N": "s", "L": "MATHS"}},
+                "periode": {"V": {"N": "p"}},
+                "moyenne": {"V": "12"},
+                "noteMax": {"V": "19"},
+                "noteMin": {"V": "4"},
+                "coefficient": "1",
+                "commentaire": "",
+            },
+        )
+        self.lessons = IndexedList(
+            Lesson(self.client, _lesson_json(i)) for i in range(3)
+        )
+
+    def test_round_trip(self) -> None:
+        lessons = snapshot.loads(snapshot.dumps(self.lessons))
+        self.assertIsInstance(lessons, IndexedList)
+        self.assertEqual(
+            [l.to_dict() for l in lessons], [l.to_dict() for l in self.lessons]
+        )
+        # shared objects stay shared
+        self.assertIs(lessons[0].subject, lessons[1].subject)
+
+        values = {"when": datetime.timedelta(hours=1), "raw": (b"\x00", 2**70, 1.5)}
+        self.assertEqual(snapshot.loads(snapshot.dumps(values)), values)
+
+    def test_no_client_and_rebind(self) -> None:
+        data = snapshot.dumps([self.grade, self.period])
+        self.assertNotIn(b"MagicMock", data)
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(self.grade)
+
+        other = _client()
+        grade, period = snapshot.loads(data, other)
+        self.assertIs(grade._client, other)
+        self.assertIs(grade.period, period)
+        self.assertIs(other._period_registry["p"], period)
+        self.assertEqual(grade.to_dict(), self.grade.to_dict())
+
+        unbound = snapshot.loads(data)[0]
+        with self.assertRaises(AttributeError):
+            unbound._client
+
+    def test_lazy_objects_stay_lazy(self) -> None:
+        lazy = Lesson(self.client, _lesson_json(0), lazy=True)
+        loaded = snapshot.loads(snapshot.dumps(lazy), self.client)
+        self.assertEqual(loaded.to_dict(), self.lessons[0].to_dict())
+
+    def test_invalid(self) -> None:
+        data = snapshot.dumps(self.lessons)
+        for bad in (b"", b"nope", data[:-3], data + b"N"):
+            with self.assertRaises(SnapshotError):
+                snapshot.loads(bad)
+        with self.assertRaises(SnapshotError):
+            snapshot.dumps(object())
+
+    def test_corrupted(self) -> None:
+        data = snapshot.dumps(
+            [self.lessons, self.grade, {"when": datetime.date.today()}]
+        )
+        rng = random.Random(0)
+        for _ in range(2000):
+            corrupted = bytearray(data)
+            for _ in range(rng.randint(1, 4)):
+                corrupted[rng.randrange(4, len(data))] = rng.randrange(256)
+            corrupted = corrupted[: rng.randint(4, len(data))]
+            try:
+                snapshot.loads(bytes(corrupted))
+            except SnapshotError:
+                pass
+
+    def test_version_mismatch(self) -> None:
+        data = snapshot.dumps(self.lessons)
+        Lesson._snapshot_version += 1
+        try:
+            with self.assertRaises(SnapshotError):
+                snapshot.loads(data)
+        finally:
+            Lesson._snapshot_version -= 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,378 @@
+"""Offline tests for the helpers in pronotepy.dataClasses.
+
+These do not need a connection to the demo server.
+"""
+
+import datetime
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from pronotepy import LazyParsingError, ParsingError, snapshot
+from Crypto.Util import Padding
+
+from pronotepy.dataClasses import (
+    Absence,
+    Attachment,
+    Field,
+    IndexedList,
+    Lesson,
+    Object,
+    Subject,
+    Util,
+    _Interner,
+    _TimeGrid,
+)
+from pronotepy.pronoteAPI import _Encryption
+
+
+class _Item:
+    def __init__(self, id: str, subject: Subject, date: datetime.date) -> None:
+        self.id = id
+        self.subject = subject
+        self.date = date
+
+
+class TestIndexedList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.maths = Subject({"N": "1", "L": "MATHS"})
+        self.french = Subject({"N": "2", "L": "FRENCH"})
+        self.day = datetime.date(2024, 9, 2)
+        self.items = IndexedList(
+            [
+                _Item("a", self.maths, self.day),
+                _Item("b", self.french, self.day),
+                _Item("c", self.maths, self.day + datetime.timedelta(days=1)),
+            ]
+        )
+
+    def test_is_a_list(self) -> None:
+        self.assertIsInstance(self.items, list)
+        self.assertEqual([i.id for i in self.items], ["a", "b", "c"])
+        self.assertEqual([i.id for i in self.items[1:]], ["b", "c"])
+
+    def test_get(self) -> None:
+        item = self.items.get("b")
+        self.assertIsNotNone(item)
+        assert item is not None
+        self.assertEqual(item.subject.name, "FRENCH")
+        self.assertIsNone(self.items.get("z"))
+
+    def test_secondary_indexes(self) -> None:
+        self.assertEqual([i.id for i in self.items.by_subject(self.maths)], ["a", "c"])
+        self.assertEqual([i.id for i in self.items.by_subject("2")], ["b"])
+        self.assertEqual([i.id for i in self.items.by_date(self.day)], ["a", "b"])
+
+    def test_filter_matches_util_get(self) -> None:
+        plain = list(self.items)
+        self.assertEqual(
+            self.items.filter(subject=self.maths, date=self.day),
+            Util.get(plain, subject=self.maths, date=self.day),
+        )
+        self.assertEqual(Util.get(self.items, id="c"), Util.get(plain, id="c"))
+        self.assertEqual(self.items.filter(missing=1), [])
+
+    def test_mutation_invalidates_indexes(self) -> None:
+        self.assertIsNone(self.items.get("d"))
+        self.items.append(_Item("d", self.french, self.day))
+        self.assertIsNotNone(self.items.get("d"))
+        del self.items[0]
+        self.assertIsNone(self.items.get("a"))
+        self.assertEqual([i.id for i in self.items.by_subject(self.maths)], ["c"])
+
+
+class TestDateParsing(unittest.TestCase):
+    def test_fixed_layouts(self) -> None:
+        self.assertEqual(
+            Util.datetime_parse("02/09/2024 08:30:00"),
+            datetime.datetime(2024, 9, 2, 8, 30),
+        )
+        self.assertEqual(
+            Util.datetime_parse("02/09/2024"), datetime.datetime(2024, 9, 2)
+        )
+        self.assertEqual(
+            Util.date_parse("02/09/2024 08:30:00"), datetime.date(2024, 9, 2)
+        )
+        self.assertEqual(Util.date_parse("02/09/2024"), datetime.date(2024, 9, 2))
+
+    def test_other_layouts(self) -> None:
+        self.assertEqual(Util.date_parse("02/09/24"), datetime.date(2024, 9, 2))
+        self.assertEqual(
+            Util.datetime_parse("02/09/24 08h30"),
+            datetime.datetime(2024, 9, 2, 8, 30),
+        )
+        self.assertEqual(
+            Util.date_parse("02/09"), datetime.date(datetime.date.today().year, 9, 2)
+        )
+
+    def test_invalid(self) -> None:
+        from pronotepy import DateParsingError
+
+        for bad in ("", "2024-09-02", "02/09/2024 8:30:00", "ab/cd/efgh"):
+            with self.assertRaises(DateParsingError):
+                Util.datetime_parse(bad)
+        with self.assertRaises(ValueError):
+            Util.datetime_parse("31/02/2024")
+
+    def test_many(self) -> None:
+        column = ["02/09/2024 08:30:00", "03/09/2024 10:00:00"] * 3
+        self.assertEqual(
+            Util.datetime_parse_many(column), [Util.datetime_parse(d) for d in column]
+        )
+        self.assertEqual(
+            Util.date_parse_many(column), [Util.date_parse(d) for d in column]
+        )
+
+
+class TestTimeGrid(unittest.TestCase):
+    def test_matches_place2time(self) -> None:
+        liste_heures = [
+            {"G": i, "L": f"{8 + i // 2:02}h{30 * (i % 2):02}"} for i in range(20)
+        ]
+        grid = _TimeGrid(liste_heures)
+        for place in range(-2, 60):
+            try:
+                expected = Util.place2time(liste_heures, place)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    grid[place]
+            else:
+                self.assertEqual(grid[place], expected)
+
+
+class _Decoded(Object):
+    _fields = (
+        Field("id", str, "N"),
+        Field("deep", int, "a", "V", "b", default=-1),
+        Field("loose", str, "missing", strict=False),
+        Field("whole", len),
+    )
+
+    def __init__(self, json_dict: dict) -> None:
+        self._decode(json_dict)
+
+
+class TestFieldDecoder(unittest.TestCase):
+    def test_same_as_resolver(self) -> None:
+        json_dict = {"N": 1, "a": {"V": {"b": "3"}}}
+        decoded = _Decoded(json_dict)
+        resolver = Object._Resolver(json_dict)
+        self.assertEqual(decoded.id, resolver(str, "N"))
+        self.assertEqual(decoded.deep, resolver(int, "a", "V", "b", default=-1))
+        self.assertEqual(decoded.loose, resolver(str, "missing", strict=False))
+        self.assertEqual(decoded.whole, 2)
+
+        self.assertEqual(_Decoded({"N": "x"}).deep, -1)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ParsingError) as cm:
+            _Decoded({})
+        self.assertEqual(cm.exception.path, ("N",))
+        with self.assertRaises(ParsingError) as cm:
+            _Decoded({"N": "x", "a": {"V": {"b": "not a number"}}})
+        self.assertEqual(cm.exception.path, ("a", "V", "b"))
+
+    def test_mutable_defaults(self) -> None:
+        dates = {"dateDebut": {"V": "02/09/2024"}, "dateFin": {"V": "02/09/2024"}}
+        first = Absence({"N": "1", **dates})
+        second = Absence({"N": "2", **dates})
+        self.assertEqual(first.reasons, [])
+        self.assertIsNot(first.reasons, second.reasons)
+        first.reasons.append("Malade")
+        self.assertEqual(second.reasons, [])
+
+    def test_slots(self) -> None:
+        self.assertLessEqual({"id", "deep", "loose", "whole"}, set(_Decoded.__slots__))
+        self.assertFalse(hasattr(_Decoded({"N": "x"}), "__dict__"))
+
+
+class TestLesson(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client._interner = _Interner()
+        self.client._end_times = _TimeGrid(
+            [{"G": i, "L": f"{8 + i // 2:02}h{30 * (i % 2):02}"} for i in range(20)]
+        )
+        self.json_dict = {
+            "N": "lesson_id",
+            "P": 1,
+            "place": 2,
+            "duree": 2,
+            "DateDuCours": {"V": "02/09/2024 09:00:00"},
+            "ListeContenus": {
+                "V": [
+                    {"G": 16, "N": "s", "L": "MATHS"},
+                    {"G": 3, "L": "M. TEACHER"},
+                    {"G": 17, "L": "101"},
+                ]
+            },
+        }
+
+    def test_lesson(self) -> None:
+        lesson = Lesson(self.client, self.json_dict)
+        self.assertEqual(lesson.start, datetime.datetime(2024, 9, 2, 9))
+        self.assertEqual(lesson.end, datetime.datetime(2024, 9, 2, 9, 30))
+        self.assertIsNotNone(lesson.subject)
+        assert lesson.subject is not None
+        self.assertEqual(lesson.subject.name, "MATHS")
+        self.assertEqual(lesson.teacher_name, "M. TEACHER")
+        self.assertEqual(lesson.classroom, "101")
+        self.assertIsNone(lesson.group_name)
+        self.assertFalse(lesson.canceled)
+
+    def test_interning(self) -> None:
+        first = Lesson(self.client, self.json_dict)
+        second = Lesson(self.client, json.loads(json.dumps(self.json_dict)))
+        self.assertIs(first.subject, second.subject)
+        self.assertIs(first.teacher_name, second.teacher_name)
+        self.assertIs(first.classrooms[0], second.classrooms[0])  # type: ignore[index]
+
+        self.client._interner.clear()
+        self.assertIsNot(Lesson(self.client, self.json_dict).subject, first.subject)
+
+    def test_lazy_lesson(self) -> None:
+        lesson = Lesson(self.client, self.json_dict, lazy=True)
+        self.assertEqual(lesson.start, datetime.datetime(2024, 9, 2, 9))
+        self.assertEqual(lesson.end, datetime.datetime(2024, 9, 2, 9, 30))
+        self.assertEqual(lesson.teacher_names, ["M. TEACHER"])
+        self.assertEqual(
+            lesson.to_dict(), Lesson(self.client, self.json_dict).to_dict()
+        )
+        with self.assertRaises(AttributeError):
+            lesson.missing  # type: ignore[attr-defined]
+
+    def test_lazy_json_is_dropped(self) -> None:
+        lesson = Lesson(self.client, self.json_dict, lazy=True)
+        for name in Lesson._lazy_decoders:
+            getattr(lesson, name)
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(lesson, "_json")
+
+    def test_lazy_errors_on_access(self) -> None:
+        lesson = Lesson(self.client, {"N": "lesson_id"}, lazy=True)
+        self.assertEqual(lesson.id, "lesson_id")
+        with self.assertRaises(ParsingError):
+            lesson.start
+        with self.assertRaises(LazyParsingError):
+            lesson.subject
+        # errors of computed attributes too
+        with self.assertRaises(LazyParsingError):
+            lesson.end
+        self.assertFalse(hasattr(lesson, "start"))
+        self.assertIsNone(getattr(lesson, "start", None))
+        lessons = IndexedList([lesson, Lesson(self.client, self.json_dict)])
+        start = datetime.datetime(2024, 9, 2, 9)
+        self.assertEqual(lessons.filter(start=start), lessons[1:])
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client._interner = _Interner()
+        self.client._end_times = _TimeGrid(
+            [{"G": i, "L": f"{8 + i // 2:02}h{30 * (i % 2):02}"} for i in range(20)]
+        )
+        self.lesson = Lesson(
+            self.client,
+            {
+                "N": "lesson_id",
+                "place": 0,
+                "duree": 2,
+                "DateDuCours": {"V": "02/09/2024 08:00:00"},
+                "ListeContenus": {"V": [{"G": 16, "N": "s", "L": "MATHS"}]},
+            },
+        )
+
+    def test_to_dict(self) -> None:
+        serialized = self.lesson.to_dict()
+        self.assertEqual(
+            serialized["subject"], {"id": "s", "name": "MATHS", "groups": False}
+        )
+        self.assertEqual(serialized["teacher_names"], [])
+        self.assertNotIn("_client", serialized)
+        self.assertNotIn("subject", self.lesson.to_dict(exclude={"subject"}))
+        self.assertIn("normal", self.lesson.to_dict(include_properties=True))
+
+    def test_bulk(self) -> None:
+        subject = self.lesson.subject
+        assert subject is not None
+        objects = [self.lesson, subject, self.lesson]
+        self.assertEqual(
+            Object.to_dicts(objects, exclude={"id"}),
+            [o.to_dict(exclude={"id"}) for o in objects],
+        )
+
+    def test_json(self) -> None:
+        decoded = json.loads(Object.to_json([self.lesson]))
+        self.assertEqual(decoded[0]["start"], "2024-09-02T08:00:00")
+        self.assertEqual(decoded[0]["subject"]["name"], "MATHS")
+        self.assertEqual(json.loads(Object.to_json(self.lesson))["id"], "lesson_id")
+
+
+class TestAttachment(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.communication.root_site = "https://demo.index-education.net/pronote"
+        self.client.communication.encryption = _Encryption()
+        self.client.attributes = {"h": "123"}
+
+    def test_url_is_lazy(self) -> None:
+        encryption = MagicMock(wraps=self.client.communication.encryption)
+        self.client.communication.encryption = encryption
+        attachment = Attachment(self.client, {"N": "1#a", "L": "a b.pdf", "G": 1})
+        encryption.aes_encrypt.assert_not_called()
+
+        padd = Padding.pad(b'{"N":"1#a","Actif":true}', 16)
+        self.assertEqual(
+            attachment.url,
+            "https://demo.index-education.net/pronote/FichiersExternes/"
+            f"{_Encryption().aes_encrypt(padd).hex()}/a%20b.pdf?Session=123",
+        )
+        self.assertEqual(encryption.aes_encrypt.call_count, 1)
+
+    def test_rebind(self) -> None:
+        other = MagicMock()
+        other.communication.root_site = self.client.communication.root_site
+        other.communication.encryption = _Encryption()
+        other.attributes = {"h": "456"}
+
+        read = Attachment(self.client, {"N": "1#a", "L": "a.pdf", "G": 1})
+        self.assertTrue(read.url.endswith("?Session=123"))
+        unread = Attachment(self.client, {"N": "2#a", "L": "b.pdf", "G": 1})
+        for attachment in (read, unread):
+            attachment.rebind(other)
+            self.assertTrue(attachment.url.endswith("?Session=456"))
+
+        read = Attachment(self.client, {"N": "1#a", "L": "a.pdf", "G": 1})
+        read.url
+        loaded = snapshot.loads(snapshot.dumps(read), other)
+        self.assertTrue(loaded.url.endswith("?Session=456"))
+        self.assertTrue(
+            snapshot.loads(snapshot.dumps(loaded), self.client).url.endswith(
+                "?Session=123"
+            )
+        )
+
+    def test_links(self) -> None:
+        link = Attachment(self.client, {"N": "2", "L": "site", "G": 0, "url": "u"})
+        self.assertEqual(link.url, "u")
+        self.assertEqual(Attachment(self.client, {"N": "3", "L": "l", "G": 0}).url, "l")
+
+    def test_generate_urls(self) -> None:
+        attachments = [
+            Attachment(self.client, {"N": f"{i}#a", "L": f"{i}.pdf", "G": i % 2})
+            for i in range(6)
+        ]
+        one_by_one = [
+            a.url
+            for a in [
+                Attachment(self.client, {"N": f"{i}#a", "L": f"{i}.pdf", "G": i % 2})
+                for i in range(6)
+            ]
+        ]
+        attachments[1].url
+        self.assertEqual(Attachment.generate_urls(attachments), one_by_one)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,7 @@ setuptools.setup(
         "requests>=2.22.0",
         "autoslot>=2022.12.1",
     ],
+    extras_require={"numpy": ["numpy>=1.20"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",